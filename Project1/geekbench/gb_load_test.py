@@ -0,0 +1,233 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+from contextlib import aclosing
+
+try:
+    from http_client.http_requester import AsyncGeekBenchBrowserAPI
+    from http_client.http_rate_limiter import TokenBucketRateLimiter, AIMDRateController
+    from http_client.http_retry import RetryPolicy
+    from http_client.http_metrics import get_global_metrics
+    from http_client.http_mock_server import MockGeekBenchServer
+    from gb_main import new_geekbench_data, new_geekbench_data_concurrently, merge_geekbench_data, enqueue_geekbench_jobs, run_geekbench_worker, merge_geekbench_jobs
+
+except ImportError:
+    from .http_client.http_requester import AsyncGeekBenchBrowserAPI
+    from .http_client.http_rate_limiter import TokenBucketRateLimiter, AIMDRateController
+    from .http_client.http_retry import RetryPolicy
+    from .http_client.http_metrics import get_global_metrics
+    from .http_client.http_mock_server import MockGeekBenchServer
+    from .gb_main import new_geekbench_data, new_geekbench_data_concurrently, merge_geekbench_data, enqueue_geekbench_jobs, run_geekbench_worker, merge_geekbench_jobs
+
+
+# 요청 지연 시간 분위수 계산용 구간(초) (기본 구간보다 촘촘하게)
+LOAD_TEST_LATENCY_BUCKETS = (
+    0.001, 0.002, 0.003, 0.005, 0.0075, 0.01, 0.015, 0.02, 0.03, 0.05, 0.075,
+    0.1, 0.15, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 30.0,
+)
+
+# 실행할 수 있는 수집 모드
+LOAD_TEST_MODES = ("search_client", "concurrent_search_client", "new", "new_concurrently", "merge", "workers")
+
+
+async def _run_search_client(api_requester: AsyncGeekBenchBrowserAPI, search_type: str, query_data: list, last_page: int, concurrency: int) -> None:
+    # 요청 단계만 실행 (저장 없이 파싱된 페이지를 소비)
+    for query in query_data:
+        if concurrency > 1:
+            search_client = api_requester.concurrent_search_client(search_type=search_type, query=query, last_page=last_page, concurrency=concurrency)
+        else:
+            search_client = api_requester.search_client(search_type=search_type, query=query, last_page=last_page, min_delay=0, max_delay=0)
+
+        async with aclosing(search_client):
+            async for _ in search_client:
+                pass
+
+
+async def _run_mode(
+    mode: str,
+    api_requester: AsyncGeekBenchBrowserAPI,
+    server: MockGeekBenchServer,
+    search_type: str,
+    query_data: list,
+    last_page: int,
+    concurrency: int,
+    requests_per_second: float,
+    burst: int,
+    num_workers: int
+    ) -> None:
+
+    if mode == "search_client":
+        await _run_search_client(api_requester=api_requester, search_type=search_type, query_data=query_data, last_page=last_page, concurrency=1)
+
+    elif mode == "concurrent_search_client":
+        await _run_search_client(api_requester=api_requester, search_type=search_type, query_data=query_data, last_page=last_page, concurrency=concurrency)
+
+    elif mode == "new":
+        await new_geekbench_data(search_type=search_type, query_data=query_data, last_page=last_page, default_pages=last_page, min_delay=0, max_delay=0, concurrency=concurrency, api_requester=api_requester)
+
+    elif mode == "new_concurrently":
+        await new_geekbench_data_concurrently(search_type=search_type, query_data=[[query] for query in query_data], last_page=last_page, default_pages=last_page, min_delay=0, max_delay=0, concurrency=concurrency, api_requester=api_requester)
+
+    elif mode == "merge":
+        # 기존 JSON 파일이 있으면 추가된 페이지만 수집 (없으면 전체 수집 후 병합)
+        await merge_geekbench_data(search_type=search_type, query_data=query_data, default_pages=last_page, min_delay=0, max_delay=0, concurrency=concurrency, api_requester=api_requester)
+
+    elif mode == "workers":
+        # 코디네이터/작업자 모드 (작업자는 같은 프로세스의 작업으로 실행, 큐 파일의 토큰 버킷을 공유)
+        await enqueue_geekbench_jobs(search_type=search_type, query_data=query_data, default_pages=last_page, pages_per_job=max(1, last_page // (num_workers * 2)), api_requester=api_requester)
+        await asyncio.gather(*[
+            run_geekbench_worker(
+                requests_per_second=requests_per_second,
+                burst=burst,
+                concurrency=concurrency,
+                min_delay=0,
+                max_delay=0,
+                worker_id=f"load-test-{index}",
+                poll_interval=0.1,
+                base_url=server.base_url
+            ) for index in range(num_workers)
+        ])
+        merge_geekbench_jobs()
+
+    else:
+        raise ValueError(f"Invalid mode: {mode}. Use one of {list(LOAD_TEST_MODES)}.")
+
+
+def _summarize(mode: str, elapsed: float, server: MockGeekBenchServer, rate_controller: AIMDRateController) -> dict:
+    metrics = get_global_metrics()
+    responses = metrics.counter("geekbench_fetch_responses_total").values
+    retries = metrics.counter("geekbench_fetch_retries_total").values
+    failures = metrics.counter("geekbench_fetch_failures_total").values
+    latency = metrics.histogram("geekbench_fetch_seconds")
+
+    # 성공 응답(200/304) 수를 수집한 페이지 수로 사용
+    # (작업자 모드의 요청 속도는 작업자별 속도 조절기가 관리하므로 429 수만 서버 통계로 확인)
+    worker_mode = mode == "workers"
+    pages = sum(value for key, value in responses.items() if dict(key).get("status") in ("200", "304"))
+
+    return {
+        "mode": mode,
+        "elapsed_seconds": elapsed,
+        "pages": pages,
+        "pages_per_second": pages / elapsed if elapsed > 0 else None,
+        "latency_p50": latency.quantile(0.5),
+        "latency_p99": latency.quantile(0.99),
+        "requests": sum(responses.values()),
+        "retries": sum(retries.values()),
+        "retries_by_status": {dict(key)["status"]: value for key, value in retries.items()},
+        "failures": sum(failures.values()),
+        "throttle_count": server.status_counts.get(429, 0) if worker_mode else rate_controller.throttle_count,
+        "final_rate": None if worker_mode else rate_controller.rate,
+        "server_status_counts": dict(server.status_counts),
+    }
+
+
+async def run_load_test(
+    modes: tuple = LOAD_TEST_MODES,
+    search_type: str = "cpu",
+    query_data: list = ["samsung s5e9945", "samsung sun"],
+    total_pages: int = 20,
+    concurrency: int = 4,
+    requests_per_second: float = 20.0,
+    burst: int = 4,
+    num_workers: int = 2,
+    latency: float | tuple = (0.01, 0.05),
+    error_rate: float = 0.0,
+    throttle_rate: float = 0.0,
+    server_requests_per_second: float = None,
+    retry_after: float | None = 1,
+    retry_policy: RetryPolicy = None,
+    work_dir: str = None,
+    ) -> list[dict]:
+
+    """모의 서버를 실행하고 수집 모드별로 초당 페이지 수, 요청 지연 시간 p50/p99, 재시도 수를 측정."""
+    # 수집 결과 파일은 작업 디렉토리에 기록 (지정하지 않으면 임시 디렉토리를 만들고 종료 후 삭제)
+    owns_work_dir = work_dir is None
+    work_dir = tempfile.mkdtemp(prefix="geekbench_load_test_") if owns_work_dir else work_dir
+    previous_dir = os.getcwd()
+    os.chdir(work_dir)
+
+    reports = list()
+    try:
+        async with MockGeekBenchServer(
+            total_pages=total_pages,
+            latency=latency,
+            error_rate=error_rate,
+            throttle_rate=throttle_rate,
+            max_requests_per_second=server_requests_per_second,
+            burst=burst,
+            retry_after=retry_after
+            ) as server:
+
+            for mode in modes:
+                # 모드마다 지표, 서버 통계, 요청 속도를 초기화
+                metrics = get_global_metrics()
+                metrics.reset()
+                metrics.histogram("geekbench_fetch_seconds", "Latency of one request attempt.", buckets=LOAD_TEST_LATENCY_BUCKETS)
+                server.reset_stats()
+
+                rate_limiter = TokenBucketRateLimiter(requests_per_second=requests_per_second, burst=burst)
+                rate_controller = AIMDRateController(rate_limiter=rate_limiter, max_rate=requests_per_second)
+
+                start_time = time.perf_counter()
+                async with AsyncGeekBenchBrowserAPI(
+                    base_url=server.base_url,
+                    rate_limiter=rate_limiter,
+                    rate_controller=rate_controller,
+                    retry_policy=retry_policy
+                    ) as api_requester:
+                    await _run_mode(
+                        mode=mode,
+                        api_requester=api_requester,
+                        server=server,
+                        search_type=search_type,
+                        query_data=query_data,
+                        last_page=total_pages + 1, # "did not match any" 페이지까지 요청
+                        concurrency=concurrency,
+                        requests_per_second=requests_per_second,
+                        burst=burst,
+                        num_workers=num_workers
+                        )
+
+                reports.append(_summarize(mode=mode, elapsed=time.perf_counter() - start_time, server=server, rate_controller=rate_controller))
+
+    finally:
+        os.chdir(previous_dir)
+        if owns_work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    return reports
+
+
+def format_load_test_reports(reports: list[dict]) -> str:
+    lines = list()
+    for report in reports:
+        p50 = "-" if report["latency_p50"] is None else f"{report['latency_p50'] * 1000:,.1f}ms"
+        p99 = "-" if report["latency_p99"] is None else f"{report['latency_p99'] * 1000:,.1f}ms"
+        lines.append(
+            f"{report['mode']:<26} {report['pages']:>6,} 페이지 {report['pages_per_second']:>8,.1f} pages/sec "
+            f"p50 {p50:>9} p99 {p99:>9} 재시도 {report['retries']:>4,} 실패 {report['failures']:>3,} "
+            f"최종 속도 {'-' if report['final_rate'] is None else format(report['final_rate'], ',.2f') + '/s'}"
+        )
+    return "\n".join(lines)
+
+
+# 사용 예시
+if __name__ == "__main__":
+    # 지연 시간 10~50ms, 5% 서버 오류, 서버 측 초당 15개 초과 시 429 (Retry-After: 1)
+    reports = asyncio.run(
+        run_load_test(
+            total_pages=20,
+            concurrency=4,
+            requests_per_second=20.0,
+            burst=4,
+            latency=(0.01, 0.05),
+            error_rate=0.05,
+            server_requests_per_second=15.0,
+            retry_after=1,
+            retry_policy=RetryPolicy(base_delay=0.1, max_delay=2.0)
+        )
+    )
+    print(format_load_test_reports(reports))
@@ -1,16 +1,43 @@
 import asyncio
+import math
+import multiprocessing
+import os
+import time
+from contextlib import asynccontextmanager, aclosing
 
 try:
     from http_client.http_requester import AsyncGeekBenchBrowserAPI
-    from http_client.http_parser import GeekBenchSearchParser
     from http_client.http_json_parser import GeekBenchJSONParser
-    from http_client.utils.date_utils import get_current_time, log_progress
+    from http_client.http_rate_limiter import get_global_rate_limiter
+    from http_client.http_parse_pool import GeekBenchParsePool
+    from http_client.http_storage import GeekBenchStorage
+    from http_client.http_ndjson import NDJSONResultLog
+    from http_client.http_cache import GeekBenchResponseCache
+    from http_client.http_validators import GeekBenchValidatorStore
+    from http_client.http_checkpoint import GeekBenchCheckpoint
+    from http_client.http_job_queue import SQLiteJobQueue
+    from http_client.http_scheduler import GeekBenchCrawlHistory, GeekBenchCrawlScheduler
+    from http_client.http_rate_limiter import SharedTokenBucketRateLimiter, AIMDRateController
+    from http_client.http_metrics import get_global_metrics, storage_timer, MetricsServer
+    from http_client.http_progress import GeekBenchProgressReporter
+    from http_client.http_enrichment import GeekBenchEnrichmentStore, GeekBenchResultEnricher, iter_stored_result_urls, iter_stored_events
 
 except ImportError:
     from .http_client.http_requester import AsyncGeekBenchBrowserAPI
-    from .http_client.http_parser import GeekBenchSearchParser
     from .http_client.http_json_parser import GeekBenchJSONParser
-    from .http_client.utils.date_utils import get_current_time, log_progress
+    from .http_client.http_rate_limiter import get_global_rate_limiter
+    from .http_client.http_parse_pool import GeekBenchParsePool
+    from .http_client.http_storage import GeekBenchStorage
+    from .http_client.http_ndjson import NDJSONResultLog
+    from .http_client.http_cache import GeekBenchResponseCache
+    from .http_client.http_validators import GeekBenchValidatorStore
+    from .http_client.http_checkpoint import GeekBenchCheckpoint
+    from .http_client.http_job_queue import SQLiteJobQueue
+    from .http_client.http_scheduler import GeekBenchCrawlHistory, GeekBenchCrawlScheduler
+    from .http_client.http_rate_limiter import SharedTokenBucketRateLimiter, AIMDRateController
+    from .http_client.http_metrics import get_global_metrics, storage_timer, MetricsServer
+    from .http_client.http_progress import GeekBenchProgressReporter
+    from .http_client.http_enrichment import GeekBenchEnrichmentStore, GeekBenchResultEnricher, iter_stored_result_urls, iter_stored_events
 
 
 
@@ -22,58 +49,139 @@ async def new_geekbench_data(
     default_pages:int=99999,
     min_delay:int=0,
     max_delay:int=2,
+    concurrency:int=1,
+    requests_per_second:float=None,
+    burst:int=None,
+    api_requester:AsyncGeekBenchBrowserAPI=None,
+    parse_workers:int=0,
+    parse_pool:GeekBenchParsePool=None,
+    storage:GeekBenchStorage=None,
+    result_log_dir:str=None,
+    checkpoint_dir:str=None,
+    resume:bool=False,
+    checkpoint_interval:int=10,
+    metrics_path:str=None,
+    progress_interval:float=5.0,
+    progress_json:bool=False,
+    progress_reporter:GeekBenchProgressReporter=None,
     ):
 
 
-    avg_delay = list() # 지연 시간 저장 리스트
     request_mode = "new mode" # 요청 모드
 
-    # 긱벤치 데이터를 수집하는 API를 생성합니다.
-    api_requester = AsyncGeekBenchBrowserAPI()
+    # 진행 상황 보고기 (주어진 보고기가 있으면 여러 쿼리의 진행 상황을 함께 출력)
+    owns_progress_reporter = progress_reporter is None
+    if owns_progress_reporter:
+        progress_reporter = GeekBenchProgressReporter(log_interval=progress_interval, json_lines=progress_json)
+
+    # 프로세스 전역 요청 속도 제한 설정 (None이면 기존 설정 유지)
+    # 동시 요청(concurrency > 1)은 기본 초당 2회로 제한, 순차 요청은 requests_per_second를 지정한 경우에만 제한
+    get_global_rate_limiter(requests_per_second=requests_per_second, burst=burst)
 
     # 긱벤치 JSON 데이터를 처리하는 Parser를 생성합니다.
     json_parser = GeekBenchJSONParser()
 
+    # 긱벤치 데이터를 수집하는 API를 생성합니다. (주어진 API가 있으면 세션을 공유)
+    async with _api_requester_scope(api_requester=api_requester) as api_requester, \
+        _parse_pool_scope(parse_pool=parse_pool, parse_workers=parse_workers) as parse_pool:
+        for query in query_data:    
+            # 파일 경로
+            file_path = rf"geekbench_data_json\{query}_1.json"
 
-    for query in query_data:    
-        # 파일 경로
-        file_path = rf"geekbench_data_json\{query}_1.json"
-        
-        # 수집 페이지량 참고 및 표시 전용
-        total_pages = await api_requester.fetch_total_pages(
-            search_type=search_type,
-            query=query,
-            default_pages=default_pages,
-            merge_mode=False,
-            add_pages=5
-            )
-        
-        # 요청자 및 로그 출력
-        await _fetch_and_log_geekbench_data(
-            request_mode=request_mode,
-            api_requester=api_requester,
-            json_parser=json_parser,
-            query=query,
-            search_type=search_type, 
-            start_page=start_page, 
-            last_page=last_page,
-            total_pages=total_pages,
-            min_delay=min_delay,
-            max_delay=max_delay,
-            avg_delay=avg_delay
-            )
+            # 결과 로그 경로 (체크포인트 사용 시 부분 결과도 로그에 기록)
+            log_path = _get_result_log_path(query=query, storage=storage, result_log_dir=result_log_dir, checkpoint_dir=checkpoint_dir)
+
+            # 체크포인트에서 이어서 수집 (완료된 페이지는 다시 요청하지 않음)
+            checkpoint = _load_checkpoint(
+                checkpoint_dir=checkpoint_dir,
+                query=query,
+                search_type=search_type,
+                request_mode=request_mode,
+                resume=resume,
+                log_path=log_path,
+                api_requester=api_requester,
+                interval=checkpoint_interval
+                )
+            if checkpoint is not None:
+                total_pages = checkpoint.total_pages
+            else:
+                # 수집 페이지량 참고 및 표시 전용
+                total_pages = await api_requester.fetch_total_pages(
+                    search_type=search_type,
+                    query=query,
+                    default_pages=default_pages,
+                    merge_mode=False,
+                    add_pages=5
+                    )
+
+                if checkpoint_dir is not None:
+                    checkpoint = GeekBenchCheckpoint(
+                        checkpoint_path=GeekBenchCheckpoint.get_checkpoint_path(checkpoint_dir=checkpoint_dir, query=query),
+                        search_type=search_type,
+                        query=query,
+                        request_mode=request_mode,
+                        total_pages=total_pages,
+                        interval=checkpoint_interval
+                        )
+
+            # 결과 로그 사용 시: 수집 중 결과를 NDJSON으로 바로 기록 (메모리에 보관하지 않음)
+            if log_path is not None:
+                json_parser.attach_result_log(result_log=NDJSONResultLog(log_path=log_path, fsync=checkpoint is not None))
+
+            try:
+                # 요청자 및 로그 출력
+                await _fetch_and_log_geekbench_data(
+                    request_mode=request_mode,
+                    api_requester=api_requester,
+                    json_parser=json_parser,
+                    query=query,
+                    search_type=search_type, 
+                    start_page=start_page if checkpoint is None else checkpoint.resume_page(start_page=start_page), 
+                    last_page=last_page,
+                    total_pages=total_pages,
+                    min_delay=min_delay,
+                    max_delay=max_delay,
+                    progress_reporter=progress_reporter,
+                    concurrency=concurrency,
+                    parse_pool=parse_pool,
+                    storage=storage,
+                    checkpoint=checkpoint
+                    )
+            finally:
+                # 남은 버퍼 기록 (비정상 종료 시에도 수집된 결과 보존) 후 체크포인트 기록
+                json_parser.detach_result_log()
+                _save_checkpoint(checkpoint=checkpoint, api_requester=api_requester, json_parser=json_parser, storage=storage)
         
-        # 데이터 저장
-        json_parser.save_data_to_json(
-            file_path=file_path,
-            data=json_parser.fetch_geekbench_data()
-            )
+            # 데이터 저장 (저장소를 사용하는 경우 저장소에서 JSON 파일 생성)
+            if storage is not None:
+                storage.flush()
+                storage.export_to_json(query=query, file_path=file_path)
+            elif log_path is not None:
+                # 결과 로그를 압축하여 저장 후 로그 삭제
+                json_parser.save_data_to_json(
+                    file_path=file_path,
+                    data=NDJSONResultLog.compact(log_path=log_path)
+                    )
+                os.remove(log_path)
+            else:
+                json_parser.save_data_to_json(
+                    file_path=file_path,
+                    data=json_parser.fetch_geekbench_data()
+                    )
+
+            # 저장 완료 후 체크포인트 삭제
+            if checkpoint is not None:
+                checkpoint.remove()
         
-        print(f"{request_mode}: {file_path} 생성됨.\n")
+            print(f"{request_mode}: {file_path} 생성됨.\n")
         
-        # 데이터 삭제
-        json_parser.remove_geekbench_data()
-        avg_delay.clear()
+            # 데이터 삭제
+            json_parser.remove_geekbench_data()
+
+    # 실행 종료 시 전체 진행 상황 요약 및 지표 스냅샷 기록
+    if owns_progress_reporter:
+        progress_reporter.report_summary()
+    _save_metrics_snapshot(metrics_path=metrics_path)
 
 
 async def new_geekbench_data_concurrently(
@@ -84,26 +192,63 @@ async def new_geekbench_data_concurrently(
     default_pages:int=99999,
     min_delay:int=0,
     max_delay:int=2,
+    concurrency:int=1,
+    requests_per_second:float=None,
+    burst:int=None,
+    api_requester:AsyncGeekBenchBrowserAPI=None,
+    parse_workers:int=0,
+    parse_pool:GeekBenchParsePool=None,
+    storage:GeekBenchStorage=None,
+    result_log_dir:str=None,
+    checkpoint_dir:str=None,
+    resume:bool=False,
+    checkpoint_interval:int=10,
+    metrics_path:str=None,
+    progress_interval:float=5.0,
+    progress_json:bool=False,
+    progress_reporter:GeekBenchProgressReporter=None,
     ):
 
 
-    if len(query_data) > 5:
-        raise ValueError("비동기 최대 요청은 4개까지 가능합니다.")
+    # 모든 쿼리의 진행 상황을 하나의 보고기로 모아 출력
+    owns_progress_reporter = progress_reporter is None
+    if owns_progress_reporter:
+        progress_reporter = GeekBenchProgressReporter(log_interval=progress_interval, json_lines=progress_json)
 
-    # 비동기적으로 모든 쿼리에 대해 데이터 수집
-    tasks = [
-        new_geekbench_data(
-            query_data=query,
-            search_type=search_type,
-            start_page=start_page,
-            last_page=last_page,
-            default_pages=default_pages,
-            min_delay=min_delay,
-            max_delay=max_delay
-        ) for query in query_data
-    ]
+    # 모든 쿼리가 하나의 커넥션 풀 세션을 공유
+    # (Referer 등은 요청 단위 헤더로 전송되므로 동시 쿼리 수 제한 없음, 총 요청량은 전역 속도 제한으로 조절)
+    async with _api_requester_scope(api_requester=api_requester) as api_requester, \
+        _parse_pool_scope(parse_pool=parse_pool, parse_workers=parse_workers) as parse_pool:
+        # 비동기적으로 모든 쿼리에 대해 데이터 수집
+        tasks = [
+            new_geekbench_data(
+                query_data=query,
+                search_type=search_type,
+                start_page=start_page,
+                last_page=last_page,
+                default_pages=default_pages,
+                min_delay=min_delay,
+                max_delay=max_delay,
+                concurrency=concurrency,
+                requests_per_second=requests_per_second,
+                burst=burst,
+                api_requester=api_requester,
+                parse_pool=parse_pool,
+                storage=storage,
+                result_log_dir=result_log_dir,
+                checkpoint_dir=checkpoint_dir,
+                resume=resume,
+                checkpoint_interval=checkpoint_interval,
+                progress_reporter=progress_reporter
+            ) for query in query_data
+        ]
+
+        await asyncio.gather(*tasks)
 
-    await asyncio.gather(*tasks)
+    # 모든 쿼리 종료 후 전체 진행 상황 요약 및 지표 스냅샷 기록
+    if owns_progress_reporter:
+        progress_reporter.report_summary()
+    _save_metrics_snapshot(metrics_path=metrics_path)
 
 
 async def merge_geekbench_data(
@@ -113,68 +258,666 @@ async def merge_geekbench_data(
     default_pages:int=99999,
     min_delay:int=0.5,
     max_delay:int=3,
-    add_pages:int=5
+    add_pages:int=5,
+    concurrency:int=1,
+    requests_per_second:float=None,
+    burst:int=None,
+    api_requester:AsyncGeekBenchBrowserAPI=None,
+    parse_workers:int=0,
+    parse_pool:GeekBenchParsePool=None,
+    watermark_mode:bool=False,
+    storage:GeekBenchStorage=None,
+    result_log_dir:str=None,
+    export_json:bool=True,
+    checkpoint_dir:str=None,
+    resume:bool=False,
+    checkpoint_interval:int=10,
+    metrics_path:str=None,
+    progress_interval:float=5.0,
+    progress_json:bool=False,
+    progress_reporter:GeekBenchProgressReporter=None,
     ):
 
-    avg_delay = list() # 지연 시간 저장 리스트
     request_mode = "merge mode" # 요청 모드
+    watermark_path = r"geekbench_data_json\watermarks.json" # 쿼리별 워터마크 (가장 큰 고유 번호) 파일 경로
+    new_results = dict() # 쿼리별 수집된 새 결과 수
 
-    # 긱벤치 데이터를 수집하는 API를 생성합니다.
-    api_requester = AsyncGeekBenchBrowserAPI()
+    # 진행 상황 보고기 (주어진 보고기가 있으면 여러 쿼리의 진행 상황을 함께 출력)
+    owns_progress_reporter = progress_reporter is None
+    if owns_progress_reporter:
+        progress_reporter = GeekBenchProgressReporter(log_interval=progress_interval, json_lines=progress_json)
+
+    # 프로세스 전역 요청 속도 제한 설정 (None이면 기존 설정 유지)
+    # 동시 요청(concurrency > 1)은 기본 초당 2회로 제한, 순차 요청은 requests_per_second를 지정한 경우에만 제한
+    get_global_rate_limiter(requests_per_second=requests_per_second, burst=burst)
 
     # 긱벤치 JSON 데이터를 처리하는 Parser를 생성합니다.
     json_parser = GeekBenchJSONParser()
 
-    for query in query_data:
-        # 파일 경로
-        file_path = rf"geekbench_data_json\{query}_1.json"
+    # 긱벤치 데이터를 수집하는 API를 생성합니다. (주어진 API가 있으면 세션을 공유)
+    async with _api_requester_scope(api_requester=api_requester) as api_requester, \
+        _parse_pool_scope(parse_pool=parse_pool, parse_workers=parse_workers) as parse_pool:
+        for query in query_data:
+            # 파일 경로
+            file_path = rf"geekbench_data_json\{query}_1.json"
 
-        # 합병 전용 ((전체 페이지 수 - 수집된 페이지 수) = 최적의 수집 페이지 수 계산
-        total_pages = \
-        await api_requester.fetch_total_pages(
-            search_type=search_type,
-            query=query,
-            default_pages=default_pages,
-            merge_mode=True,
-            add_pages=add_pages
+            watermark = None
 
-            ) - \
-        json_parser.calculate_total_pages(
-            file_path=file_path
-            )
+            # 결과 로그 경로 (체크포인트 사용 시 부분 결과도 로그에 기록)
+            log_path = _get_result_log_path(query=query, storage=storage, result_log_dir=result_log_dir, checkpoint_dir=checkpoint_dir)
+
+            # 체크포인트에서 이어서 수집 (완료된 페이지는 다시 요청하지 않음)
+            checkpoint = _load_checkpoint(
+                checkpoint_dir=checkpoint_dir,
+                query=query,
+                search_type=search_type,
+                request_mode=request_mode,
+                resume=resume,
+                log_path=log_path,
+                api_requester=api_requester,
+                interval=checkpoint_interval
+                )
+
+            if watermark_mode:
+                # 워터마크 모드: 1페이지부터 수집하고, 이미 저장된 결과만 있는 페이지에서 중단
+                # (기록된 워터마크가 없으면 저장된 결과의 가장 큰 고유 번호)
+                watermark = GeekBenchJSONParser.load_watermark(watermark_path=watermark_path, query=query)
+                if watermark is None:
+                    watermark = storage.fetch_max_result_id(query=query) if storage is not None else json_parser.calculate_watermark(data_path=file_path)
+
+                # 종료 페이지는 워터마크로 결정되므로 전체 페이지 수 요청 생략 (표시 전용)
+                total_pages = default_pages
+
+            elif checkpoint is not None:
+                # 중단 전에 계산한 수집 페이지 수 사용 (부분 결과는 아직 병합되지 않음)
+                total_pages = checkpoint.total_pages
+
+            else:
+                # 수집된 페이지 수 (저장소를 사용하는 경우 저장된 결과 수로 계산)
+                if storage is not None:
+                    stored_pages = math.ceil(storage.count_results(query=query) / GeekBenchStorage.PAGE_SIZE)
+                else:
+                    stored_pages = json_parser.calculate_total_pages(
+                        file_path=file_path
+                        )
+
+                # 합병 전용 ((전체 페이지 수 - 수집된 페이지 수) = 최적의 수집 페이지 수 계산
+                total_pages = \
+                await api_requester.fetch_total_pages(
+                    search_type=search_type,
+                    query=query,
+                    default_pages=default_pages,
+                    merge_mode=True,
+                    add_pages=add_pages
+
+                    ) - stored_pages
+
+            if checkpoint is None and checkpoint_dir is not None:
+                checkpoint = GeekBenchCheckpoint(
+                    checkpoint_path=GeekBenchCheckpoint.get_checkpoint_path(checkpoint_dir=checkpoint_dir, query=query),
+                    search_type=search_type,
+                    query=query,
+                    request_mode=request_mode,
+                    total_pages=total_pages,
+                    interval=checkpoint_interval
+                    )
         
-        # 요청자 및 로그 출력
-        await _fetch_and_log_geekbench_data(
-            request_mode=request_mode,
-            api_requester=api_requester,
-            json_parser=json_parser,
-            query=query,
-            search_type=search_type, 
-            start_page=start_page, 
-            last_page=None,
-            total_pages=total_pages,
-            min_delay=min_delay,
-            max_delay=max_delay,
-            avg_delay=avg_delay
-            )
+            # 결과 로그 사용 시: 수집 중 결과를 NDJSON으로 바로 기록 (메모리에 보관하지 않음)
+            if log_path is not None:
+                json_parser.attach_result_log(result_log=NDJSONResultLog(log_path=log_path, fsync=checkpoint is not None))
 
-        # 수집된 데이터 및 기존 데이터 합병 및 추가 처리
-        paginated_data = json_parser.merge_geekbench_data(
-            new_data_path=json_parser.fetch_geekbench_data(),
-            old_data_path=file_path, 
-            )
+            try:
+                # 요청자 및 로그 출력
+                new_results[query], reached_end = await _fetch_and_log_geekbench_data(
+                    request_mode=request_mode,
+                    api_requester=api_requester,
+                    json_parser=json_parser,
+                    query=query,
+                    search_type=search_type, 
+                    start_page=start_page if checkpoint is None else checkpoint.resume_page(start_page=start_page), 
+                    last_page=None,
+                    total_pages=total_pages,
+                    min_delay=min_delay,
+                    max_delay=max_delay,
+                    progress_reporter=progress_reporter,
+                    concurrency=concurrency,
+                    parse_pool=parse_pool,
+                    stop_at_id=watermark,
+                    storage=storage,
+                    checkpoint=checkpoint
+                    )
+            finally:
+                # 남은 버퍼 기록 (비정상 종료 시에도 수집된 결과 보존) 후 체크포인트 기록
+                json_parser.detach_result_log()
+                _save_checkpoint(checkpoint=checkpoint, api_requester=api_requester, json_parser=json_parser, storage=storage)
+
+            # 저장소 사용 시: 새 결과는 수집 중 이미 upsert되었으므로 병합 생략
+            if storage is not None:
+                storage.flush()
+
+                if watermark_mode:
+                    _save_merge_watermark(
+                        watermark_path=watermark_path,
+                        query=query,
+                        watermark=watermark,
+                        new_watermark=storage.fetch_max_result_id(query=query),
+                        reached_end=reached_end
+                        )
+
+                # 기존 페이지 단위 JSON 파일은 저장소에서 생성 (선택)
+                if export_json:
+                    storage.export_to_json(query=query, file_path=file_path)
+
+                # 저장 완료 후 체크포인트 삭제
+                if checkpoint is not None:
+                    checkpoint.remove()
+
+                print(f"{request_mode}: {query} 저장소에 병합됨.\n")
+                continue
+
+            # 수집된 데이터 및 기존 데이터 합병 후 저장 (결과 로그 사용 시 로그를 압축하여 사용)
+            # 기존 파일은 정렬된 스트림으로 읽고 병합 결과는 페이지 단위로 바로 기록
+            merge_summary = json_parser.merge_geekbench_data_to_file(
+                save_file_path=file_path,
+                new_data_path=NDJSONResultLog.compact(log_path=log_path) if log_path is not None else json_parser.fetch_geekbench_data(),
+                old_data_path=file_path, 
+                )
+
+            # 다음 병합을 위한 워터마크 기록
+            if watermark_mode:
+                _save_merge_watermark(
+                    watermark_path=watermark_path,
+                    query=query,
+                    watermark=watermark,
+                    new_watermark=merge_summary["watermark"],
+                    reached_end=reached_end
+                    )
+
+            # 병합 결과 저장 후 로그 및 체크포인트 삭제
+            if log_path is not None:
+                os.remove(log_path)
+            if checkpoint is not None:
+                checkpoint.remove()
+
+            print(f"{request_mode}: {file_path} 병합됨.\n")
         
-        # 데이터 저장
-        GeekBenchJSONParser.save_data_to_json(
-            file_path=file_path,
-            data=paginated_data
+            # 데이터 삭제
+            json_parser.remove_geekbench_data()
+
+    # 실행 종료 시 전체 진행 상황 요약 및 지표 스냅샷 기록
+    if owns_progress_reporter:
+        progress_reporter.report_summary()
+    _save_metrics_snapshot(metrics_path=metrics_path)
+
+    return new_results
+
+
+async def scheduled_merge_geekbench_data(
+    search_type:str="cpu",
+    query_data:list=[],
+    max_requests:int=500,
+    min_expected_results:float=1.0,
+    max_pages_per_query:int=40,
+    history_path:str=r"geekbench_data_json\crawl_history.json",
+    min_delay:int=0,
+    max_delay:int=0,
+    concurrency:int=1,
+    requests_per_second:float=None,
+    burst:int=None,
+    api_requester:AsyncGeekBenchBrowserAPI=None,
+    storage:GeekBenchStorage=None,
+    metrics_path:str=None,
+    progress_interval:float=5.0,
+    progress_json:bool=False,
+    progress_reporter:GeekBenchProgressReporter=None,
+    ):
+
+    # 예상 새 결과 수(도착률 × 마지막 수집 이후 경과 시간)가 많은 쿼리부터 요청 예산(max_requests 페이지)을 배분
+    history = GeekBenchCrawlHistory(history_path=history_path)
+    scheduler = GeekBenchCrawlScheduler(
+        history=history,
+        min_expected_results=min_expected_results,
+        max_pages_per_query=max_pages_per_query
+        )
+    plan = scheduler.plan(search_type=search_type, query_data=query_data, max_requests=max_requests)
+
+    for item in plan:
+        print(f"{item['query']}: 예상 새 결과 {item['expected_results']:,.1f}개, {item['pages']} 페이지 배분")
+    print(f"건너뛴 쿼리: {len(query_data) - len(plan)}개\n")
+
+    # 배분된 쿼리를 모두 동시에 수집 (동시 쿼리 수 제한 없음, 총 요청량은 전역 속도 제한으로 조절)
+    # 워터마크 모드로 이미 저장된 결과만 있는 페이지에서 중단하므로 배분된 페이지는 상한으로만 사용
+    # 배분된 모든 쿼리의 진행 상황을 하나의 보고기로 모아 출력
+    owns_progress_reporter = progress_reporter is None
+    if owns_progress_reporter:
+        progress_reporter = GeekBenchProgressReporter(log_interval=progress_interval, json_lines=progress_json)
+
+    async with _api_requester_scope(api_requester=api_requester) as api_requester:
+        crawl_started_at = time.time()
+        results = await asyncio.gather(*[
+            merge_geekbench_data(
+                search_type=search_type,
+                query_data=[item["query"]],
+                default_pages=item["pages"],
+                min_delay=min_delay,
+                max_delay=max_delay,
+                concurrency=concurrency,
+                requests_per_second=requests_per_second,
+                burst=burst,
+                api_requester=api_requester,
+                watermark_mode=True,
+                storage=storage,
+                progress_reporter=progress_reporter
+            ) for item in plan
+        ], return_exceptions=True) # 한 쿼리가 실패해도 나머지 쿼리는 끝까지 수집 (공유 세션은 모두 끝난 뒤 종료)
+
+    # 수집된 새 결과 수로 도착률 갱신 (배분된 페이지를 모두 사용한 쿼리는 결과가 잘렸으므로 도착률 유지)
+    # 실패한 쿼리는 이력을 기록하지 않고 계획에 오류를 표시
+    interrupted = None
+    for item, new_results in zip(plan, results):
+        if isinstance(new_results, BaseException):
+            if not isinstance(new_results, Exception):
+                interrupted = new_results # 취소 및 인터럽트는 이력 저장 후 다시 발생
+            item["error"] = f"{type(new_results).__name__}: {new_results}"
+            print(f"{item['query']}: 수집 실패 ({item['error']})")
+            continue
+
+        for query, query_new_results in new_results.items():
+            history.record_crawl(
+                search_type=search_type,
+                query=query,
+                new_results=query_new_results,
+                crawled_at=crawl_started_at,
+                truncated=scheduler.hit_page_cap(new_results=query_new_results, pages=item["pages"])
+                )
+    history.save()
+    if interrupted is not None:
+        raise interrupted
+
+    # 모든 쿼리 종료 후 전체 진행 상황 요약 및 지표 스냅샷 기록
+    if owns_progress_reporter:
+        progress_reporter.report_summary()
+    _save_metrics_snapshot(metrics_path=metrics_path)
+
+    return plan
+
+
+async def enqueue_geekbench_jobs(
+    search_type:str="cpu",
+    query_data:list=[],
+    queue_path:str=r"geekbench_data_queue\jobs.sqlite3",
+    start_page:int=1,
+    default_pages:int=99999,
+    pages_per_job:int=20,
+    merge_mode:bool=False,
+    add_pages:int=5,
+    api_requester:AsyncGeekBenchBrowserAPI=None,
+    ):
+
+    # 코디네이터: 쿼리별 수집 페이지 수를 확인하고 (search_type, query, 페이지 범위) 작업으로 나누어 큐에 추가
+    json_parser = GeekBenchJSONParser()
+
+    async with _api_requester_scope(api_requester=api_requester) as api_requester:
+        with SQLiteJobQueue(db_path=queue_path) as job_queue:
+            for query in query_data:
+                total_pages = await api_requester.fetch_total_pages(
+                    search_type=search_type,
+                    query=query,
+                    default_pages=default_pages,
+                    merge_mode=merge_mode,
+                    add_pages=add_pages
+                    )
+
+                # 병합 모드: 이미 수집된 페이지 수만큼 제외 (merge_geekbench_data와 동일)
+                if merge_mode:
+                    total_pages -= json_parser.calculate_total_pages(file_path=rf"geekbench_data_json\{query}_1.json")
+
+                added_jobs = job_queue.enqueue_query(
+                    search_type=search_type,
+                    query=query,
+                    total_pages=total_pages,
+                    start_page=start_page,
+                    pages_per_job=pages_per_job
+                    )
+                print(f"{query}: {total_pages} 페이지, 작업 {added_jobs}개 추가됨.")
+
+
+async def run_geekbench_worker(
+    queue_path:str=r"geekbench_data_queue\jobs.sqlite3",
+    output_dir:str=r"geekbench_data_queue\results",
+    requests_per_second:float=2.0,
+    burst:int=2,
+    concurrency:int=1,
+    min_delay:int=0,
+    max_delay:int=2,
+    parse_workers:int=0,
+    worker_id:str=None,
+    poll_interval:float=5,
+    metrics_dir:str=None,
+    base_url:str=None,
+    ):
+
+    # 작업자: 큐에서 작업을 임대하여 수집 및 파싱 후 결과 파일을 기록 (모든 작업이 끝나면 종료)
+    worker_id = SQLiteJobQueue.new_worker_id() if worker_id is None else worker_id
+
+    # 모든 작업자가 큐 파일의 토큰 버킷 하나를 공유 (전체 요청량은 requests_per_second 이하)
+    rate_limiter = SharedTokenBucketRateLimiter(db_path=queue_path, requests_per_second=requests_per_second, burst=burst)
+    rate_controller = AIMDRateController(rate_limiter=rate_limiter, max_rate=requests_per_second)
+
+    try:
+        async with AsyncGeekBenchBrowserAPI(rate_limiter=rate_limiter, rate_controller=rate_controller, base_url=base_url) as api_requester, \
+            _parse_pool_scope(parse_workers=parse_workers) as parse_pool:
+            with SQLiteJobQueue(db_path=queue_path) as job_queue:
+                while True:
+                    job = job_queue.claim(worker_id=worker_id)
+
+                    if job is None:
+                        # 다른 작업자가 처리 중인 작업은 임대가 만료되면 다시 가져올 수 있으므로 대기
+                        if not job_queue.has_active_jobs():
+                            break
+                        await asyncio.sleep(poll_interval)
+                        continue
+
+                    result_path = rf"{output_dir}\{job['query']}_{job['job_id']}.ndjson"
+
+                    try:
+                        last_page = await _run_geekbench_job(
+                            job=job,
+                            job_queue=job_queue,
+                            worker_id=worker_id,
+                            api_requester=api_requester,
+                            result_path=result_path,
+                            concurrency=concurrency,
+                            min_delay=min_delay,
+                            max_delay=max_delay,
+                            parse_pool=parse_pool
+                            )
+                    except Exception as e:
+                        job_queue.fail(job_id=job["job_id"], worker_id=worker_id, error=f"{type(e).__name__}: {e}")
+                        print(f"{worker_id}: {job['query']} {job['start_page']}-{job['end_page']} 실패 ({e})")
+                        continue
+
+                    job_queue.complete(job_id=job["job_id"], worker_id=worker_id, result_path=result_path, last_page=last_page)
+                    print(f"{worker_id}: {job['query']} {job['start_page']}-{job['end_page']} 완료")
+
+    finally:
+        rate_limiter.close()
+
+        # 작업자 프로세스별 지표 스냅샷 기록 (작업자마다 별도 파일)
+        if metrics_dir is not None:
+            _save_metrics_snapshot(metrics_path=rf"{metrics_dir}\{worker_id}.metrics.json")
+
+
+def run_geekbench_workers(num_workers:int=2, **worker_options):
+    # 작업자 프로세스 여러 개 실행 (다른 머신에서는 같은 큐 디렉토리를 공유하여 run_geekbench_worker 실행)
+    processes = [
+        multiprocessing.Process(target=_run_geekbench_worker_process, kwargs=worker_options)
+        for _ in range(num_workers)
+    ]
+
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+def _run_geekbench_worker_process(**worker_options):
+    asyncio.run(run_geekbench_worker(**worker_options))
+
+
+def merge_geekbench_jobs(
+    queue_path:str=r"geekbench_data_queue\jobs.sqlite3",
+    remove_results:bool=True,
+    ):
+
+    # 병합 단계: 모든 작업이 끝난 쿼리의 작업별 결과를 합쳐 기존 JSON 파일과 병합
+    json_parser = GeekBenchJSONParser()
+
+    with SQLiteJobQueue(db_path=queue_path) as job_queue:
+        for search_type, query in job_queue.fetch_queries():
+            # 실패한 작업이 있으면 병합하지 않음 (해당 페이지 범위가 빠진 파일이 만들어지므로)
+            failed_jobs = job_queue.fetch_failed_jobs(search_type=search_type, query=query)
+            if failed_jobs:
+                for failed_job in failed_jobs:
+                    print(f"{query}: {failed_job['start_page']}-{failed_job['end_page']} 페이지 작업 실패 ({failed_job['attempts']}회, {failed_job['error']})")
+                print(f"{query}: 실패한 작업이 있어 병합 생략 (retry_failed 후 작업자를 다시 실행)")
+                continue
+
+            if not job_queue.is_finished(query=query, search_type=search_type):
+                print(f"{query}: 완료되지 않은 작업이 있어 병합 생략 {job_queue.count_jobs(query=query, search_type=search_type)}")
+                continue
+
+            file_path = rf"geekbench_data_json\{query}_1.json"
+            result_paths = job_queue.fetch_result_paths(search_type=search_type, query=query)
+
+            json_parser.merge_geekbench_data_to_file(
+                save_file_path=file_path,
+                new_data_path=NDJSONResultLog.compact_many(log_paths=result_paths),
+                old_data_path=file_path
+                )
+
+            # 병합 결과 저장 후 작업별 결과 파일 삭제
+            if remove_results:
+                for result_path in result_paths:
+                    if os.path.exists(result_path):
+                        os.remove(result_path)
+
+            # 병합된 작업 삭제 (다음 수집 때 최신 결과가 있는 앞 페이지부터 다시 작업 생성)
+            job_queue.remove_query(search_type=search_type, query=query)
+
+            print(f"merge jobs: {file_path} 병합됨.")
+
+
+async def enrich_geekbench_data(
+    search_type:str="cpu",
+    query_data:list=[],
+    enrichment_path:str=r"geekbench_data_db\enrichments.sqlite3",
+    concurrency:int=4,
+    requests_per_second:float=None,
+    burst:int=None,
+    api_requester:AsyncGeekBenchBrowserAPI=None,
+    storage:GeekBenchStorage=None,
+    export_json:bool=True,
+    metrics_path:str=None,
+    ):
+
+    # 저장된 결과 중 상세 정보가 없는 결과만 상세 페이지를 요청하여 워크로드별 점수 및 시스템 정보 수집
+    # (처리된 결과는 enrichment_path의 done-set에 기록되어 다시 실행해도 새 결과만 요청)
+    counts = dict() # 쿼리별 처리 결과 수
+
+    # 프로세스 전역 요청 속도 제한 설정 (검색 페이지 수집과 같은 토큰 버킷 공유)
+    get_global_rate_limiter(requests_per_second=requests_per_second, burst=burst)
+
+    with GeekBenchEnrichmentStore(db_path=enrichment_path) as enrichment_store:
+        async with _api_requester_scope(api_requester=api_requester) as api_requester:
+            enricher = GeekBenchResultEnricher(api_requester=api_requester, enrichment_store=enrichment_store, concurrency=concurrency)
+
+            for query in query_data:
+                file_path = rf"geekbench_data_json\{query}_1.json"
+
+                counts[query] = await enricher.enrich(
+                    search_type=search_type,
+                    result_urls=iter_stored_result_urls(query=query, storage=storage, file_path=file_path)
+                    )
+                print(f"{query}: 상세 정보 {counts[query]['enriched']}개 추가, 없음 {counts[query]['missing']}개, 실패 {counts[query]['failed']}개")
+
+                # 상세 정보를 결과에 붙여 별도 JSON 파일로 저장 (기존 파일 형식은 유지)
+                if export_json:
+                    enriched_file_path = rf"geekbench_data_json\{query}_enriched_1.json"
+                    enrichment_store.attach_to_json(
+                        events=iter_stored_events(query=query, storage=storage, file_path=file_path),
+                        file_path=enriched_file_path
+                        )
+                    print(f"enrich mode: {enriched_file_path} 생성됨.\n")
+
+    _save_metrics_snapshot(metrics_path=metrics_path)
+
+    return counts
+
+
+def _get_result_log_path(query: str, storage: GeekBenchStorage = None, result_log_dir: str = None, checkpoint_dir: str = None) -> str | None:
+    # 저장소를 사용하면 결과가 저장소에 바로 기록되므로 로그를 사용하지 않음
+    if storage is not None:
+        return None
+    if result_log_dir is not None:
+        return rf"{result_log_dir}\{query}_1.ndjson"
+    if checkpoint_dir is not None:
+        return GeekBenchCheckpoint.get_results_path(checkpoint_dir=checkpoint_dir, query=query)
+    return None
+
+
+def _load_checkpoint(
+    checkpoint_dir: str,
+    query: str,
+    search_type: str,
+    request_mode: str,
+    resume: bool,
+    log_path: str = None,
+    api_requester: AsyncGeekBenchBrowserAPI = None,
+    interval: int = 10
+    ) -> GeekBenchCheckpoint | None:
+    if checkpoint_dir is None:
+        return None
+
+    checkpoint_path = GeekBenchCheckpoint.get_checkpoint_path(checkpoint_dir=checkpoint_dir, query=query)
+
+    # 새로 시작하는 경우 이전 실행의 체크포인트 및 부분 결과 삭제
+    if not resume:
+        _remove_stale_checkpoint(checkpoint_path=checkpoint_path, log_path=log_path)
+        return None
+
+    checkpoint = GeekBenchCheckpoint.load(checkpoint_path=checkpoint_path)
+    if checkpoint is None:
+        return None
+
+    # 다른 검색 종류 또는 요청 모드의 체크포인트는 사용하지 않고 새로 시작
+    if not checkpoint.matches(search_type=search_type, request_mode=request_mode):
+        print(f"{query}: 체크포인트의 수집 조건이 달라 새로 수집 ({checkpoint.search_type}, {checkpoint.request_mode})\n")
+        _remove_stale_checkpoint(checkpoint_path=checkpoint_path, log_path=log_path)
+        return None
+
+    # 체크포인트 간격은 이번 실행의 설정 사용
+    checkpoint.interval = interval
+
+    # 중단 전의 요청 속도 복원
+    if checkpoint.rate_snapshot is not None:
+        api_requester.rate_controller.restore(checkpoint.rate_snapshot)
+
+    print(f"{query}: 체크포인트에서 이어서 수집 ({checkpoint.last_completed_page} 페이지까지 완료)\n")
+    return checkpoint
+
+
+def _save_merge_watermark(watermark_path: str, query: str, watermark: int | None, new_watermark: int | None, reached_end: bool) -> None:
+    # 워터마크까지 수집하지 못한 경우 (수집 페이지 수 초과) 기존 워터마크 유지
+    # (새 워터마크를 기록하면 다음 실행이 1페이지에서 멈춰 그 사이의 결과를 수집하지 못함)
+    if not reached_end:
+        if watermark is not None:
+            print(f"{query}: 워터마크({watermark})에 도달하기 전에 수집 페이지 수를 모두 사용, 다음 실행에서 이어서 수집\n")
+            GeekBenchJSONParser.save_watermark(watermark_path=watermark_path, query=query, watermark=watermark)
+        return
+
+    if new_watermark is not None:
+        GeekBenchJSONParser.save_watermark(watermark_path=watermark_path, query=query, watermark=new_watermark)
+
+
+def _remove_stale_checkpoint(checkpoint_path: str, log_path: str = None) -> None:
+    for stale_path in (checkpoint_path, log_path):
+        if stale_path is not None and os.path.exists(stale_path):
+            os.remove(stale_path)
+
+
+def _save_checkpoint(checkpoint: GeekBenchCheckpoint, api_requester: AsyncGeekBenchBrowserAPI, json_parser: GeekBenchJSONParser, storage: GeekBenchStorage = None) -> None:
+    if checkpoint is None or checkpoint.last_completed_page is None:
+        return
+
+    # 부분 결과를 먼저 디스크에 기록한 뒤 체크포인트 기록
+    if storage is not None:
+        storage.flush()
+    elif json_parser.result_log is not None:
+        json_parser.result_log.flush()
+
+    checkpoint.save(rate_controller=api_requester.rate_controller)
+
+
+async def _run_geekbench_job(
+    job: dict,
+    job_queue: SQLiteJobQueue,
+    worker_id: str,
+    api_requester: AsyncGeekBenchBrowserAPI,
+    result_path: str,
+    concurrency: int = 1,
+    min_delay: float = 0,
+    max_delay: float = 2,
+    parse_pool: GeekBenchParsePool = None
+    ) -> int | None:
+
+    # 한 작업의 페이지 범위를 수집하여 결과 파일에 기록
+    # 반환값: 범위 안에서 마지막 페이지에 도달했으면 마지막으로 결과가 있던 페이지 번호, 아니면 None
+    if os.path.exists(result_path):
+        os.remove(result_path) # 이전 시도의 결과는 버리고 다시 기록
+
+    if concurrency > 1 or parse_pool is not None:
+        search_client = api_requester.concurrent_search_client(
+            search_type=job["search_type"],
+            query=job["query"],
+            start_page=job["start_page"],
+            last_page=job["end_page"],
+            concurrency=concurrency,
+            parse_pool=parse_pool
+            )
+    else:
+        search_client = api_requester.search_client(
+            search_type=job["search_type"],
+            query=job["query"],
+            start_page=job["start_page"],
+            last_page=job["end_page"],
+            min_delay=min_delay,
+            max_delay=max_delay
             )
 
-        print(f"{request_mode}: {file_path} 병합됨.\n")
-        
-        # 데이터 삭제
-        json_parser.remove_geekbench_data()
-        avg_delay.clear()
+    completed_page = job["start_page"] - 1
+
+    with NDJSONResultLog(log_path=result_path) as result_log:
+        async with aclosing(search_client):
+            async for page, current_page, _, _ in search_client:
+                for parsed_result in page.results:
+                    for url, details in parsed_result.items():
+                        result_log.append(query=job["query"], page_number=current_page, result_url=url, details=details)
+                completed_page = current_page
+
+                # 페이지마다 임대 연장 (다른 작업자가 가져간 경우 중단)
+                if not job_queue.renew(job_id=job["job_id"], worker_id=worker_id):
+                    raise RuntimeError(f"Lease lost for job {job['job_id']}.")
+
+    # 범위 끝까지 수집하지 못했으면 마지막 페이지에 도달한 것
+    return completed_page if completed_page < job["end_page"] else None
+
+
+def _save_metrics_snapshot(metrics_path: str = None) -> None:
+    # 지표 스냅샷(JSON) 기록 (경로가 없으면 기록하지 않음)
+    if metrics_path is not None:
+        get_global_metrics().save_snapshot(file_path=metrics_path)
+        print(f"지표 스냅샷: {metrics_path} 기록됨.")
+
+
+@asynccontextmanager
+async def _api_requester_scope(api_requester: AsyncGeekBenchBrowserAPI = None):
+    # 주어진 API는 호출자가 세션 수명을 관리하므로 그대로 사용
+    if api_requester is not None:
+        yield api_requester
+    else:
+        async with AsyncGeekBenchBrowserAPI() as api_requester:
+            yield api_requester
+
+
+@asynccontextmanager
+async def _parse_pool_scope(parse_pool: GeekBenchParsePool = None, parse_workers: int = 0):
+    # 주어진 프로세스 풀은 호출자가 수명을 관리하므로 그대로 사용
+    if parse_pool is not None or parse_workers <= 0:
+        yield parse_pool
+    else:
+        async with GeekBenchParsePool(max_workers=parse_workers) as parse_pool:
+            yield parse_pool
 
 
 async def _fetch_and_log_geekbench_data(
@@ -188,38 +931,97 @@ async def _fetch_and_log_geekbench_data(
     total_pages: int,
     min_delay: float,
     max_delay: float,
-    avg_delay: float
-    ) -> None:
+    progress_reporter: GeekBenchProgressReporter,
+    concurrency: int = 1,
+    parse_pool: GeekBenchParsePool = None,
+    stop_at_id: int = None,
+    storage: GeekBenchStorage = None,
+    checkpoint: GeekBenchCheckpoint = None
+    ) -> tuple[int, bool]:
+    # (수집된 새 결과 수, 끝까지 수집했는지 여부) 반환
+    # 워터마크 또는 마지막 페이지에 도달하기 전에 수집 페이지 수(last_page)를 모두 사용하면 끝까지 수집하지 않은 것
 
-    start_time = get_current_time()  # 시작 시간 기록
+    new_results = 0 # 수집된 새 결과 수 (워터마크보다 큰 고유 번호)
+    last_page = total_pages if last_page is None else last_page
+    fetched_page = start_page - 1 # 마지막으로 수집한 페이지
+    reached_end = False
             
     print(query, ":", total_pages)
 
-    async for result, current_page, current_last_page, random_sleep, in api_requester.search_client(
-        search_type=search_type,
-        query=query,
-        start_page=start_page,
-        last_page=total_pages if last_page is None else last_page,
-        min_delay=min_delay,
-        max_delay=max_delay
-        ):
-
-        for parsed_result in GeekBenchSearchParser.parse_search_benchmark(benchmark_type=search_type, content=result):
-            json_parser.store_geekbench_data(query=query, page_number=current_page, parsed_data=parsed_result)
-
-        # 진행 상황 로그
-        log_progress(
-            request_mode=request_mode,
-            start_time=start_time,
+    # 진행 상황 기록 시작 (예상 남은 시간은 페이지당 실제 소요 시간으로 계산)
+    progress_reporter.start(query=query, request_mode=request_mode, total_pages=total_pages, start_page=start_page)
+
+    # 동시 요청 모드: 전역 속도 제한 아래에서 concurrency개의 페이지를 동시에 요청 (결과는 페이지 순서대로 반환)
+    # 프로세스 풀이 있으면 HTML 파싱을 작업 프로세스에서 요청과 병렬로 수행
+    if concurrency > 1 or parse_pool is not None:
+        search_client = api_requester.concurrent_search_client(
+            search_type=search_type,
+            query=query,
+            start_page=start_page,
+            last_page=last_page,
+            concurrency=concurrency,
+            parse_pool=parse_pool
+            )
+    else:
+        search_client = api_requester.search_client(
+            search_type=search_type,
             query=query,
-            total_pages=total_pages,
-            current_page=current_page,
-            current_last_page=current_last_page,
-            random_sleep=random_sleep,
+            start_page=start_page,
+            last_page=last_page,
             min_delay=min_delay,
-            max_delay=max_delay,
-            avg_delay=avg_delay
-        )
+            max_delay=max_delay
+            )
+
+    try:
+        # 중간에 수집을 멈춰도 남은 요청이 바로 정리되도록 명시적으로 종료
+        async with aclosing(search_client):
+            async for page, current_page, current_last_page, random_sleep, in search_client:
+                fetched_page = current_page
+
+                new_results += sum(
+                    1 for parsed_result in page.results for url in parsed_result
+                    if stop_at_id is None or GeekBenchJSONParser.extract_result_id(url) > stop_at_id
+                    )
+
+                # 이미 파싱된 페이지 객체의 결과 행 사용 (저장소가 있으면 페이지 단위로 upsert)
+                if storage is not None:
+                    with storage_timer(operation="store_page", backend=type(storage).__name__):
+                        storage.store_page(search_type=search_type, query=query, page_number=current_page, parsed_results=page.results)
+                else:
+                    with storage_timer(operation="store_page", backend="json"):
+                        for parsed_result in page.results:
+                            json_parser.store_geekbench_data(query=query, page_number=current_page, parsed_data=parsed_result)
+                get_global_metrics().counter("geekbench_stored_results_total", "Result rows handed to storage.").inc(len(page.results), query=query)
+
+                # 완료된 페이지 기록 (checkpoint_interval 페이지마다 부분 결과와 함께 디스크에 기록)
+                if checkpoint is not None and checkpoint.page_completed(current_page=current_page):
+                    _save_checkpoint(checkpoint=checkpoint, api_requester=api_requester, json_parser=json_parser, storage=storage)
+
+                # 워터마크 이하의 결과만 있는 페이지에 도달하면 수집 중단 (이후 페이지는 모두 저장된 결과)
+                if stop_at_id is not None and page.results and all(
+                    GeekBenchJSONParser.extract_result_id(url) <= stop_at_id
+                    for parsed_result in page.results
+                    for url in parsed_result
+                    ):
+                    print(f"{query}: {current_page} 페이지에서 워터마크({stop_at_id}) 도달, 수집 중단\n")
+                    reached_end = True
+                    break
+
+                # 진행 상황 갱신 (출력은 progress_interval초마다 한 번)
+                progress_reporter.update(
+                    query=query,
+                    current_page=current_page,
+                    current_last_page=current_last_page,
+                    page_delay=random_sleep,
+                    results=len(page.results)
+                )
+    finally:
+        # 수집 종료 (중단된 경우에도 진행 상황 기록 종료)
+        progress_reporter.finish(query=query)
+
+    # 마지막 페이지("did not match any")에 도달하면 수집 페이지 수보다 먼저 종료
+    reached_end = reached_end or fetched_page < last_page
+    return new_results, reached_end
 
 
 # 사용 예시
@@ -264,6 +1066,38 @@ if __name__ == "__main__":
     # )
 
 
+    # 캐시된 원본 HTML로 다시 파싱 (네트워크 요청 없음, 수집 시 response_cache를 지정한 경우)
+    async def reparse_cached_geekbench_data():
+        response_cache = GeekBenchResponseCache(cache_dir=r"geekbench_data_cache")
+        async with AsyncGeekBenchBrowserAPI(response_cache=response_cache, replay=True) as api_requester:
+            await new_geekbench_data(
+                search_type="cpu",
+                query_data=new_query_data,
+                start_page=1,
+                last_page=99999,
+                default_pages=99999,
+                min_delay=0,
+                max_delay=0,
+                concurrency=8,
+                api_requester=api_requester
+            )
+
+    # asyncio.run(reparse_cached_geekbench_data())
+
+
+    # 코디네이터/작업자 모드 (작업자는 같은 큐 디렉토리를 공유하는 다른 머신에서도 실행 가능)
+    # asyncio.run(
+    #     enqueue_geekbench_jobs(
+    #         search_type="cpu",
+    #         query_data=new_query_data,
+    #         default_pages=99999,
+    #         pages_per_job=20
+    #     )
+    # )
+    # run_geekbench_workers(num_workers=4, requests_per_second=2.0, burst=2, min_delay=0, max_delay=0)
+    # merge_geekbench_jobs()
+
+
     # 새로운 데이터 및 기존 데이터 병합 (순차 처리)
     merge_query_data = \
         [
@@ -301,15 +1135,56 @@ if __name__ == "__main__":
             ]
         ]
 
-    for query_data in merge_query_data:
-        asyncio.run(
-            merge_geekbench_data(
+    # 예상 새 결과 수 순으로 요청 예산을 배분하여 병합 (자주 업데이트되는 기기를 우선 수집)
+    # asyncio.run(
+    #     scheduled_merge_geekbench_data(
+    #         search_type="cpu",
+    #         query_data=[query for query_group in merge_query_data for query in query_group],
+    #         max_requests=500
+    #     )
+    # )
+
+
+    # 저장된 결과의 상세 페이지(워크로드별 점수, 시스템 정보) 수집 (이미 처리된 결과는 건너뜀)
+    # asyncio.run(
+    #     enrich_geekbench_data(
+    #         search_type="cpu",
+    #         query_data=new_query_data,
+    #         concurrency=4,
+    #         requests_per_second=2.0
+    #     )
+    # )
+
+
+    # 수집 중 지표를 Prometheus 텍스트 형식으로 제공 (http://127.0.0.1:9108/metrics), 종료 시 JSON 스냅샷 기록
+    async def merge_geekbench_data_with_metrics():
+        async with MetricsServer(port=9108):
+            await merge_geekbench_data(
                 search_type="cpu",
-                query_data=query_data,
-                start_page=1,
-                default_pages=99999,
+                query_data=merge_query_data[0],
                 min_delay=0.5,
                 max_delay=2,
-                add_pages=5
+                metrics_path=r"geekbench_data_json\metrics.json"
             )
-        )
\ No newline at end of file
+
+    # asyncio.run(merge_geekbench_data_with_metrics())
+
+
+    async def merge_all_geekbench_data():
+        # 모든 쿼리 그룹이 하나의 이벤트 루프와 커넥션 풀 세션을 공유
+        # (변경되지 않은 페이지는 조건부 요청의 304 응답으로 이전 파싱 결과 재사용)
+        with GeekBenchValidatorStore(db_path=r"geekbench_data_db\validators.sqlite3") as validator_store:
+            async with AsyncGeekBenchBrowserAPI(validator_store=validator_store) as api_requester:
+                for query_data in merge_query_data:
+                    await merge_geekbench_data(
+                        search_type="cpu",
+                        query_data=query_data,
+                        start_page=1,
+                        default_pages=99999,
+                        min_delay=0.5,
+                        max_delay=2,
+                        add_pages=5,
+                        api_requester=api_requester
+                    )
+
+    asyncio.run(merge_all_geekbench_data())
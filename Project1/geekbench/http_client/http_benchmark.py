@@ -0,0 +1,234 @@
+import json
+import os
+import platform
+import shutil
+import tempfile
+import time
+
+try:
+    from http_fixtures import GeekBenchFixtureGenerator
+    from http_parser import GeekBenchSearchParser, GeekBenchSearchPage, PARSER_ENGINES, get_parser_engine
+    from http_json_parser import GeekBenchJSONParser
+    from utils.http_utils import is_last_page, fetch_total_pages_parser
+except ImportError:
+    from .http_fixtures import GeekBenchFixtureGenerator
+    from .http_parser import GeekBenchSearchParser, GeekBenchSearchPage, PARSER_ENGINES, get_parser_engine
+    from .http_json_parser import GeekBenchJSONParser
+    from .utils.http_utils import is_last_page, fetch_total_pages_parser
+
+
+# 저장 단계 벤치마크 기본 결과 수
+DEFAULT_STORAGE_SIZES = (10_000, 100_000, 1_000_000)
+
+# 이전 결과보다 처리량이 이 비율 이상 낮으면 회귀로 판정
+DEFAULT_REGRESSION_TOLERANCE = 0.2
+
+
+def _measure(function, repeat: int) -> float:
+    # repeat번 실행 중 가장 짧은 시간(초) (다른 프로세스의 영향 최소화)
+    best_seconds = None
+    for _ in range(max(1, repeat)):
+        start_time = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start_time
+        best_seconds = elapsed if best_seconds is None else min(best_seconds, elapsed)
+
+    return best_seconds
+
+
+def _result(name: str, search_type: str, size: int, unit: str, seconds: float, **labels) -> dict:
+    return {
+        "name": name,
+        "search_type": search_type,
+        "size": size,
+        "unit": unit,
+        "seconds": seconds,
+        "rate": size / seconds if seconds > 0 else None,
+        **labels,
+    }
+
+
+def benchmark_parsers(generator: GeekBenchFixtureGenerator = None, search_types: tuple = ("cpu", "gpu", "ai"), pages: int = 50, repeat: int = 3) -> list[dict]:
+    """합성 검색 페이지로 파서 함수별 초당 처리 페이지 수(pages/sec) 측정."""
+    generator = GeekBenchFixtureGenerator() if generator is None else generator
+    query = "benchmark"
+    total_pages = pages * 10 # 페이지네이션 링크가 잘리도록 실제 페이지보다 크게 지정
+    results = list()
+
+    for search_type in search_types:
+        documents = [generator.search_page_html(search_type=search_type, query=query, page=page, total_pages=total_pages) for page in range(1, pages + 1)]
+        empty_document = generator.empty_search_page_html(search_type=search_type, query=query)
+
+        # 결과 행 파싱 (BeautifulSoup 파싱 포함)
+        seconds = _measure(lambda: [list(GeekBenchSearchParser.parse_search_benchmark(benchmark_type=search_type, content=document)) for document in documents], repeat=repeat)
+        results.append(_result(name="parse_search_benchmark", search_type=search_type, size=pages, unit="pages", seconds=seconds))
+
+        # 마지막 페이지 확인 (결과 페이지와 "did not match any" 페이지를 번갈아 확인)
+        last_page_documents = [empty_document if index % 2 else document for index, document in enumerate(documents)]
+        seconds = _measure(lambda: [is_last_page(content=document) for document in last_page_documents], repeat=repeat)
+        results.append(_result(name="is_last_page", search_type=search_type, size=pages, unit="pages", seconds=seconds))
+
+        # 페이지 수 파싱
+        seconds = _measure(lambda: [fetch_total_pages_parser(content=document, default_pages=0) for document in documents], repeat=repeat)
+        results.append(_result(name="fetch_total_pages_parser", search_type=search_type, size=pages, unit="pages", seconds=seconds))
+
+        # 파서 엔진별 한 번 파싱으로 결과, 마지막 페이지 여부, 페이지 수 계산 (요청 단계에서 실제로 사용하는 경로)
+        for engine_name in PARSER_ENGINES:
+            try:
+                engine = get_parser_engine(engine_name)
+            except ValueError:
+                continue # 설치되지 않은 엔진은 건너뜀
+
+            def parse_pages():
+                for document in documents:
+                    page = GeekBenchSearchPage(benchmark_type=search_type, content=document, engine=engine)
+                    page.results, page.is_last_page, page.max_page_number
+
+            seconds = _measure(parse_pages, repeat=repeat)
+            results.append(_result(name="search_page", search_type=search_type, size=pages, unit="pages", seconds=seconds, engine=engine_name))
+
+    return results
+
+
+def benchmark_storage(generator: GeekBenchFixtureGenerator = None, search_type: str = "cpu", sizes: tuple = DEFAULT_STORAGE_SIZES, repeat: int = 1, work_dir: str = None) -> list[dict]:
+    """합성 결과로 병합, 페이지 구성, JSON 저장의 초당 처리 결과 수(records/sec) 측정."""
+    generator = GeekBenchFixtureGenerator() if generator is None else generator
+    json_parser = GeekBenchJSONParser()
+    query = "benchmark"
+    results = list()
+
+    # JSON 저장 위치 (지정하지 않으면 임시 디렉토리를 만들고 측정 후 삭제)
+    owns_work_dir = work_dir is None
+    work_dir = tempfile.mkdtemp(prefix="geekbench_benchmark_") if owns_work_dir else work_dir
+
+    try:
+        for size in sizes:
+            # 기존 결과 size개와, 그중 최신 5%와 겹치는 새 결과 (새 결과 수집 후 병합하는 경우와 같은 형태)
+            old_data = generator.paginated_data(search_type=search_type, query=query, result_count=size)
+            new_count = max(1, size // 10)
+            new_generator = GeekBenchFixtureGenerator(seed=generator.seed, results_per_page=generator.results_per_page, top_result_id=generator.top_result_id + new_count // 2)
+            new_data = new_generator.paginated_data(search_type=search_type, query=query, result_count=new_count)
+
+            seconds = _measure(lambda: json_parser.merge_geekbench_data(new_data_path=new_data, old_data_path=old_data), repeat=repeat)
+            results.append(_result(name="merge_geekbench_data", search_type=search_type, size=size + new_count, unit="records", seconds=seconds))
+
+            # 이미 정렬된 {query: {url: details}}를 25개 단위 페이지로 구성
+            flat_data = {query: {url: details for page_data in old_data[query].values() for url, details in page_data.items()}}
+            seconds = _measure(lambda: json_parser._paginate_data(data=flat_data), repeat=repeat)
+            results.append(_result(name="_paginate_data", search_type=search_type, size=size, unit="records", seconds=seconds))
+            del flat_data
+
+            file_path = os.path.join(work_dir, f"{query}_{size}.json")
+            seconds = _measure(lambda: GeekBenchJSONParser.save_data_to_json(file_path=file_path, data=old_data), repeat=repeat)
+            results.append(_result(name="save_data_to_json", search_type=search_type, size=size, unit="records", seconds=seconds, file_bytes=os.path.getsize(file_path)))
+
+            # 저장된 기존 파일과 병합하여 페이지 단위로 바로 기록 (병합 단계의 실제 경로)
+            merged_path = os.path.join(work_dir, f"{query}_{size}_merged.json")
+            seconds = _measure(lambda: json_parser.merge_geekbench_data_to_file(save_file_path=merged_path, new_data_path=new_data, old_data_path=file_path), repeat=repeat)
+            results.append(_result(name="merge_geekbench_data_to_file", search_type=search_type, size=size + new_count, unit="records", seconds=seconds))
+            os.remove(merged_path)
+            os.remove(file_path)
+
+    finally:
+        if owns_work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    return results
+
+
+def run_benchmarks(output_path: str = None, label: str = None, pages: int = 50, sizes: tuple = DEFAULT_STORAGE_SIZES, parser_repeat: int = 3, storage_repeat: int = 1, seed: int = 0) -> dict:
+    """파서 및 저장 단계 벤치마크를 실행하고 결과를 JSON으로 기록 (버전 간 회귀 비교용)."""
+    generator = GeekBenchFixtureGenerator(seed=seed)
+
+    report = {
+        "label": label, # 비교할 버전 이름 (예: 커밋 해시)
+        "created_at": time.time(),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "parser_engines": [engine_name for engine_name in PARSER_ENGINES if _is_engine_available(engine_name)],
+        },
+        "options": {"pages": pages, "sizes": list(sizes), "parser_repeat": parser_repeat, "storage_repeat": storage_repeat, "seed": seed},
+        "results": list(),
+    }
+
+    report["results"].extend(benchmark_parsers(generator=generator, pages=pages, repeat=parser_repeat))
+    for search_type in ("cpu", "ai"):
+        report["results"].extend(benchmark_storage(generator=generator, search_type=search_type, sizes=sizes, repeat=storage_repeat))
+
+    if output_path is not None:
+        save_benchmark_results(file_path=output_path, report=report)
+
+    return report
+
+
+def _is_engine_available(engine_name: str) -> bool:
+    try:
+        get_parser_engine(engine_name)
+    except ValueError:
+        return False
+    return True
+
+
+def save_benchmark_results(file_path: str, report: dict) -> None:
+    # 디렉토리가 존재하지 않으면 생성
+    if os.path.dirname(file_path):
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+    with open(file_path, 'w', encoding='utf-8') as json_file:
+        json.dump(report, json_file, ensure_ascii=False, indent=4)
+
+
+def load_benchmark_results(file_path: str) -> dict:
+    with open(file_path, 'r', encoding='utf-8') as json_file:
+        return json.load(json_file)
+
+
+def _result_key(result: dict) -> tuple:
+    return (result["name"], result["search_type"], result["size"], result.get("engine"))
+
+
+def compare_benchmark_results(baseline: dict, current: dict, tolerance: float = DEFAULT_REGRESSION_TOLERANCE) -> list[dict]:
+    """같은 항목의 처리량을 비교하여 baseline 대비 tolerance 비율 이상 느려진 항목 반환."""
+    baseline_rates = {_result_key(result): result["rate"] for result in baseline["results"] if result.get("rate")}
+
+    regressions = list()
+    for result in current["results"]:
+        baseline_rate = baseline_rates.get(_result_key(result))
+        if baseline_rate is None or not result.get("rate"):
+            continue
+
+        change = result["rate"] / baseline_rate - 1
+        if change < -tolerance:
+            regressions.append({
+                "name": result["name"],
+                "search_type": result["search_type"],
+                "size": result["size"],
+                "engine": result.get("engine"),
+                "baseline_rate": baseline_rate,
+                "rate": result["rate"],
+                "change": change,
+            })
+
+    return regressions
+
+
+def format_benchmark_results(report: dict) -> str:
+    lines = list()
+    for result in report["results"]:
+        name = result["name"] if result.get("engine") is None else f"{result['name']}[{result['engine']}]"
+        lines.append(f"{name:<32} {result['search_type']:<4} {result['size']:>10,} {result['unit']:<8} {result['seconds']:>10.4f}초 {result['rate']:>14,.1f} {result['unit']}/sec")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # 사용 예시: 현재 버전 측정 후 이전 결과와 비교
+    report = run_benchmarks(output_path=r"geekbench_benchmark\current.json", label="current")
+    print(format_benchmark_results(report))
+
+    baseline_path = r"geekbench_benchmark\baseline.json"
+    if os.path.exists(baseline_path):
+        for regression in compare_benchmark_results(baseline=load_benchmark_results(baseline_path), current=report):
+            print(f"회귀: {regression['name']} {regression['search_type']} {regression['size']:,} ({regression['change']:+.1%})")
@@ -0,0 +1,132 @@
+import gzip
+import hashlib
+import json
+import os
+import time
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# 압축 방식별 파일 확장자
+COMPRESSION_EXTENSIONS = {
+    "gzip": ".html.gz",
+    "zstd": ".html.zst",
+}
+
+
+class GeekBenchResponseCache:
+    def __init__(self, cache_dir: str, compression: str = None, compression_level: int = None):
+        """원본 검색 페이지 HTML을 압축하여 내용 해시로 저장하는 디스크 캐시."""
+        # 압축 방식 (None이면 zstandard가 설치된 경우 zstd, 아니면 gzip)
+        if compression is None:
+            compression = "gzip" if zstandard is None else "zstd"
+        if compression not in COMPRESSION_EXTENSIONS:
+            raise ValueError("Invalid compression. Use 'gzip' or 'zstd'.")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstandard is not installed. Use compression='gzip' instead.")
+
+        self.cache_dir = cache_dir
+        self.compression = compression
+        self.compression_level = compression_level
+
+        # 본문 파일 디렉토리 및 (search_type, query, page, 요청 시각) 색인 파일
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        self.index_path = os.path.join(cache_dir, "index.ndjson")
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+        # 메모리 색인: {(search_type, query, page): [(요청 시각, 해시, 압축 방식), ...]}
+        self._index = dict()
+        self._load_index()
+
+    def _load_index(self) -> None:
+        if not os.path.exists(self.index_path):
+            return
+
+        with open(self.index_path, 'r', encoding='utf-8') as index_file:
+            for line in index_file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue # 비정상 종료로 잘린 줄은 건너뜀
+                self._add_index_entry(entry)
+
+    def _add_index_entry(self, entry: dict) -> None:
+        key = (entry["search_type"], entry["query"], entry["page"])
+        self._index.setdefault(key, list()).append((entry["fetched_at"], entry["digest"], entry["compression"]))
+
+    def _object_path(self, digest: str, compression: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest + COMPRESSION_EXTENSIONS[compression])
+
+    def _compress(self, body: bytes) -> bytes:
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=self.compression_level or 10).compress(body)
+        return gzip.compress(body, compresslevel=self.compression_level or 6)
+
+    @staticmethod
+    def _decompress(data: bytes, compression: str) -> bytes:
+        if compression == "zstd":
+            if zstandard is None:
+                raise ValueError("zstandard is not installed. Cannot read zstd cache entries.")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def store(self, search_type: str, query: str, page: int, content: str, fetched_at: float = None) -> str:
+        # 본문을 압축하여 저장하고 색인에 기록 (같은 본문은 한 번만 저장)
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        body = content.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()
+
+        object_path = self._object_path(digest=digest, compression=self.compression)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+
+            # 임시 파일에 쓴 뒤 교체 (중단되어도 손상된 본문이 남지 않도록)
+            temp_path = f"{object_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as object_file:
+                object_file.write(self._compress(body))
+            os.replace(temp_path, object_path)
+
+        entry = {
+            "search_type": search_type,
+            "query": query,
+            "page": int(page),
+            "fetched_at": fetched_at,
+            "digest": digest,
+            "compression": self.compression,
+        }
+        with open(self.index_path, 'a', encoding='utf-8') as index_file:
+            index_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._add_index_entry(entry)
+
+        return digest
+
+    def load(self, search_type: str, query: str, page: int, fetched_before: float = None) -> str | None:
+        # 가장 최근에 저장된 본문 반환 (fetched_before가 주어지면 그 시각 이전 중 가장 최근)
+        entries = self._index.get((search_type, query, int(page)), list())
+        if fetched_before is not None:
+            entries = [entry for entry in entries if entry[0] <= fetched_before]
+        if not entries:
+            return None
+
+        fetched_at, digest, compression = max(entries)
+        with open(self._object_path(digest=digest, compression=compression), 'rb') as object_file:
+            return self._decompress(object_file.read(), compression=compression).decode("utf-8")
+
+    def history(self, search_type: str, query: str, page: int) -> list[tuple[float, str]]:
+        # (요청 시각, 해시) 목록을 시간순으로 반환
+        return sorted((fetched_at, digest) for fetched_at, digest, _ in self._index.get((search_type, query, int(page)), list()))
+
+    def pages(self, search_type: str, query: str) -> list[int]:
+        # 캐시에 저장된 페이지 번호 목록
+        return sorted(page for (cached_type, cached_query, page) in self._index if cached_type == search_type and cached_query == query)
+
+
+if __name__ == "__main__":
+    # 사용 예시
+    cache = GeekBenchResponseCache(cache_dir=r"geekbench_data_cache")
+    cache.store(search_type="cpu", query="samsung s5e9945", page=1, content="<html></html>")
+    print(cache.load(search_type="cpu", query="samsung s5e9945", page=1))
+    print(cache.pages(search_type="cpu", query="samsung s5e9945"))
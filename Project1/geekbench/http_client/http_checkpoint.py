@@ -0,0 +1,114 @@
+import json
+import os
+import time
+
+
+class GeekBenchCheckpoint:
+    def __init__(
+        self,
+        checkpoint_path: str,
+        search_type: str,
+        query: str,
+        request_mode: str,
+        total_pages: int,
+        last_completed_page: int = None,
+        rate_snapshot: dict = None,
+        interval: int = 10
+        ):
+        """쿼리별 수집 진행 상황(마지막 완료 페이지, 요청 속도)을 기록하는 체크포인트."""
+        self.checkpoint_path = checkpoint_path
+        self.search_type = search_type
+        self.query = query
+        self.request_mode = request_mode
+        self.total_pages = total_pages
+        self.last_completed_page = last_completed_page # 결과가 디스크에 기록된 마지막 페이지
+        self.rate_snapshot = rate_snapshot # AIMDRateController.snapshot()
+        self.interval = interval # 체크포인트를 기록할 페이지 간격
+
+        self._pages_since_save = 0
+
+    @staticmethod
+    def get_checkpoint_path(checkpoint_dir: str, query: str) -> str:
+        return rf"{checkpoint_dir}\{query}.checkpoint.json"
+
+    @staticmethod
+    def get_results_path(checkpoint_dir: str, query: str) -> str:
+        # 체크포인트와 함께 사용하는 부분 결과 로그 (NDJSON)
+        return rf"{checkpoint_dir}\{query}_1.ndjson"
+
+    @staticmethod
+    def load(checkpoint_path: str) -> "GeekBenchCheckpoint | None":
+        if not os.path.exists(checkpoint_path):
+            return None
+
+        with open(checkpoint_path, 'r', encoding='utf-8') as json_file:
+            state = json.load(json_file)
+
+        return GeekBenchCheckpoint(
+            checkpoint_path=checkpoint_path,
+            search_type=state["search_type"],
+            query=state["query"],
+            request_mode=state["request_mode"],
+            total_pages=state["total_pages"],
+            last_completed_page=state["last_completed_page"],
+            rate_snapshot=state.get("rate_snapshot"),
+            interval=state.get("interval", 10)
+            )
+
+    def matches(self, search_type: str, request_mode: str) -> bool:
+        # 같은 검색 종류와 요청 모드로 기록된 체크포인트인지 확인 (다르면 이어서 수집할 수 없음)
+        return self.search_type == search_type and self.request_mode == request_mode
+
+    def resume_page(self, start_page: int) -> int:
+        # 이어서 수집할 첫 페이지 (완료된 페이지는 다시 요청하지 않음)
+        if self.last_completed_page is None:
+            return start_page
+        return max(start_page, self.last_completed_page + 1)
+
+    def page_completed(self, current_page: int) -> bool:
+        # 페이지 완료 기록 후 체크포인트를 기록할 차례인지 반환
+        self.last_completed_page = current_page
+        self._pages_since_save += 1
+        return self._pages_since_save >= self.interval
+
+    def save(self, rate_controller: object = None) -> None:
+        # 부분 결과를 먼저 디스크에 기록한 뒤 호출해야 함 (체크포인트가 결과보다 앞서지 않도록)
+        if rate_controller is not None:
+            self.rate_snapshot = rate_controller.snapshot()
+
+        state = {
+            "search_type": self.search_type,
+            "query": self.query,
+            "request_mode": self.request_mode,
+            "total_pages": self.total_pages,
+            "last_completed_page": self.last_completed_page,
+            "rate_snapshot": self.rate_snapshot,
+            "interval": self.interval,
+            "updated_at": time.time(),
+        }
+
+        # 디렉토리가 존재하지 않으면 생성
+        if os.path.dirname(self.checkpoint_path):
+            os.makedirs(os.path.dirname(self.checkpoint_path), exist_ok=True)
+
+        # 임시 파일에 쓰고 디스크 동기화 후 교체 (기록 중 종료되어도 이전 체크포인트 유지)
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as json_file:
+            json.dump(state, json_file, ensure_ascii=False)
+            json_file.flush()
+            os.fsync(json_file.fileno())
+        os.replace(temp_path, self.checkpoint_path)
+
+        self._pages_since_save = 0
+
+    def remove(self) -> None:
+        # 수집 및 저장이 끝난 쿼리의 체크포인트 삭제
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+
+if __name__ == "__main__":
+    # 사용 예시
+    checkpoint_path = GeekBenchCheckpoint.get_checkpoint_path(checkpoint_dir=r"geekbench_data_checkpoint", query="samsung s5e9945")
+    checkpoint = GeekBenchCheckpoint.load(checkpoint_path=checkpoint_path)
+    print("이어서 수집할 페이지:", 1 if checkpoint is None else checkpoint.resume_page(start_page=1))
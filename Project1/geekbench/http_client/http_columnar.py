@@ -0,0 +1,251 @@
+from array import array
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+try:
+    from http_json_parser import GeekBenchJSONParser
+    from http_ndjson import NDJSONResultLog
+except ImportError:
+    from .http_json_parser import GeekBenchJSONParser
+    from .http_ndjson import NDJSONResultLog
+
+
+# 검색 유형별 컬럼 스키마 (컬럼 이름: 자료형)
+# "dictionary"는 사전 인코딩 문자열 (int32 코드 + 범주 배열)
+COLUMNAR_SCHEMAS = {
+    "cpu": {
+        "result_id": "int64",
+        "device_name": "dictionary",
+        "cpu_model": "dictionary",
+        "platform": "dictionary",
+        "upload_date": "date32",
+        "single": "int32",
+        "multi": "int32",
+    },
+    "gpu": {
+        "result_id": "int64",
+        "device_name": "dictionary",
+        "cpu_model": "dictionary",
+        "platform": "dictionary",
+        "upload_date": "date32",
+        "api_name": "dictionary",
+        "api_score": "int32",
+    },
+    "ai": {
+        "result_id": "int64",
+        "device_name": "dictionary",
+        "cpu_model": "dictionary",
+        "framework_name": "dictionary",
+        "single_precision": "int32",
+        "half_precision": "int32",
+        "quantized": "int32",
+    },
+}
+
+# 정수 컬럼의 결측값
+INT32_MISSING = np.iinfo(np.int32).min
+
+
+def _extract_fields(result_url: str, details: dict) -> dict:
+    # 결과 딕셔너리를 평탄한 필드로 변환
+    system = details.get("system", {})
+    upload_date = details.get("upload_date") or {}
+    core_scores = details.get("core_scores", {})
+
+    fields = {
+        "result_id": GeekBenchJSONParser.extract_result_id(result_url),
+        "device_name": system.get("device_name"),
+        "cpu_model": system.get("cpu_model"),
+        "platform": details.get("platform"),
+        "upload_date": upload_date.get("parsed"),
+        "framework_name": details.get("framework_name"),
+    }
+    fields.update(core_scores)
+
+    return fields
+
+
+class GeekBenchColumnarBuilder:
+    def __init__(self, search_type: str):
+        """결과를 한 건씩 받아 컬럼 버퍼에 추가하는 빌더 (중첩 딕셔너리를 만들지 않음)."""
+        if search_type not in COLUMNAR_SCHEMAS:
+            raise ValueError("Invalid search type. Use 'cpu', 'gpu', or 'ai'.")
+
+        self.search_type = search_type
+        self.schema = COLUMNAR_SCHEMAS[search_type]
+
+        # 컬럼별 버퍼 (정수는 array 모듈로 압축 저장)
+        self._buffers = dict()
+        self._categories = dict() # 사전 인코딩 컬럼: {문자열: 코드}
+        for column, column_type in self.schema.items():
+            if column_type == "int64":
+                self._buffers[column] = array("q")
+            elif column_type in ("int32", "dictionary"):
+                self._buffers[column] = array("i")
+            elif column_type == "date32":
+                self._buffers[column] = list()
+
+            if column_type == "dictionary":
+                self._categories[column] = dict()
+
+    def __len__(self) -> int:
+        return len(self._buffers["result_id"])
+
+    def append(self, result_url: str, details: dict) -> None:
+        fields = _extract_fields(result_url=result_url, details=details)
+
+        for column, column_type in self.schema.items():
+            value = fields.get(column)
+
+            if column_type == "dictionary":
+                # 결측값은 코드 -1
+                if value is None:
+                    self._buffers[column].append(-1)
+                else:
+                    self._buffers[column].append(self._categories[column].setdefault(value, len(self._categories[column])))
+
+            elif column_type == "date32":
+                self._buffers[column].append("NaT" if value is None else value)
+
+            elif column_type == "int32":
+                self._buffers[column].append(INT32_MISSING if value is None else int(value))
+
+            else:
+                self._buffers[column].append(int(value))
+
+    def extend(self, results) -> None:
+        # (result_url, details) 반복자를 페이지 단위로 소비
+        for result_url, details in results:
+            self.append(result_url=result_url, details=details)
+
+    def build(self) -> "GeekBenchColumnarTable":
+        columns = dict()
+        categories = dict()
+
+        for column, column_type in self.schema.items():
+            if column_type == "int64":
+                columns[column] = np.frombuffer(self._buffers[column], dtype=np.int64).copy()
+            elif column_type in ("int32", "dictionary"):
+                columns[column] = np.frombuffer(self._buffers[column], dtype=np.int32).copy()
+            elif column_type == "date32":
+                columns[column] = np.array(self._buffers[column], dtype="datetime64[D]")
+
+            if column_type == "dictionary":
+                # 코드 순서대로 범주 배열 생성
+                categories[column] = np.array(list(self._categories[column]), dtype=object)
+
+        return GeekBenchColumnarTable(search_type=self.search_type, columns=columns, categories=categories)
+
+
+class GeekBenchColumnarTable:
+    def __init__(self, search_type: str, columns: dict, categories: dict):
+        """검색 유형별 스키마를 따르는 컬럼형 결과 (사전 인코딩 컬럼은 코드 배열과 범주 배열로 저장)."""
+        self.search_type = search_type
+        self.columns = columns
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(self.columns["result_id"])
+
+    def decode(self, column: str) -> np.ndarray:
+        # 사전 인코딩 컬럼을 문자열 배열로 변환 (결측값은 None)
+        if column not in self.categories:
+            return self.columns[column]
+
+        codes = self.columns[column]
+        values = np.empty(len(codes), dtype=object)
+        valid = codes >= 0
+        values[valid] = self.categories[column][codes[valid]]
+        return values
+
+    def equals(self, column: str, value: str) -> np.ndarray:
+        # 사전 인코딩 컬럼에서 값이 일치하는 행의 마스크 (문자열 비교 없이 코드로 비교)
+        matches = np.flatnonzero(self.categories[column] == value)
+        if len(matches) == 0:
+            return np.zeros(len(self), dtype=bool)
+        return self.columns[column] == matches[0]
+
+    def filter(self, mask: np.ndarray) -> "GeekBenchColumnarTable":
+        return GeekBenchColumnarTable(
+            search_type=self.search_type,
+            columns={column: values[mask] for column, values in self.columns.items()},
+            categories=self.categories
+            )
+
+    def to_structured_array(self) -> np.ndarray:
+        # NumPy 구조화 배열로 변환 (사전 인코딩 컬럼은 코드 유지)
+        dtype = [(column, values.dtype) for column, values in self.columns.items()]
+        structured = np.empty(len(self), dtype=dtype)
+        for column, values in self.columns.items():
+            structured[column] = values
+        return structured
+
+    def save_npz(self, file_path: str) -> None:
+        arrays = {f"column:{column}": values for column, values in self.columns.items()}
+        arrays.update({f"categories:{column}": values.astype(str) for column, values in self.categories.items()})
+        np.savez(file_path, search_type=np.array(self.search_type), **arrays)
+
+    @staticmethod
+    def load_npz(file_path: str) -> "GeekBenchColumnarTable":
+        with np.load(file_path, allow_pickle=False) as data:
+            columns = {key.split(":", 1)[1]: data[key] for key in data.files if key.startswith("column:")}
+            categories = {key.split(":", 1)[1]: data[key].astype(object) for key in data.files if key.startswith("categories:")}
+            return GeekBenchColumnarTable(search_type=str(data["search_type"]), columns=columns, categories=categories)
+
+    def to_arrow(self):
+        # pyarrow가 설치된 경우에만 사용 가능
+        if pa is None:
+            raise ValueError("pyarrow is not installed. Use save_npz() or to_structured_array() instead.")
+
+        arrow_columns = dict()
+        for column, values in self.columns.items():
+            if column in self.categories:
+                codes = pa.array(values, type=pa.int32(), mask=values < 0)
+                arrow_columns[column] = pa.DictionaryArray.from_arrays(codes, pa.array(self.categories[column].tolist(), type=pa.string()))
+            elif values.dtype.kind == "M":
+                arrow_columns[column] = pa.array(values, type=pa.date32())
+            elif values.dtype == np.int32:
+                arrow_columns[column] = pa.array(values, type=pa.int32(), mask=values == INT32_MISSING)
+            else:
+                arrow_columns[column] = pa.array(values, type=pa.int64())
+
+        return pa.table(arrow_columns)
+
+    def save_parquet(self, file_path: str) -> None:
+        pq.write_table(self.to_arrow(), file_path)
+
+
+def iter_json_file_results(file_path: str):
+    # 기존 페이지 단위 JSON 파일의 결과를 페이지 순서대로 반환
+    for _, _, result_url, details in GeekBenchJSONParser.iter_data_from_json(file_path=file_path):
+        yield result_url, details
+
+
+def iter_ndjson_results(log_path: str, query: str = None):
+    # NDJSON 로그의 결과를 기록된 순서대로 반환 (query가 주어지면 해당 쿼리만)
+    for record in NDJSONResultLog.iter_records(log_path=log_path):
+        if query is None or record["query"] == query:
+            yield record["url"], record["result"]
+
+
+def export_columnar(search_type: str, results) -> GeekBenchColumnarTable:
+    # (result_url, details) 반복자를 컬럼형 결과로 변환
+    # 예: storage.iter_results(query), iter_json_file_results(file_path), iter_ndjson_results(log_path)
+    builder = GeekBenchColumnarBuilder(search_type=search_type)
+    builder.extend(results)
+    return builder.build()
+
+
+if __name__ == "__main__":
+    # 사용 예시
+    table = export_columnar(search_type="cpu", results=iter_json_file_results(file_path=r"geekbench_data_json\samsung s5e9945_1.json"))
+    table.save_npz(r"geekbench_data_columnar\samsung s5e9945_1.npz")
+
+    # 필터링 예시: Android 플랫폼의 2025년 결과
+    mask = table.equals("platform", "Android") & (table.columns["upload_date"] >= np.datetime64("2025-01-01"))
+    print("결과 수:", len(table), "필터 결과 수:", mask.sum())
@@ -0,0 +1,287 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+
+try:
+    from http_json_parser import GeekBenchJSONParser
+    from http_json_stream import iter_json_events, GeekBenchJSONWriter
+    from http_parser import GeekBenchResultParser
+    from http_retry import GeekBenchFetchError
+    from http_metrics import get_global_metrics, storage_timer
+except ImportError:
+    from .http_json_parser import GeekBenchJSONParser
+    from .http_json_stream import iter_json_events, GeekBenchJSONWriter
+    from .http_parser import GeekBenchResultParser
+    from .http_retry import GeekBenchFetchError
+    from .http_metrics import get_global_metrics, storage_timer
+
+
+class GeekBenchEnrichmentStore:
+    def __init__(self, db_path: str, batch_size: int = 100):
+        """결과 상세 페이지 파싱 결과와 처리 완료 목록(done-set)을 보관하는 SQLite 저장소."""
+        self.db_path = db_path
+        self.batch_size = batch_size # 한 트랜잭션에 기록할 최대 행 수
+
+        # 디렉토리가 존재하지 않으면 생성
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+        # 아직 기록되지 않은 행
+        self._pending_rows = list()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _create_schema(self) -> None:
+        # status: "ok" (상세 정보 있음), "missing" (상세 페이지 없음, 다시 요청하지 않음)
+        with self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS enrichments (
+                    result_url TEXT PRIMARY KEY,
+                    result_id INTEGER NOT NULL,
+                    search_type TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    detail TEXT,
+                    enriched_at REAL NOT NULL
+                )
+                """
+            )
+
+    def add(self, search_type: str, result_url: str, detail: dict | None, status: str = "ok") -> None:
+        self._pending_rows.append((
+            result_url,
+            GeekBenchJSONParser.extract_result_id(result_url),
+            search_type,
+            status,
+            None if detail is None else json.dumps(detail, ensure_ascii=False),
+            time.time(),
+        ))
+
+        if len(self._pending_rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending_rows:
+            return
+
+        with storage_timer(operation="flush", backend="enrichment"), self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO enrichments (result_url, result_id, search_type, status, detail, enriched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                self._pending_rows
+            )
+
+        self._pending_rows.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self.connection.close()
+
+    def count(self, status: str = None) -> int:
+        self.flush()
+        if status is None:
+            return self.connection.execute("SELECT COUNT(*) FROM enrichments").fetchone()[0]
+        return self.connection.execute("SELECT COUNT(*) FROM enrichments WHERE status = ?", (status,)).fetchone()[0]
+
+    def _fetch_done(self, result_urls: list[str]) -> set:
+        placeholders = ", ".join("?" * len(result_urls))
+        cursor = self.connection.execute(f"SELECT result_url FROM enrichments WHERE result_url IN ({placeholders})", result_urls)
+        return {result_url for result_url, in cursor}
+
+    def iter_pending(self, result_urls, chunk_size: int = 500):
+        # 아직 처리되지 않은 결과 URL만 반환 (done-set은 chunk_size개씩 조회하여 메모리에 모두 올리지 않음)
+        self.flush()
+        chunk = list()
+        for result_url in result_urls:
+            chunk.append(result_url)
+            if len(chunk) >= chunk_size:
+                done = self._fetch_done(chunk)
+                yield from (url for url in chunk if url not in done)
+                chunk = list()
+
+        if chunk:
+            done = self._fetch_done(chunk)
+            yield from (url for url in chunk if url not in done)
+
+    def _fetch_details(self, result_urls: list[str]) -> dict:
+        # {result_url: 상세 정보} (상세 정보가 있는 결과만, 한 번의 조회)
+        if not result_urls:
+            return dict()
+        placeholders = ", ".join("?" * len(result_urls))
+        cursor = self.connection.execute(
+            f"SELECT result_url, detail FROM enrichments WHERE status = 'ok' AND detail IS NOT NULL AND result_url IN ({placeholders})",
+            result_urls
+        )
+        return {result_url: json.loads(detail) for result_url, detail in cursor}
+
+    def attach_to_json(self, events, file_path: str, chunk_size: int = 500) -> None:
+        """iter_json_events 형식의 결과에 상세 정보를 붙여 페이지 단위 JSON 파일로 기록합니다.
+
+        결과는 chunk_size개씩 모아 한 번에 조회하므로 전체 결과를 메모리에 올리지 않습니다.
+        """
+        self.flush()
+        with GeekBenchJSONWriter(file_path=file_path) as writer:
+            page_state = [None, None] # [현재 페이지 번호, 현재 페이지 결과]
+            chunk = list()
+            for event in events:
+                chunk.append(event)
+                if len(chunk) >= chunk_size:
+                    self._write_attached_events(writer=writer, events=chunk, page_state=page_state)
+                    chunk = list()
+
+            self._write_attached_events(writer=writer, events=chunk, page_state=page_state)
+            if page_state[1] is not None:
+                writer.write_page(page_state[0], page_state[1])
+
+    def _write_attached_events(self, writer: GeekBenchJSONWriter, events: list, page_state: list) -> None:
+        details_by_url = self._fetch_details([event[3] for event in events if event[0] == "result"])
+
+        for event in events:
+            if event[0] == "result":
+                _, _, _, result_url, details = event
+                detail = details_by_url.get(result_url)
+                page_state[1][result_url] = details if detail is None else dict(details, detail=detail)
+                continue
+
+            # 새 쿼리 또는 페이지가 시작되면 이전 페이지 기록
+            if page_state[1] is not None:
+                writer.write_page(page_state[0], page_state[1])
+                page_state[0], page_state[1] = None, None
+
+            if event[0] == "query":
+                writer.write_query(event[1])
+            else:
+                page_state[0], page_state[1] = event[2], dict()
+
+
+class GeekBenchResultEnricher:
+    def __init__(self, api_requester: object, enrichment_store: GeekBenchEnrichmentStore, concurrency: int = 4):
+        """새 결과의 상세 페이지를 제한된 동시 요청으로 가져와 파싱하고 저장소에 기록하는 보강 단계."""
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        self.api_requester = api_requester # 요청 속도 제한 및 재시도는 요청자를 따름 (전역 토큰 버킷 공유)
+        self.enrichment_store = enrichment_store
+        self.concurrency = concurrency
+
+    async def _enrich_one(self, search_type: str, result_url: str) -> str:
+        try:
+            content = await self.api_requester.fetch_result_page(search_type=search_type, result_url=result_url)
+        except GeekBenchFetchError as e:
+            # 삭제된 결과는 다시 요청하지 않도록 기록, 그 외 오류는 다음 실행에서 다시 시도
+            if e.status in (404, 410):
+                self.enrichment_store.add(search_type=search_type, result_url=result_url, detail=None, status="missing")
+                return "missing"
+            print(f"{result_url}: 상세 페이지 요청 실패 ({e})")
+            return "failed"
+
+        # 페이지 구조가 다른 경우 등 파싱 오류는 다음 실행에서 다시 시도
+        try:
+            detail = GeekBenchResultParser.parse_result_detail(content)
+        except Exception as e:
+            print(f"{result_url}: 상세 페이지 파싱 실패 ({type(e).__name__}: {e})")
+            return "failed"
+
+        self.enrichment_store.add(search_type=search_type, result_url=result_url, detail=detail)
+        return "enriched"
+
+    async def enrich(self, search_type: str, result_urls) -> dict:
+        """처리되지 않은 결과 URL의 상세 정보를 수집하고 상태별 개수를 반환합니다."""
+        counts = {"enriched": 0, "missing": 0, "failed": 0}
+        enriched_counter = get_global_metrics().counter("geekbench_enriched_results_total", "Result detail pages processed by outcome.")
+
+        # 생산자가 URL을 넣고 concurrency개의 작업자가 꺼내어 처리 (대기열 크기로 메모리 사용량 제한)
+        url_queue = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        async def worker():
+            while True:
+                result_url = await url_queue.get()
+                try:
+                    if result_url is None:
+                        return
+                    try:
+                        outcome = await self._enrich_one(search_type=search_type, result_url=result_url)
+                    except Exception as e:
+                        # 예상하지 못한 오류도 해당 결과만 실패로 처리 (작업자가 종료되면 생산자가 대기열에서 멈춤)
+                        print(f"{result_url}: 상세 정보 처리 실패 ({type(e).__name__}: {e})")
+                        outcome = "failed"
+                    counts[outcome] += 1
+                    enriched_counter.inc(status=outcome, search_type=search_type)
+                finally:
+                    url_queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        try:
+            for result_url in self.enrichment_store.iter_pending(result_urls):
+                await url_queue.put(result_url)
+
+            for _ in workers:
+                await url_queue.put(None)
+            await asyncio.gather(*workers)
+
+        finally:
+            # 중단된 경우에도 남은 요청 취소 후 처리된 결과 기록
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.enrichment_store.flush()
+
+        return counts
+
+
+def iter_stored_events(query: str, storage: object = None, file_path: str = None):
+    # 저장소 또는 페이지 단위 JSON 파일의 결과를 iter_json_events 형식으로 반환 (전체 결과를 메모리에 올리지 않음)
+    if storage is not None:
+        yield "query", query
+        for index, (result_url, details) in enumerate(storage.iter_results(query=query)):
+            page_number = index // storage.PAGE_SIZE + 1
+            if index % storage.PAGE_SIZE == 0:
+                yield "page", query, page_number
+            yield "result", query, page_number, result_url, details
+        return
+
+    if file_path is None:
+        raise ValueError("Either storage or file_path must be provided.")
+
+    yield from iter_json_events(file_path=file_path)
+
+
+def iter_stored_result_urls(query: str, storage: object = None, file_path: str = None):
+    # 저장소(storage.iter_results) 또는 페이지 단위 JSON 파일의 결과 URL (고유 번호 내림차순)
+    if storage is not None:
+        for result_url, _ in storage.iter_results(query=query):
+            yield result_url
+        return
+
+    if file_path is None:
+        raise ValueError("Either storage or file_path must be provided.")
+
+    for _, _, result_url, _ in GeekBenchJSONParser.iter_data_from_json(file_path=file_path):
+        yield result_url
+
+
+if __name__ == "__main__":
+    # 사용 예시: 저장된 결과의 상세 페이지 수집 (이미 처리된 결과는 건너뜀)
+    from http_requester import AsyncGeekBenchBrowserAPI
+
+    async def main():
+        with GeekBenchEnrichmentStore(db_path=r"geekbench_data_db\enrichments.sqlite3") as enrichment_store:
+            async with AsyncGeekBenchBrowserAPI() as api_requester:
+                enricher = GeekBenchResultEnricher(api_requester=api_requester, enrichment_store=enrichment_store, concurrency=4)
+                counts = await enricher.enrich(
+                    search_type="cpu",
+                    result_urls=iter_stored_result_urls(query="samsung s5e9945", file_path=r"geekbench_data_json\samsung s5e9945_1.json")
+                    )
+                print(counts)
+
+    asyncio.run(main())
@@ -0,0 +1,369 @@
+import html
+import random
+
+try:
+    from http_parser import GeekBenchSearchParser
+    from http_storage import GeekBenchStorage
+except ImportError:
+    from .http_parser import GeekBenchSearchParser
+    from .http_storage import GeekBenchStorage
+
+
+# 검색 유형별 결과 URL 경로 (https://browser.geekbench.com + 경로 + 고유 번호)
+RESULT_PATHS = {
+    "cpu": "/v6/cpu/",
+    "gpu": "/v6/compute/",
+    "ai": "/ai/v1/",
+}
+
+# 검색 유형별 "did not match any" 문구에 들어가는 벤치마크 이름
+BENCHMARK_NAMES = {
+    "cpu": "Geekbench 6 CPU",
+    "gpu": "Geekbench 6 GPU",
+    "ai": "Geekbench AI",
+}
+
+# 합성 결과에 사용할 값 목록
+DEVICES = (
+    ("samsung SM-S928N", "ARM ARMv8 2265 MHz (8 cores)", "Android"),
+    ("samsung SM-S921N", "ARM ARMv8 1958 MHz (10 cores)", "Android"),
+    ("samsung SM-F956N", "ARM ARMv8 2265 MHz (8 cores)", "Android"),
+    ("iPhone 16 Pro", "Apple A18 Pro 4040 MHz (6 cores)", "iOS"),
+    ("iPhone 15", "Apple A16 Bionic 3460 MHz (6 cores)", "iOS"),
+    ("Google Pixel 9", "ARM ARMv8 3105 MHz (8 cores)", "Android"),
+    ("Apple MacBook Pro (14-inch, 2024)", "Apple M4 Pro 4512 MHz (14 cores)", "macOS"),
+    ("ASUS System Product Name", "AMD Ryzen 7 7800X3D 4200 MHz (8 cores)", "Windows"),
+)
+GPU_API_NAMES = ("OpenCL", "Vulkan", "Metal")
+AI_FRAMEWORK_NAMES = ("TensorFlow Lite", "Core ML Neural Engine", "ONNX DirectML", "QNN")
+CPU_WORKLOADS = ("File Compression", "Navigation", "HTML5 Browser", "PDF Renderer", "Photo Library", "Clang", "Text Processing", "Asset Compression", "Object Detection", "Background Blur", "Horizon Detection", "Object Remover", "HDR", "Photo Filter", "Ray Tracer", "Structure from Motion")
+AI_WORKLOADS = ("Image Classification", "Image Segmentation", "Pose Estimation", "Object Detection", "Face Detection", "Depth Estimation", "Style Transfer", "Image Super-Resolution", "Text Classification", "Machine Translation")
+
+# 검색 유형별 상세 페이지 워크로드 섹션 (섹션 이름: (워크로드 목록, 처리량 단위))
+WORKLOAD_SECTIONS = {
+    "cpu": {
+        "Single-Core Performance": (CPU_WORKLOADS, "MB/sec"),
+        "Multi-Core Performance": (CPU_WORKLOADS, "MB/sec"),
+    },
+    "gpu": {
+        "Compute Performance": (("Background Blur", "Face Detection", "Horizon Detection", "Edge Detection", "Gaussian Blur", "Feature Matching", "Stereo Matching", "Particle Physics"), "Mpixels/sec"),
+    },
+    "ai": {
+        "Single Precision Performance": (AI_WORKLOADS, "IPS"),
+        "Half Precision Performance": (AI_WORKLOADS, "IPS"),
+        "Quantized Performance": (AI_WORKLOADS, "IPS"),
+    },
+}
+
+# 검색 유형별 상단 점수 이름
+DETAIL_SCORE_NAMES = {
+    "cpu": ("Single-Core Score", "Multi-Core Score"),
+    "gpu": ("OpenCL Score",),
+    "ai": ("Single Precision Score", "Half Precision Score", "Quantized Score"),
+}
+
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+class GeekBenchFixtureGenerator:
+    def __init__(self, seed: int = 0, results_per_page: int = 25, top_result_id: int = 10_000_000, pagination_window: int = 4):
+        """GeekBenchSearchParser 선택자와 같은 구조의 합성 검색 페이지 및 결과 데이터 생성기 (같은 시드는 같은 출력)."""
+        self.seed = seed
+        self.results_per_page = results_per_page
+        self.top_result_id = top_result_id # 1페이지 첫 결과의 고유 번호 (이후 1씩 감소)
+        self.pagination_window = pagination_window # 현재 페이지 앞뒤로 표시할 페이지 링크 수
+
+    def _random(self, *key) -> random.Random:
+        # (검색 유형, 쿼리, 페이지 등)마다 독립적인 난수 생성기 (페이지를 어떤 순서로 만들어도 같은 내용)
+        return random.Random(":".join(map(str, (self.seed,) + key)))
+
+    def result_id(self, page: int, index: int) -> int:
+        # 고유 번호 내림차순 (실제 검색 결과와 같은 순서)
+        return self.top_result_id - (page - 1) * self.results_per_page - index
+
+    def result_url(self, search_type: str, result_id: int) -> str:
+        return "https://browser.geekbench.com" + RESULT_PATHS[search_type] + str(result_id)
+
+    def _upload_date(self, rng: random.Random) -> str:
+        return f"{rng.choice(MONTHS)} {rng.randint(1, 28)}, {rng.randint(2023, 2025)}"
+
+    def _fake_row(self, search_type: str, rng: random.Random, result_id: int) -> dict:
+        # 행 하나의 필드 (HTML과 결과 딕셔너리가 같은 값을 사용)
+        device_name, cpu_model, platform_name = rng.choice(DEVICES)
+        row = {
+            "result_id": result_id,
+            "href": RESULT_PATHS[search_type] + str(result_id),
+            "device_name": device_name,
+            "cpu_model": cpu_model,
+        }
+
+        if search_type == "cpu":
+            row.update(upload_date=self._upload_date(rng), platform_name=platform_name, single=rng.randint(800, 3500), multi=rng.randint(2500, 12000))
+        elif search_type == "gpu":
+            row.update(upload_date=self._upload_date(rng), platform_name=platform_name, api_name=rng.choice(GPU_API_NAMES), api_score=rng.randint(3000, 60000))
+        elif search_type == "ai":
+            row.update(framework_name=rng.choice(AI_FRAMEWORK_NAMES), single_precision=rng.randint(500, 6000), half_precision=rng.randint(500, 12000), quantized=rng.randint(500, 15000))
+        else:
+            raise ValueError("Invalid search type. Use 'cpu', 'gpu', or 'ai'.")
+
+        return row
+
+    def _page_rows(self, search_type: str, query: str, page: int, count: int) -> list[dict]:
+        rng = self._random(search_type, query, page)
+        return [self._fake_row(search_type=search_type, rng=rng, result_id=self.result_id(page=page, index=index)) for index in range(count)]
+
+    @staticmethod
+    def _cpu_gpu_row_html(search_type: str, row: dict) -> str:
+        escape = html.escape
+        if search_type == "cpu":
+            score_columns = (
+                '<div class="col-6 col-md-3 col-lg-1"><span class="list-col-subtitle-score">Single-Core Score</span>'
+                f'<span class="list-col-text-score">\n{row["single"]}\n</span></div>'
+                '<div class="col-6 col-md-3 col-lg-1"><span class="list-col-subtitle-score">Multi-Core Score</span>'
+                f'<span class="list-col-text-score">\n{row["multi"]}\n</span></div>'
+            )
+        else:
+            score_columns = (
+                '<div class="col-6 col-md-3 col-lg-2"><span class="list-col-subtitle">API</span>'
+                f'<span class="list-col-text">\n{escape(row["api_name"])}\n</span></div>'
+                '<div class="col-6 col-md-3 col-lg-2"><span class="list-col-subtitle-score">Score</span>'
+                f'<span class="list-col-text-score">\n{row["api_score"]}\n</span></div>'
+            )
+
+        # 행 > list-col-inner > row > 열 (CPU 모델은 줄바꿈 포함, 날짜는 앞뒤 공백 포함)
+        return (
+            '<div class="list-col">\n<div class="list-col-inner">\n<div class="row">\n'
+            f'<div class="col-12 col-lg-4"><a href="{escape(row["href"])}">{escape(row["device_name"])}</a>\n'
+            f'<span class="list-col-model">\n{escape(row["cpu_model"])}\n</span></div>\n'
+            '<div class="col-6 col-md-3 col-lg-2"><span class="list-col-subtitle">Uploaded</span>'
+            f'<span class="list-col-text">\n{row["upload_date"]}\n</span></div>\n'
+            '<div class="col-6 col-md-3 col-lg-2"><span class="list-col-subtitle">Platform</span>'
+            f'<span class="list-col-text">\n{escape(row["platform_name"])}\n</span></div>\n'
+            f'{score_columns}\n'
+            '</div>\n</div>\n</div>'
+        )
+
+    @staticmethod
+    def _ai_row_html(row: dict) -> str:
+        escape = html.escape
+        # 기기 이름과 CPU 이름은 빈 줄로 구분 (separate_device_and_cpu)
+        return (
+            '<tr>\n'
+            f'<td class="device"><a href="{escape(row["href"])}">{escape(row["device_name"])}\n\n<span class="description">{escape(row["cpu_model"])}</span></a></td>\n'
+            f'<td class="framework">{escape(row["framework_name"])}</td>\n'
+            f'<td class="score">{row["single_precision"]}</td>\n'
+            f'<td class="score">{row["half_precision"]}</td>\n'
+            f'<td class="score">{row["quantized"]}</td>\n'
+            '</tr>'
+        )
+
+    def _pagination_html(self, page: int, total_pages: int) -> str:
+        # 처음/현재 주변/마지막 페이지 링크 (실제 사이트와 같이 일부만 표시)
+        numbers = {1, total_pages} | set(range(max(1, page - self.pagination_window), min(total_pages, page + self.pagination_window) + 1))
+        items = list()
+        if page > 1:
+            items.append(f'<li class="page-item"><a class="page-link" href="?page={page - 1}">&lsaquo; Previous</a></li>')
+
+        previous_number = 0
+        for number in sorted(numbers):
+            if number - previous_number > 1:
+                items.append('<li class="page-item disabled"><span class="page-link">&hellip;</span></li>')
+            active = " active" if number == page else ""
+            items.append(f'<li class="page-item{active}"><a class="page-link" href="?page={number}">{number}</a></li>')
+            previous_number = number
+
+        if page < total_pages:
+            items.append(f'<li class="page-item"><a class="page-link" href="?page={page + 1}">Next &rsaquo;</a></li>')
+
+        return '<nav><ul class="pagination">\n' + "\n".join(items) + '\n</ul></nav>'
+
+    @staticmethod
+    def _document_html(query: str, content_html: str) -> str:
+        # #wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 구조
+        escape = html.escape
+        return (
+            '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+            f'<title>{escape(query)} - Geekbench Search - Geekbench</title>\n'
+            '<script>window.dataLayer = window.dataLayer || [];</script>\n'
+            '<style>.list-col { padding: 0; }</style>\n'
+            '</head>\n<body>\n'
+            '<nav class="navbar"><a class="navbar-brand" href="/">Geekbench Browser</a></nav>\n'
+            '<div id="wrap">\n<div class="container">\n<div class="row">\n<div class="col-12">\n'
+            '<div class="page-header"><h1>Search</h1></div>\n'
+            f'<form class="search-form" action="/search"><input name="q" value="{escape(query)}"></form>\n'
+            '<div class="row">\n'
+            '<div class="col-12 col-lg-9">\n'
+            f'{content_html}\n'
+            '</div>\n'
+            '<div class="col-12 col-lg-3"><div class="sidebar">Geekbench 6</div></div>\n'
+            '</div>\n'
+            '</div>\n</div>\n</div>\n</div>\n'
+            '<footer class="footer">Primate Labs Inc.</footer>\n'
+            '</body>\n</html>\n'
+        )
+
+    def search_page_html(self, search_type: str, query: str, page: int = 1, total_pages: int = 1, result_count: int = None) -> str:
+        """결과 행과 페이지네이션을 포함한 검색 페이지 HTML (total_pages보다 큰 페이지는 "did not match any" 페이지)."""
+        if page > total_pages:
+            return self.empty_search_page_html(search_type=search_type, query=query)
+
+        rows = self._page_rows(search_type=search_type, query=query, page=page, count=self.results_per_page if result_count is None else result_count)
+        pagination_html = self._pagination_html(page=page, total_pages=total_pages)
+        header_html = f'<div class="list-header"><h2>Search Results</h2><p>Showing page {page} of {total_pages}.</p></div>'
+
+        if search_type in ["cpu", "gpu"]:
+            rows_html = "\n".join(self._cpu_gpu_row_html(search_type=search_type, row=row) for row in rows)
+            content_html = f'{header_html}\n<div>\n{rows_html}\n</div>\n{pagination_html}'
+        elif search_type == "ai":
+            rows_html = "\n".join(self._ai_row_html(row=row) for row in rows)
+            table_html = (
+                '<table class="table index-table">\n<thead><tr><th>Device</th><th>Framework</th>'
+                '<th>Single Precision</th><th>Half Precision</th><th>Quantized</th></tr></thead>\n'
+                f'<tbody>\n{rows_html}\n</tbody>\n</table>'
+            )
+            content_html = f'{header_html}\n<div class="banff">\n<div class="table-wrapper">\n<div class="table-responsive">\n{table_html}\n</div>\n</div>\n</div>\n{pagination_html}'
+        else:
+            raise ValueError("Invalid search type. Use 'cpu', 'gpu', or 'ai'.")
+
+        return self._document_html(query=query, content_html=content_html)
+
+    def empty_search_page_html(self, search_type: str, query: str) -> str:
+        """마지막 페이지 이후의 "did not match any" 검색 페이지 HTML."""
+        if search_type not in BENCHMARK_NAMES:
+            raise ValueError("Invalid search type. Use 'cpu', 'gpu', or 'ai'.")
+
+        content_html = f'<div class="list-header"><h2>Search Results</h2></div>\n<div>\n<p>Your search did not match any {BENCHMARK_NAMES[search_type]} results.</p>\n</div>'
+        return self._document_html(query=query, content_html=content_html)
+
+    def page_results(self, search_type: str, query: str, page: int = 1, result_count: int = None) -> list[dict]:
+        """search_page_html과 같은 행을 파서 출력 형식({url: details} 목록)으로 생성 (HTML 생성 및 파싱 생략)."""
+        rows = self._page_rows(search_type=search_type, query=query, page=page, count=self.results_per_page if result_count is None else result_count)
+        return [self._build_result(search_type=search_type, row=row) for row in rows]
+
+    def _build_result(self, search_type: str, row: dict) -> dict:
+        result_url = "https://browser.geekbench.com" + row["href"]
+        if search_type == "ai":
+            return GeekBenchSearchParser._build_ai_data(
+                device_name=row["device_name"],
+                cpu_model=row["cpu_model"],
+                framework_name=row["framework_name"],
+                single_precision=str(row["single_precision"]),
+                half_precision=str(row["half_precision"]),
+                quantized=str(row["quantized"]),
+                result_url=result_url
+                )
+
+        if search_type == "cpu":
+            core_scores = {"single": row["single"], "multi": row["multi"]}
+        else:
+            core_scores = {"api_name": row["api_name"], "api_score": row["api_score"]}
+
+        return GeekBenchSearchParser._build_cpu_gpu_data(
+            device_name=row["device_name"],
+            cpu_model=row["cpu_model"],
+            upload_date=row["upload_date"],
+            platform_name=row["platform_name"],
+            result_url=result_url,
+            core_scores=core_scores
+            )
+
+    def result_detail(self, search_type: str, result_id: int) -> dict:
+        """결과 상세 페이지 내용 (GeekBenchResultParser.parse_result_detail 출력 형식)."""
+        if search_type not in WORKLOAD_SECTIONS:
+            raise ValueError("Invalid search type. Use 'cpu', 'gpu', or 'ai'.")
+
+        rng = self._random(search_type, "detail", result_id)
+        device_name, cpu_model, platform_name = rng.choice(DEVICES)
+
+        workloads = dict()
+        for section_name, (workload_names, unit) in WORKLOAD_SECTIONS[search_type].items():
+            workloads[section_name] = {
+                workload_name: {"score": rng.randint(300, 9000), "description": f"{rng.uniform(1, 900):.1f} {unit}"}
+                for workload_name in workload_names
+            }
+
+        return {
+            "scores": {score_name: rng.randint(500, 15000) for score_name in DETAIL_SCORE_NAMES[search_type]},
+            "workloads": workloads,
+            "system_info": {
+                "System Information": {
+                    "Operating System": platform_name,
+                    "Model": device_name,
+                    "Motherboard": device_name,
+                },
+                "CPU Information": {
+                    "Name": cpu_model,
+                    "Topology": f"1 Processor, {rng.choice((6, 8, 10, 14))} Cores",
+                    "Base Frequency": f"{rng.uniform(1.8, 4.5):.2f} GHz",
+                },
+                "Memory Information": {
+                    "Size": f"{rng.choice((6, 8, 12, 16, 32))}.00 GB",
+                },
+            },
+        }
+
+    def result_page_html(self, search_type: str, result_id: int) -> str:
+        """result_detail과 같은 내용의 결과 상세 페이지 HTML (점수, 워크로드 표, 시스템 정보 표)."""
+        detail = self.result_detail(search_type=search_type, result_id=result_id)
+        escape = html.escape
+
+        scores_html = "\n".join(
+            f'<div class="score-container score-container-{index}"><div class="score">{score}</div><div class="note">{escape(score_name)}</div></div>'
+            for index, (score_name, score) in enumerate(detail["scores"].items(), start=1)
+        )
+
+        system_tables = list()
+        for section_name, values in detail["system_info"].items():
+            rows_html = "\n".join(f'<tr><td class="system-name">{escape(name)}</td><td class="system-value">{escape(value)}</td></tr>' for name, value in values.items())
+            system_tables.append(f'<div class="table-wrapper">\n<table class="table system-table">\n<thead><tr><th colspan="2">{escape(section_name)}</th></tr></thead>\n<tbody>\n{rows_html}\n</tbody>\n</table>\n</div>')
+
+        workload_tables = list()
+        for section_name, values in detail["workloads"].items():
+            rows_html = "\n".join(
+                f'<tr><td class="name">{escape(name)}</td><td class="score">{value["score"]}<br><span class="description">{escape(value["description"])}</span></td></tr>'
+                for name, value in values.items()
+            )
+            workload_tables.append(f'<div class="heading"><h3>{escape(section_name)}</h3></div>\n<div class="table-wrapper">\n<table class="table benchmark-table">\n<tbody>\n{rows_html}\n</tbody>\n</table>\n</div>')
+
+        return (
+            '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+            f'<title>{escape(detail["system_info"]["System Information"]["Model"])} - Geekbench</title>\n'
+            '</head>\n<body>\n'
+            '<div id="wrap">\n<div class="container">\n<div class="row">\n'
+            '<div class="col-12 col-lg-9">\n'
+            f'<div class="page-header"><h1>{escape(detail["system_info"]["System Information"]["Model"])}</h1></div>\n'
+            f'{scores_html}\n'
+            + "\n".join(system_tables) + "\n"
+            + "\n".join(workload_tables) + "\n"
+            '</div>\n</div>\n</div>\n</div>\n'
+            '</body>\n</html>\n'
+        )
+
+    def paginated_data(self, search_type: str, query: str, result_count: int, start_page: int = 1) -> dict:
+        """저장된 JSON 파일과 같은 {query: {page: {url: details}}} 형식의 결과 (고유 번호 내림차순, 페이지당 PAGE_SIZE개)."""
+        query_data = dict()
+        page_size = GeekBenchStorage.PAGE_SIZE
+        first_result_id = self.result_id(page=start_page, index=0)
+
+        for offset in range(0, result_count, page_size):
+            page_number = offset // page_size + 1
+            rng = self._random(search_type, query, "stored", page_number)
+            page_data = dict()
+            for index in range(offset, min(offset + page_size, result_count)):
+                page_data.update(self._build_result(search_type=search_type, row=self._fake_row(search_type=search_type, rng=rng, result_id=first_result_id - index)))
+            query_data[page_number] = page_data
+
+        return {query: query_data}
+
+
+if __name__ == "__main__":
+    # 사용 예시: 합성 페이지를 파싱하여 생성한 결과와 비교
+    from http_parser import GeekBenchSearchPage
+
+    generator = GeekBenchFixtureGenerator(seed=1)
+    for search_type in ("cpu", "gpu", "ai"):
+        page = GeekBenchSearchPage(benchmark_type=search_type, content=generator.search_page_html(search_type=search_type, query="samsung", page=2, total_pages=40))
+        print(search_type, len(page.results), page.max_page_number, page.results == generator.page_results(search_type=search_type, query="samsung", page=2))
+
+    empty_page = GeekBenchSearchPage(benchmark_type="cpu", content=generator.empty_search_page_html(search_type="cpu", query="samsung"))
+    print("마지막 페이지:", empty_page.is_last_page)
@@ -1,4 +1,12 @@
 from typing import Final
+from types import MappingProxyType
+from contextvars import ContextVar
+from contextlib import contextmanager
+
+
+# 작업(Task) 단위 헤더 오버레이 (asyncio 작업마다 독립적으로 유지)
+_header_overlay: ContextVar[MappingProxyType] = ContextVar("geekbench_header_overlay", default=MappingProxyType({}))
+
 
 class HTTPHeaders:
     # 공통 HTTP 헤더 상수
@@ -22,20 +30,25 @@ class HTTPHeaders:
     SEC_CH_UA_MOBILE: Final[str] = "?0"
     SEC_CH_UA_PLATFORM: Final[str] = '"Windows"'
 
+    # 요청마다 달라지는 오버레이 헤더 (인자 이름: 헤더 이름)
+    OVERLAY_HEADERS: Final[MappingProxyType] = MappingProxyType({
+        "referer": "Referer",
+        "cookie": "Cookie",
+        "if_none_match": "If-None-Match",
+        "if_modified_since": "If-Modified-Since",
+    })
+
     @staticmethod
-    def get_search_headers(search_type:str) -> dict[str, str]:
-        
-        # 공통 헤더 생성
+    def _build_search_header_template() -> MappingProxyType:
+        # 공통 헤더 생성 (Cookie, If-None-Match 등은 오버레이로 추가)
         common_headers = {
                 "Accept": HTTPHeaders.ACCEPT,
                 "Accept-Encoding": HTTPHeaders.ACCEPT_ENCODING,
                 "Accept-Language": HTTPHeaders.ACCEPT_LANGUAGE,
                 "Cache-Control": HTTPHeaders.CACHE_CONTROL,
                 "Connection": HTTPHeaders.CONNECTION,
-                # "Cookie": HTTPHeaders.COOKIE,
                 "DNT": HTTPHeaders.DNT,
                 "Host": HTTPHeaders.HOST,
-                # "If-None-Match": HTTPHeaders.IF_NONE_MATCH,
                 "Referer": HTTPHeaders.REFERER,
                 "Sec-Fetch-Dest": HTTPHeaders.SEC_FETCH_DEST,
                 "Sec-Fetch-Mode": HTTPHeaders.SEC_FETCH_MODE,
@@ -48,30 +61,98 @@ class HTTPHeaders:
                 "sec-ch-ua-platform": HTTPHeaders.SEC_CH_UA_PLATFORM,
             }
 
-        # 검색 유형에 따라 헤더 반환
-        if search_type in ["cpu", "gpu", "ai"]:
-            return common_headers
+        return MappingProxyType(common_headers)
+
+    @staticmethod
+    def get_search_header_template(search_type: str) -> MappingProxyType:
+        # 검색 유형별 불변 헤더 템플릿 반환
+        if search_type in SEARCH_HEADER_TEMPLATES:
+            return SEARCH_HEADER_TEMPLATES[search_type]
         else:
             raise ValueError("Invalid search type. Use 'cpu', 'gpu', or 'ai'.")
 
+    @staticmethod
+    def get_search_headers(
+        search_type: str,
+        referer: str = None,
+        cookie: str = None,
+        if_none_match: str = None,
+        if_modified_since: str = None
+        ) -> dict[str, str]:
+
+        # 불변 템플릿 복사 후 오버레이 적용 (작업 단위 → 요청 단위 순서로 덮어씀)
+        headers = dict(HTTPHeaders.get_search_header_template(search_type=search_type))
+        headers.update(_header_overlay.get())
+
+        request_overlay = {
+            "referer": referer,
+            "cookie": cookie,
+            "if_none_match": if_none_match,
+            "if_modified_since": if_modified_since,
+        }
+        for name, value in request_overlay.items():
+            if value is not None:
+                headers[HTTPHeaders.OVERLAY_HEADERS[name]] = value
+
+        # 빈 값의 선택 헤더는 전송하지 않음
+        for name in ("cookie", "if_none_match", "if_modified_since"):
+            header_name = HTTPHeaders.OVERLAY_HEADERS[name]
+            if not headers.get(header_name, None):
+                headers.pop(header_name, None)
+
+        return headers
+
+    @staticmethod
+    def _update_overlay(name: str, value: str) -> None:
+        # 현재 작업(Task)의 오버레이만 변경 (다른 동시 작업에는 영향 없음)
+        overlay = dict(_header_overlay.get())
+        overlay[HTTPHeaders.OVERLAY_HEADERS[name]] = value
+        _header_overlay.set(MappingProxyType(overlay))
+
+    @staticmethod
+    @contextmanager
+    def header_context(**overlay: str):
+        # with 블록(작업 또는 세션) 동안만 적용되는 헤더 오버레이
+        unknown = set(overlay) - set(HTTPHeaders.OVERLAY_HEADERS)
+        if unknown:
+            raise ValueError(f"Invalid header overlay: {sorted(unknown)}. Use one of {list(HTTPHeaders.OVERLAY_HEADERS)}.")
+
+        merged = dict(_header_overlay.get())
+        merged.update({HTTPHeaders.OVERLAY_HEADERS[name]: value for name, value in overlay.items() if value is not None})
+        token = _header_overlay.set(MappingProxyType(merged))
+        try:
+            yield
+        finally:
+            _header_overlay.reset(token)
+
     @staticmethod
     def update_referer(new_referer: str) -> None:
-        HTTPHeaders.REFERER = new_referer
+        HTTPHeaders._update_overlay("referer", new_referer)
 
     @staticmethod
     def update_cookie(new_cookie: str) -> None:
-        HTTPHeaders.COOKIE = new_cookie
+        HTTPHeaders._update_overlay("cookie", new_cookie)
 
     @staticmethod
     def update_if_none_match(new_if_none_match: str) -> None:
-        HTTPHeaders.IF_NONE_MATCH = new_if_none_match
+        HTTPHeaders._update_overlay("if_none_match", new_if_none_match)
+
+
+# 검색 유형별 불변 헤더 템플릿 (모듈 로드 시 한 번만 생성)
+SEARCH_HEADER_TEMPLATES: Final[MappingProxyType] = MappingProxyType({
+    search_type: HTTPHeaders._build_search_header_template()
+    for search_type in ("cpu", "gpu", "ai")
+})
 
 if __name__ == "__main__":
     # 사용 예시
     headers_manager = HTTPHeaders()
     print("기본 Referer:", headers_manager.get_search_headers("cpu")["Referer"])  # 출력: ""
 
-    # Referer 업데이트
+    # Referer 업데이트 (현재 작업에만 적용)
     headers_manager.update_referer("https://example.com")
     print("업데이트된 Referer:", headers_manager.get_search_headers("cpu")["Referer"])  # 출력: https://example.com
 
+    # 요청 단위 Referer
+    print("요청 Referer:", headers_manager.get_search_headers("cpu", referer="https://example.com/page")["Referer"])  # 출력: https://example.com/page
+
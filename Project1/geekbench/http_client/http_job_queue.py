@@ -0,0 +1,252 @@
+import os
+import socket
+import sqlite3
+import time
+import uuid
+
+
+class SQLiteJobQueue:
+    def __init__(self, db_path: str, lease_seconds: float = 300, max_attempts: int = 3):
+        """(search_type, query, 페이지 범위) 작업을 여러 작업자 프로세스가 임대(lease)하여 처리하는 SQLite 작업 큐."""
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds # 임대 유지 시간(초), 갱신되지 않으면 다른 작업자가 다시 가져감
+        self.max_attempts = max_attempts # 실패한 작업의 최대 시도 횟수
+
+        # 디렉토리가 존재하지 않으면 생성
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        # 트랜잭션은 직접 관리 (작업 임대는 BEGIN IMMEDIATE로 쓰기 잠금 후 처리)
+        # 네트워크 파일 시스템에서 디렉토리를 공유할 수 있도록 WAL 대신 롤백 저널 사용 (WAL은 공유 메모리가 필요)
+        self.connection = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=DELETE")
+        self._create_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _create_schema(self) -> None:
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                search_type TEXT NOT NULL,
+                query TEXT NOT NULL,
+                start_page INTEGER NOT NULL,
+                end_page INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                worker_id TEXT,
+                lease_expires_at REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_page INTEGER,
+                result_path TEXT,
+                error TEXT,
+                UNIQUE (search_type, query, start_page)
+            )
+            """
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, lease_expires_at)")
+
+    @staticmethod
+    def new_worker_id() -> str:
+        # 같은 디렉토리를 공유하는 여러 머신에서도 겹치지 않는 작업자 ID
+        return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+    def enqueue_query(self, search_type: str, query: str, total_pages: int, start_page: int = 1, pages_per_job: int = 20) -> int:
+        # 쿼리를 페이지 범위 작업으로 나누어 추가, 추가된 작업 수 반환
+        # (아직 병합되지 않은 같은 범위의 작업이 있으면 건너뜀, 병합 후에는 remove_query로 작업이 삭제되므로 다시 추가됨)
+        if pages_per_job < 1:
+            raise ValueError("pages_per_job must be at least 1.")
+
+        jobs = [
+            (search_type, query, job_start, min(job_start + pages_per_job - 1, total_pages))
+            for job_start in range(start_page, total_pages + 1, pages_per_job)
+        ]
+
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = self.connection.executemany(
+                "INSERT OR IGNORE INTO jobs (search_type, query, start_page, end_page) VALUES (?, ?, ?, ?)",
+                jobs
+            )
+            self.connection.execute("COMMIT")
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+
+        return cursor.rowcount
+
+    def claim(self, worker_id: str) -> dict | None:
+        # 대기 중이거나 임대가 만료된 작업 하나를 임대 (없으면 None)
+        now = time.time()
+
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            # 최대 시도 횟수만큼 임대된 후 만료된 작업은 다시 임대하지 않고 실패로 기록
+            self.connection.execute(
+                """
+                UPDATE jobs SET status = 'failed', lease_expires_at = NULL, error = COALESCE(error, 'lease expired')
+                WHERE status = 'leased' AND lease_expires_at < ? AND attempts >= ?
+                """,
+                (now, self.max_attempts)
+            )
+
+            row = self.connection.execute(
+                """
+                SELECT job_id, search_type, query, start_page, end_page, attempts FROM jobs
+                WHERE status = 'pending' OR (status = 'leased' AND lease_expires_at < ?)
+                ORDER BY query, start_page
+                LIMIT 1
+                """,
+                (now,)
+            ).fetchone()
+
+            if row is None:
+                self.connection.execute("COMMIT")
+                return None
+
+            job_id, search_type, query, start_page, end_page, attempts = row
+            self.connection.execute(
+                "UPDATE jobs SET status = 'leased', worker_id = ?, lease_expires_at = ?, attempts = ? WHERE job_id = ?",
+                (worker_id, now + self.lease_seconds, attempts + 1, job_id)
+            )
+            self.connection.execute("COMMIT")
+
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+
+        return {
+            "job_id": job_id,
+            "search_type": search_type,
+            "query": query,
+            "start_page": start_page,
+            "end_page": end_page,
+            "attempt": attempts + 1,
+        }
+
+    def renew(self, job_id: int, worker_id: str) -> bool:
+        # 임대 연장 (다른 작업자가 가져간 경우 False)
+        cursor = self.connection.execute(
+            "UPDATE jobs SET lease_expires_at = ? WHERE job_id = ? AND worker_id = ? AND status = 'leased'",
+            (time.time() + self.lease_seconds, job_id, worker_id)
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker_id: str, result_path: str, last_page: int = None) -> bool:
+        # 작업 완료 기록 (last_page: 마지막 페이지에 도달한 경우 해당 페이지 번호)
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = self.connection.execute(
+                """
+                UPDATE jobs SET status = 'done', result_path = ?, last_page = ?, lease_expires_at = NULL, error = NULL
+                WHERE job_id = ? AND worker_id = ? AND status = 'leased'
+                """,
+                (result_path, last_page, job_id, worker_id)
+            )
+            completed = cursor.rowcount == 1
+
+            # 마지막 페이지에 도달했으면 같은 쿼리의 이후 범위 작업은 요청할 필요 없음
+            if completed and last_page is not None:
+                self.connection.execute(
+                    """
+                    UPDATE jobs SET status = 'skipped', lease_expires_at = NULL
+                    WHERE search_type = (SELECT search_type FROM jobs WHERE job_id = ?)
+                    AND query = (SELECT query FROM jobs WHERE job_id = ?)
+                    AND start_page > ? AND status != 'done'
+                    """,
+                    (job_id, job_id, last_page)
+                )
+
+            self.connection.execute("COMMIT")
+
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+
+        return completed
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> None:
+        # 실패 기록 (최대 시도 횟수 전이면 다시 대기 상태로)
+        self.connection.execute(
+            """
+            UPDATE jobs SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                lease_expires_at = NULL, error = ?
+            WHERE job_id = ? AND worker_id = ? AND status = 'leased'
+            """,
+            (self.max_attempts, error, job_id, worker_id)
+        )
+
+    def count_jobs(self, query: str = None, search_type: str = None) -> dict:
+        # 상태별 작업 수 (query, search_type이 주어지면 해당 작업만)
+        rows = self.connection.execute(
+            """
+            SELECT status, COUNT(*) FROM jobs
+            WHERE (? IS NULL OR query = ?) AND (? IS NULL OR search_type = ?)
+            GROUP BY status
+            """,
+            (query, query, search_type, search_type)
+        ).fetchall()
+        return dict(rows)
+
+    def has_active_jobs(self, query: str = None, search_type: str = None) -> bool:
+        # 대기 중이거나 임대된 작업이 있는지 (작업자가 기다릴 작업이 남았는지)
+        counts = self.count_jobs(query=query, search_type=search_type)
+        return counts.get("pending", 0) + counts.get("leased", 0) > 0
+
+    def is_finished(self, query: str = None, search_type: str = None) -> bool:
+        # 모든 작업이 완료(done) 또는 생략(skipped)되면 완료 (실패한 작업이 있으면 페이지가 빠지므로 완료가 아님)
+        counts = self.count_jobs(query=query, search_type=search_type)
+        return counts.get("pending", 0) + counts.get("leased", 0) + counts.get("failed", 0) == 0
+
+    def fetch_failed_jobs(self, search_type: str, query: str) -> list[dict]:
+        # 최대 시도 횟수를 넘어 실패한 작업 (페이지 순서)
+        rows = self.connection.execute(
+            "SELECT job_id, start_page, end_page, attempts, error FROM jobs WHERE search_type = ? AND query = ? AND status = 'failed' ORDER BY start_page",
+            (search_type, query)
+        ).fetchall()
+        return [
+            {"job_id": job_id, "start_page": start_page, "end_page": end_page, "attempts": attempts, "error": error}
+            for job_id, start_page, end_page, attempts, error in rows
+        ]
+
+    def retry_failed(self, search_type: str, query: str) -> int:
+        # 실패한 작업을 다시 대기 상태로 (시도 횟수 초기화), 변경된 작업 수 반환
+        cursor = self.connection.execute(
+            "UPDATE jobs SET status = 'pending', attempts = 0, worker_id = NULL, error = NULL WHERE search_type = ? AND query = ? AND status = 'failed'",
+            (search_type, query)
+        )
+        return cursor.rowcount
+
+    def fetch_result_paths(self, search_type: str, query: str) -> list[str]:
+        # 완료된 작업의 결과 파일 경로 (페이지 순서)
+        rows = self.connection.execute(
+            "SELECT result_path FROM jobs WHERE search_type = ? AND query = ? AND status = 'done' ORDER BY start_page",
+            (search_type, query)
+        ).fetchall()
+        return [result_path for (result_path,) in rows]
+
+    def remove_query(self, search_type: str, query: str) -> int:
+        # 병합이 끝난 쿼리의 작업 삭제 (다음에 같은 쿼리를 추가하면 1페이지부터 다시 작업 생성), 삭제된 작업 수 반환
+        cursor = self.connection.execute("DELETE FROM jobs WHERE search_type = ? AND query = ?", (search_type, query))
+        return cursor.rowcount
+
+    def fetch_queries(self) -> list[tuple[str, str]]:
+        # 큐에 추가된 (search_type, query) 목록
+        return self.connection.execute("SELECT DISTINCT search_type, query FROM jobs ORDER BY search_type, query").fetchall()
+
+
+if __name__ == "__main__":
+    # 사용 예시
+    with SQLiteJobQueue(db_path=r"geekbench_data_queue\jobs.sqlite3") as job_queue:
+        job_queue.enqueue_query(search_type="cpu", query="samsung s5e9945", total_pages=100, pages_per_job=20)
+        worker_id = SQLiteJobQueue.new_worker_id()
+        job = job_queue.claim(worker_id=worker_id)
+        print("임대한 작업:", job)
+        print("작업 상태:", job_queue.count_jobs())
@@ -2,17 +2,34 @@ import json
 import os
 from pprint import pprint
 
+try:
+    from http_metrics import timed_storage
+    from http_records import GeekBenchResultRecord, make_result_record, encode_result_record
+    from http_merge import GeekBenchMergeEngine
+    from http_json_stream import iter_json_events, GeekBenchJSONWriter
+except ImportError:
+    from .http_metrics import timed_storage
+    from .http_records import GeekBenchResultRecord, make_result_record, encode_result_record
+    from .http_merge import GeekBenchMergeEngine
+    from .http_json_stream import iter_json_events, GeekBenchJSONWriter
+
+
 class GeekBenchJSONParser:
     def __init__(self):
-        self.geekbench_data = dict() # GeekBench 데이터를 저장할 딕셔너리
+        self.geekbench_data = dict() # GeekBench 데이터를 저장할 딕셔너리 ({query: {page: {고유 번호: 레코드}}})
+        self.result_log = None # 결과를 즉시 기록할 추가 전용 로그 (NDJSONResultLog)
+        self.keep_in_memory = True # 결과를 geekbench_data에도 보관할지 여부
 
     @staticmethod
+    @timed_storage(operation="save")
     def save_data_to_json(file_path: str, data: dict):
         # 디렉토리가 존재하지 않으면 생성
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        if os.path.dirname(file_path):
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
+        # 결과 레코드는 기록할 때 기존 JSON 형식으로 변환
         with open(file_path, 'w', encoding='utf-8') as json_file:
-            json.dump(data, json_file, ensure_ascii=False, indent=4)
+            json.dump(data, json_file, ensure_ascii=False, indent=4, default=encode_result_record)
 
     @staticmethod
     def load_data_to_json(file_path: str) -> dict:
@@ -21,8 +38,36 @@ class GeekBenchJSONParser:
                 return json.load(json_file)
         return dict()
 
+    @staticmethod
+    def iter_data_from_json(file_path: str):
+        # 저장된 JSON 파일의 결과를 (query, page, url, details)로 하나씩 반환 (전체 파일을 메모리에 올리지 않음)
+        for event in iter_json_events(file_path=file_path):
+            if event[0] == "result":
+                yield event[1:]
+
+
+    def attach_result_log(self, result_log: object, keep_in_memory: bool = False) -> None:
+        # 이후 저장되는 결과를 로그에 바로 기록 (메모리 보관 여부 선택)
+        self.result_log = result_log
+        self.keep_in_memory = keep_in_memory
+
+    def detach_result_log(self) -> None:
+        # 남은 버퍼를 기록하고 로그 연결 해제
+        if self.result_log is not None:
+            self.result_log.close()
+        self.result_log = None
+        self.keep_in_memory = True
+
 
     def store_geekbench_data(self, query: str, page_number: int, parsed_data: dict):
+        # 추가 전용 로그에 결과 기록 (비정상 종료 시에도 수집된 결과 보존)
+        if self.result_log is not None:
+            for url, details in parsed_data.items():
+                self.result_log.append(query=query, page_number=page_number, result_url=url, details=details)
+
+            if not self.keep_in_memory:
+                return
+
         # query에 대한 데이터 구조 생성
         if query not in self.geekbench_data:
             self.geekbench_data[query] = dict()
@@ -32,11 +77,12 @@ class GeekBenchJSONParser:
         if page_key not in self.geekbench_data[query]:
             self.geekbench_data[query][page_key] = dict()
 
-        # parsed_data의 키를 사용하여 데이터 저장
+        # 결과 레코드를 고유 번호를 키로 사용하여 저장
         for url, details in parsed_data.items():
-            # URL이 이미 존재하는지 확인
-            if url not in self.geekbench_data[query][page_key]:
-                self.geekbench_data[query][page_key][url] = details
+            record = make_result_record(result_url=url, details=details)
+            # 고유 번호가 이미 존재하는지 확인
+            if record.result_id not in self.geekbench_data[query][page_key]:
+                self.geekbench_data[query][page_key][record.result_id] = record
                 
 
     def fetch_geekbench_data(self) -> dict:
@@ -57,57 +103,83 @@ class GeekBenchJSONParser:
         return paginated_data
 
 
-    def merge_geekbench_data(self, new_data_path: dict | str = None, old_data_path: dict | str = None):
-        # 새로운 데이터 로드
-        if isinstance(new_data_path, dict):
-            new_data = new_data_path
-        elif isinstance(new_data_path, str):
-            new_data = GeekBenchJSONParser.load_data_to_json(new_data_path)
-            if new_data is None:
-                raise ValueError("New data is None. Failed to load data from the provided path.")
-        else:
-            raise ValueError("New data must be provided as a dictionary or a valid file path.")
-
-        # 기존 데이터 로드
-        if isinstance(old_data_path, dict):
-            old_data = old_data_path
-        elif isinstance(old_data_path, str):
-            old_data = GeekBenchJSONParser.load_data_to_json(old_data_path)
-            if old_data is None:  # 수정된 부분
-                raise ValueError("Old data is None. Failed to load data from the provided path.")
-        else:
-            raise ValueError("Old data must be provided as a dictionary or a valid file path.")
-
-        load_merge_data = self._load_merge_data(new_data=new_data, old_data=old_data)
-        paginated_data = self._paginate_data(data=self._sort_urls_by_unique_id(merge_data=load_merge_data))
-
-        return paginated_data
+    @staticmethod
+    def _iter_merge_source(data_path: dict | str, name: str):
+        # 병합 입력을 (query, url, details) 스트림으로 반환 (결과가 없는 쿼리는 (query, None, None))
+        if isinstance(data_path, str):
+            # 저장된 파일은 결과를 하나씩 읽으며 반환
+            query, has_results = None, True
+            for event in iter_json_events(file_path=data_path):
+                if event[0] == "query":
+                    if not has_results:
+                        yield query, None, None
+                    query, has_results = event[1], False
+                elif event[0] == "result":
+                    has_results = True
+                    yield query, event[3], event[4]
+            if not has_results:
+                yield query, None, None
+            return
+
+        if not isinstance(data_path, dict):
+            raise ValueError(f"{name} data must be provided as a dictionary or a valid file path.")
+
+        for query, query_data in data_path.items():
+            has_results = False
+            for _, results in query_data.items():
+                for result_key, result_details in results.items():
+                    has_results = True
+                    yield query, result_details.result_url if isinstance(result_details, GeekBenchResultRecord) else result_key, result_details
+            if not has_results:
+                yield query, None, None
+
+    def _merge_sources(self, new_data_path: dict | str, old_data_path: dict | str) -> list:
+        # 입력 형식 확인 (잘못된 입력은 병합 시작 전에 ValueError)
+        for data_path, name in ((new_data_path, "New"), (old_data_path, "Old")):
+            if not isinstance(data_path, (dict, str)):
+                raise ValueError(f"{name} data must be provided as a dictionary or a valid file path.")
+
+        # 같은 고유 번호는 기존 데이터의 결과 유지 (old가 뒤에 오도록)
+        return [
+            lambda: GeekBenchJSONParser._iter_merge_source(data_path=new_data_path, name="New"),
+            lambda: GeekBenchJSONParser._iter_merge_source(data_path=old_data_path, name="Old"),
+        ]
+
+    @timed_storage(operation="merge")
+    def merge_geekbench_data(self, new_data_path: dict | str = None, old_data_path: dict | str = None, merge_engine: GeekBenchMergeEngine = None):
+        # 두 입력 모두 고유 번호 내림차순으로 저장되어 있으므로 다시 정렬하지 않고 스트림으로 병합
+        merge_engine = GeekBenchMergeEngine() if merge_engine is None else merge_engine
+        return merge_engine.merge_to_data(sources=self._merge_sources(new_data_path=new_data_path, old_data_path=old_data_path))
+
+    @timed_storage(operation="merge")
+    def merge_geekbench_data_to_file(self, save_file_path: str, new_data_path: dict | str = None, old_data_path: dict | str = None, merge_engine: GeekBenchMergeEngine = None) -> dict:
+        """병합 결과를 전체 딕셔너리를 만들지 않고 페이지 단위로 바로 파일에 기록합니다 (save_file_path는 old_data_path와 같아도 됨)."""
+        merge_engine = GeekBenchMergeEngine() if merge_engine is None else merge_engine
+        return merge_engine.merge_to_file(sources=self._merge_sources(new_data_path=new_data_path, old_data_path=old_data_path), file_path=save_file_path)
     
-    def _load_merge_data(self, new_data: dict, old_data: dict) -> dict:
-        merge_data = dict()
-
-        # 새로운 데이터와 기존 데이터를 합치는 함수 호출
-        self._add_source_data_to_merge(merge_data, new_data)
-        self._add_source_data_to_merge(merge_data, old_data)
-
-        return merge_data
-
     def _add_source_data_to_merge(self, merge_data: dict, source_data: dict):
         for query, query_data in source_data.items():
             if query not in merge_data:
                 merge_data[query] = dict()
 
+            # 결과 레코드를 고유 번호를 키로 사용하여 저장 (같은 고유 번호는 나중에 추가된 결과로 대체)
             for _, results in query_data.items():
-                for url, result_details in results.items():
-                    merge_data[query][url] = result_details
+                for result_key, result_details in results.items():
+                    record = result_details if isinstance(result_details, GeekBenchResultRecord) else make_result_record(result_url=result_key, details=result_details)
+                    merge_data[query][record.result_id] = record
 
 
+    @staticmethod
+    def extract_result_id(result_url: str) -> int:
+        # URL에서 고유 번호 추출 (예: https://browser.geekbench.com/v6/cpu/123 -> 123)
+        return int(result_url.split('/')[-1])
+
     def _sort_urls_by_unique_id(self, merge_data: dict = None) -> dict:
-        # 각 쿼리에 대해 URL의 고유 번호 기준으로 내림차순 정렬
+        # 각 쿼리에 대해 URL의 고유 번호 기준으로 내림차순 정렬 (키가 고유 번호이면 그대로 사용)
         for query in merge_data.keys():
             merge_data[query] = dict(sorted(
                 merge_data[query].items(),
-                key=lambda item: int(item[0].split('/')[-1]),  # URL에서 고유 번호 추출
+                key=lambda item: item[0] if isinstance(item[0], int) else GeekBenchJSONParser.extract_result_id(item[0]),  # URL에서 고유 번호 추출
                 reverse=True  # 내림차순으로 정렬
             ))
 
@@ -122,7 +194,10 @@ class GeekBenchJSONParser:
             if query not in paginated_data:
                 paginated_data[query] = dict()
 
-            for result_url, result_details in results.items():
+            for result_key, result_details in results.items():
+                # 결과 레코드는 URL을 키로 사용하여 기존 JSON 형식으로 구성
+                result_url = result_details.result_url if isinstance(result_details, GeekBenchResultRecord) else result_key
+
                 # 25개마다 페이지 번호 증가
                 if item_count % 25 == 0:
                     page_number += 1
@@ -141,38 +216,77 @@ class GeekBenchJSONParser:
 
 
     def cpu_fix(self, file_path: str, save_file_path: str, cpu_model_mapping: dict):
-        # 데이터 로드
-        query_results = GeekBenchJSONParser.load_data_to_json(file_path)
-
-        # CPU 데이터 수정
-        for key, results in query_results.items():
-            for page_number, page_data in results.items():
-                for url, entry_data in page_data.items():
-                    # 원래 CPU 모델 이름
-                    original_model = entry_data["system"]["cpu_model"]
-
-                    # CPU 모델 수정
-                    fixed_model = original_model
-                    for old_model in cpu_model_mapping.keys():
-                        # get()을 사용하여 새로운 모델 이름을 가져옴
-                        new_model = cpu_model_mapping.get(old_model)
-                        fixed_model = fixed_model.replace(old_model, new_model)
-
-                    # 수정된 모델을 데이터에 반영
-                    entry_data["system"]["cpu_model"] = fixed_model
-                    print(f"Original: {original_model} -> Fixed: {fixed_model}")
-
-        # 수정된 데이터 저장
-        GeekBenchJSONParser.save_data_to_json(file_path=save_file_path, data=query_results)
+        # 결과를 하나씩 읽어 수정하고 페이지 단위로 바로 기록 (save_file_path는 file_path와 같아도 됨)
+        with GeekBenchJSONWriter(file_path=save_file_path) as writer:
+            page_number, page_data = None, None
+
+            for event in iter_json_events(file_path=file_path):
+                # 새 쿼리 또는 페이지가 시작되면 이전 페이지 기록
+                if event[0] in ("query", "page") and page_number is not None:
+                    writer.write_page(page_number, page_data)
+                    page_number, page_data = None, None
+
+                if event[0] == "query":
+                    writer.write_query(event[1])
+                    continue
+                if event[0] == "page":
+                    page_number, page_data = event[2], dict()
+                    continue
+
+                url, entry_data = event[3], event[4]
+
+                # 원래 CPU 모델 이름
+                original_model = entry_data["system"]["cpu_model"]
+
+                # CPU 모델 수정
+                fixed_model = original_model
+                for old_model in cpu_model_mapping.keys():
+                    # get()을 사용하여 새로운 모델 이름을 가져옴
+                    new_model = cpu_model_mapping.get(old_model)
+                    fixed_model = fixed_model.replace(old_model, new_model)
+
+                # 수정된 모델을 데이터에 반영
+                entry_data["system"]["cpu_model"] = fixed_model
+                page_data[url] = entry_data
+                print(f"Original: {original_model} -> Fixed: {fixed_model}")
+
+            # 마지막 페이지 기록
+            if page_number is not None:
+                writer.write_page(page_number, page_data)
+
         print(f"Modified data saved to: {save_file_path}")
 
 
-    def calculate_total_pages(self, file_path: str):
-        # 데이터 로드
-        query_results = GeekBenchJSONParser.load_data_to_json(file_path=file_path)
+    def calculate_watermark(self, data_path: dict | str) -> int | None:
+        # 저장된 결과 중 가장 큰 고유 번호 (데이터가 없으면 None)
+        if isinstance(data_path, str):
+            return max((GeekBenchJSONParser.extract_result_id(url) for _, _, url, _ in GeekBenchJSONParser.iter_data_from_json(file_path=data_path)), default=None)
+        elif isinstance(data_path, dict):
+            query_results = data_path
+        else:
+            raise ValueError("Data must be provided as a dictionary or a valid file path.")
+
+        return max(
+            (GeekBenchJSONParser.extract_result_id(url) for results in query_results.values() for page_data in results.values() for url in page_data),
+            default=None
+            )
+
+    @staticmethod
+    def load_watermark(watermark_path: str, query: str) -> int | None:
+        # 쿼리별로 기록된 워터마크 (가장 큰 고유 번호) 로드
+        return GeekBenchJSONParser.load_data_to_json(file_path=watermark_path).get(query)
 
-        # 페이지 개수 구하기
-        total_pages = sum(len(results) for results in query_results.values())
+    @staticmethod
+    def save_watermark(watermark_path: str, query: str, watermark: int) -> None:
+        # 쿼리별 워터마크 기록 (다른 쿼리의 워터마크는 유지)
+        watermarks = GeekBenchJSONParser.load_data_to_json(file_path=watermark_path)
+        watermarks[query] = watermark
+        GeekBenchJSONParser.save_data_to_json(file_path=watermark_path, data=watermarks)
+
+
+    def calculate_total_pages(self, file_path: str):
+        # 페이지 개수 구하기 (파일을 차례로 읽으며 페이지 수만 계산)
+        total_pages = sum(1 for event in iter_json_events(file_path=file_path) if event[0] == "page")
 
         return total_pages
 
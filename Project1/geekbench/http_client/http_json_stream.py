@@ -0,0 +1,160 @@
+import json
+import os
+import re
+
+try:
+    from http_records import encode_result_record
+except ImportError:
+    from .http_records import encode_result_record
+
+
+# 한 번에 읽을 문자 수
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JSONStreamScanner:
+    def __init__(self, json_file, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """파일을 chunk_size 단위로 읽으며 객체의 키와 값을 차례로 해석하는 스캐너 (읽은 부분은 버퍼에서 제거)."""
+        self.json_file = json_file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _read(self) -> None:
+        chunk = self.json_file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def peek(self) -> str:
+        # 공백을 건너뛴 다음 문자 (파일 끝이면 빈 문자열)
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self._read()
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def decode_value(self):
+        # 값 하나를 해석 (버퍼 끝에서 잘린 값이면 더 읽은 후 다시 해석)
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._read()
+
+    def iter_keys(self):
+        # 객체의 키를 차례로 반환 (호출한 쪽에서 다음 키를 요청하기 전에 값을 모두 읽어야 함)
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.decode_value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name enclosed in double quotes", self.buffer, self.pos)
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+
+def iter_json_events(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """페이지 단위 JSON 파일({query: {page: {url: details}}})을 전체 트리를 만들지 않고 차례로 읽습니다.
+
+    ("query", query), ("page", query, page), ("result", query, page, url, details)를 파일 순서대로 반환하며,
+    파일이 없으면 아무것도 반환하지 않습니다 (load_data_to_json과 동일).
+    """
+    if not os.path.exists(file_path):
+        return
+
+    with open(file_path, 'r', encoding='utf-8') as json_file:
+        scanner = _JSONStreamScanner(json_file=json_file, chunk_size=chunk_size)
+        for query in scanner.iter_keys():
+            yield "query", query
+            for page in scanner.iter_keys():
+                yield "page", query, page
+                for result_url in scanner.iter_keys():
+                    yield "result", query, page, result_url, scanner.decode_value()
+
+
+class GeekBenchJSONWriter:
+    def __init__(self, file_path: str):
+        """페이지 단위 JSON 파일을 쿼리와 페이지 순서대로 기록하는 작성기 (json.dump(..., ensure_ascii=False, indent=4)와 같은 형식).
+
+        임시 파일에 기록한 후 close()에서 교체하므로 읽고 있는 파일과 같은 경로에 기록할 수 있습니다.
+        """
+        # 디렉토리가 존재하지 않으면 생성
+        if os.path.dirname(file_path):
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        self.file_path = file_path
+        self.temp_path = f"{file_path}.writing"
+        self.query_count = 0
+        self.page_count = 0
+        self._query_has_pages = False
+
+        self._json_file = open(self.temp_path, 'w', encoding='utf-8')
+        self._json_file.write("{")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # 오류가 발생하면 기존 파일을 그대로 두고 임시 파일 삭제
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _end_query(self) -> None:
+        if self.query_count > 0:
+            self._json_file.write("\n    }" if self._query_has_pages else "}")
+
+    def write_query(self, query: str) -> None:
+        self._end_query()
+        if self.query_count > 0:
+            self._json_file.write(",")
+        self._json_file.write(f"\n    {json.dumps(query, ensure_ascii=False)}: {{")
+        self.query_count += 1
+        self._query_has_pages = False
+
+    def write_page(self, page_number: int | str, page_data: dict) -> None:
+        # 마지막으로 기록한 쿼리의 페이지 (결과 레코드는 기존 JSON 형식으로 변환)
+        page_json = json.dumps(page_data, ensure_ascii=False, indent=4, default=encode_result_record).replace("\n", "\n        ")
+        self._json_file.write(("," if self._query_has_pages else "") + f"\n        {json.dumps(str(page_number), ensure_ascii=False)}: {page_json}")
+        self._query_has_pages = True
+        self.page_count += 1
+
+    def close(self) -> None:
+        if self._json_file.closed:
+            return
+        self._end_query()
+        self._json_file.write("\n}" if self.query_count > 0 else "}")
+        self._json_file.close()
+        os.replace(self.temp_path, self.file_path)
+
+    def abort(self) -> None:
+        if not self._json_file.closed:
+            self._json_file.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
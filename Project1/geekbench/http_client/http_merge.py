@@ -0,0 +1,228 @@
+import heapq
+import json
+import os
+import shutil
+import tempfile
+from itertools import groupby
+from operator import itemgetter
+
+try:
+    from http_records import GeekBenchResultRecord, make_result_record, encode_result_record
+    from http_metrics import get_global_metrics
+    from http_json_stream import GeekBenchJSONWriter
+except ImportError:
+    from .http_records import GeekBenchResultRecord, make_result_record, encode_result_record
+    from .http_metrics import get_global_metrics
+    from .http_json_stream import GeekBenchJSONWriter
+
+
+class _UnsortedSourceError(Exception):
+    # 입력이 고유 번호 내림차순이 아니거나 쿼리 순서가 맞지 않아 빠른 병합을 사용할 수 없는 경우
+    pass
+
+
+def _result_id(result_url: str, details) -> int:
+    if isinstance(details, GeekBenchResultRecord):
+        return details.result_id
+    return int(result_url.split('/')[-1])
+
+
+class GeekBenchMergeEngine:
+    def __init__(self, max_records_in_memory: int = 100_000, spill_dir: str = None, page_size: int = 25):
+        """고유 번호 내림차순으로 정렬된 입력을 스트림으로 k-way 병합하여 페이지 단위로 출력하는 병합 엔진.
+
+        입력(source)은 호출할 때마다 (query, url, details)를 처음부터 반환하는 함수이며,
+        결과가 없는 쿼리는 (query, None, None)으로 표시합니다.
+        """
+        if max_records_in_memory < 1:
+            raise ValueError("max_records_in_memory must be at least 1.")
+
+        self.max_records_in_memory = max_records_in_memory # 정렬되지 않은 입력을 정렬할 때 메모리에 모을 최대 결과 수
+        self.spill_dir = spill_dir # 정렬된 구간(run) 파일을 기록할 디렉토리 (None이면 시스템 임시 디렉토리)
+        self.page_size = page_size
+
+    # 병합 (빠른 경로)
+    @staticmethod
+    def _iter_checked(query: str, group):
+        # 고유 번호 내림차순 확인 (같은 번호는 허용, 중복은 병합 시 제거)
+        previous_id = None
+        for _, result_url, details in group:
+            if result_url is None:
+                continue
+            result_id = _result_id(result_url, details)
+            if previous_id is not None and result_id > previous_id:
+                raise _UnsortedSourceError(f"{query}: results are not sorted by descending result ID.")
+            previous_id = result_id
+            yield -result_id, result_url, details
+
+    def _iter_presorted(self, sources: list):
+        # 각 입력을 한 번만 읽으며 쿼리 단위로 k-way 병합 (메모리에는 입력별 결과 하나만 유지)
+        # 쿼리 순서는 첫 번째 입력의 쿼리, 다음 입력에만 있는 쿼리 순 (기존 딕셔너리 병합과 동일)
+        query_groups = [groupby(source(), key=itemgetter(0)) for source in sources]
+        current_groups = [next(groups, None) for groups in query_groups]
+        merged_queries = set()
+
+        while any(group is not None for group in current_groups):
+            query = next(group[0] for group in current_groups if group is not None)
+            if query in merged_queries:
+                raise _UnsortedSourceError(f"{query}: query order differs between sources.")
+            merged_queries.add(query)
+
+            indexes = [index for index, group in enumerate(current_groups) if group is not None and group[0] == query]
+            streams = [self._iter_checked(query=query, group=current_groups[index][1]) for index in indexes]
+
+            # 같은 고유 번호는 나중 입력의 결과 유지 (heapq.merge는 같은 값이면 앞 입력을 먼저 반환)
+            yield query, self._iter_deduplicated(heapq.merge(*streams, key=itemgetter(0)))
+
+            for index in indexes:
+                current_groups[index] = next(query_groups[index], None)
+
+    @staticmethod
+    def _iter_deduplicated(items):
+        # (음수 고유 번호, ..., url, details) 순서의 결과에서 같은 고유 번호는 마지막 결과만 반환
+        for _, same_results in groupby(items, key=itemgetter(0)):
+            *_, result_url, details = list(same_results)[-1]
+            yield result_url, details
+
+    # 병합 (외부 정렬)
+    def _spill(self, run_dir: str, run_paths: dict, buffers: dict) -> None:
+        # 쿼리별로 모은 결과를 정렬하여 구간(run) 파일로 기록
+        for query, buffer in buffers.items():
+            if not buffer:
+                continue
+            buffer.sort(key=itemgetter(0, 1))
+            run_path = os.path.join(run_dir, f"run_{sum(len(paths) for paths in run_paths.values())}.ndjson")
+            with open(run_path, 'w', encoding='utf-8') as run_file:
+                for item in buffer:
+                    run_file.write(json.dumps(item, ensure_ascii=False, default=encode_result_record) + "\n")
+            run_paths[query].append(run_path)
+            buffer.clear()
+
+        get_global_metrics().counter("geekbench_merge_spilled_runs_total", "Sorted runs spilled to disk during merges.").inc()
+
+    @staticmethod
+    def _iter_run(run_path: str):
+        with open(run_path, 'r', encoding='utf-8') as run_file:
+            for line in run_file:
+                yield tuple(json.loads(line))
+
+    def _iter_external(self, sources: list, run_dir: str):
+        # 입력 순서에 관계없이 병합: max_records_in_memory개마다 정렬된 구간을 디스크에 기록한 후 구간을 k-way 병합
+        query_order = list()
+        run_paths = dict() # {query: [구간 파일 경로]}
+        buffers = dict() # {query: [(음수 고유 번호, 입력 순서, url, details)]}
+        buffered = 0
+        sequence = 0
+
+        for source in sources:
+            for query, result_url, details in source():
+                if query not in buffers:
+                    query_order.append(query)
+                    run_paths[query] = list()
+                    buffers[query] = list()
+                if result_url is None:
+                    continue
+
+                # 입력 순서(sequence)로 같은 고유 번호는 나중 결과가 뒤에 오도록 정렬
+                buffers[query].append((-_result_id(result_url, details), sequence, result_url, details))
+                sequence += 1
+                buffered += 1
+                if buffered >= self.max_records_in_memory:
+                    self._spill(run_dir=run_dir, run_paths=run_paths, buffers=buffers)
+                    buffered = 0
+
+        for query in query_order:
+            buffers[query].sort(key=itemgetter(0, 1))
+            streams = [self._iter_run(run_path) for run_path in run_paths[query]] + [iter(buffers[query])]
+            yield query, self._iter_deduplicated(heapq.merge(*streams, key=itemgetter(0, 1)))
+
+    # 페이지 구성
+    def _iter_pages(self, query_results):
+        # (query, 페이지 번호, [(url, details)]) 반환, 결과가 없는 쿼리는 (query, None, None)
+        # 페이지 번호는 쿼리 사이에서도 이어짐 (GeekBenchJSONParser._paginate_data와 동일)
+        page_number = 0
+        item_count = 0
+
+        for query, results in query_results:
+            page_items = list()
+            current_page = None
+            has_results = False
+
+            for result_url, details in results:
+                has_results = True
+                if item_count % self.page_size == 0:
+                    page_number += 1
+                item_count += 1
+
+                if current_page != page_number:
+                    if page_items:
+                        yield query, current_page, page_items
+                    page_items = list()
+                    current_page = page_number
+                page_items.append((result_url, details))
+
+            if page_items:
+                yield query, current_page, page_items
+            elif not has_results:
+                yield query, None, None
+
+    def _run(self, sources: list, consume):
+        # 빠른 경로로 병합하고, 정렬되지 않은 입력이 있으면 처음부터 외부 정렬로 다시 병합
+        try:
+            return consume(self._iter_pages(self._iter_presorted(sources)))
+        except _UnsortedSourceError:
+            pass
+
+        run_dir = tempfile.mkdtemp(prefix="geekbench_merge_", dir=self.spill_dir)
+        try:
+            return consume(self._iter_pages(self._iter_external(sources, run_dir=run_dir)))
+        finally:
+            shutil.rmtree(run_dir, ignore_errors=True)
+
+    # 출력
+    def merge_to_data(self, sources: list) -> dict:
+        """병합 결과를 기존 JSON 형식의 딕셔너리({query: {page: {url: 결과 레코드}}})로 반환합니다."""
+        def consume(pages) -> dict:
+            paginated_data = dict()
+            for query, page_number, page_items in pages:
+                query_data = paginated_data.setdefault(query, dict())
+                if page_number is not None:
+                    query_data[page_number] = {
+                        result_url: make_result_record(result_url=result_url, details=details)
+                        for result_url, details in page_items
+                    }
+            return paginated_data
+
+        return self._run(sources, consume)
+
+    def merge_to_file(self, sources: list, file_path: str) -> dict:
+        """병합 결과를 페이지 단위로 바로 JSON 파일에 기록하고 요약(쿼리, 결과, 페이지 수, 가장 큰 고유 번호)을 반환합니다.
+
+        출력은 save_data_to_json과 같은 형식이며, 임시 파일에 기록한 후 교체하므로 입력 파일과 같은 경로를 사용할 수 있습니다.
+        """
+        return self._run(sources, lambda pages: self._write_pages(file_path, pages))
+
+    @staticmethod
+    def _write_pages(file_path: str, pages) -> dict:
+        summary = {"queries": 0, "results": 0, "pages": 0, "watermark": None}
+
+        with GeekBenchJSONWriter(file_path=file_path) as writer:
+            current_query = None
+            for query, page_number, page_items in pages:
+                if writer.query_count == 0 or query != current_query:
+                    writer.write_query(query)
+                    current_query = query
+
+                if page_number is None:
+                    continue
+
+                writer.write_page(page_number, {result_url: details for result_url, details in page_items})
+                summary["results"] += len(page_items)
+                first_id = _result_id(*page_items[0])
+                if summary["watermark"] is None or first_id > summary["watermark"]:
+                    summary["watermark"] = first_id
+
+            summary["queries"] = writer.query_count
+            summary["pages"] = writer.page_count
+
+        return summary
@@ -0,0 +1,249 @@
+import json
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+
+from aiohttp import web
+
+
+# 기본 지연 시간 구간(초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 페이지당 결과 수 구간 (검색 페이지 하나에 최대 25개)
+ROW_BUCKETS = (0, 1, 5, 10, 15, 20, 25)
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        """레이블별로 누적되는 카운터."""
+        self.name = name
+        self.help_text = help_text
+        self.values = dict() # {레이블 튜플: 값}
+
+    def inc(self, value: float = 1, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        self.values[key] = self.values.get(key, 0) + value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_format_labels(key)} {_format_value(value)}")
+        return lines
+
+    def snapshot(self) -> list[dict]:
+        return [{"labels": dict(key), "value": value} for key, value in sorted(self.values.items())]
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: tuple = DEFAULT_BUCKETS):
+        """레이블별 관측값을 고정 구간으로 집계하는 히스토그램 (합계, 개수 포함)."""
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.values = dict() # {레이블 튜플: [구간별 개수, 합계, 개수]}
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        state = self.values.get(key)
+        if state is None:
+            state = self.values[key] = [[0] * len(self.buckets), 0.0, 0]
+
+        # 값이 속하는 첫 구간에만 기록 (출력할 때 누적)
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            state[0][index] += 1
+        state[1] += value
+        state[2] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for key, (bucket_counts, total, count) in sorted(self.values.items()):
+            cumulative = 0
+            for upper_bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(key + (('le', _format_value(upper_bound)),))} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(key + (('le', '+Inf'),))} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+    def quantile(self, q: float, **labels) -> float | None:
+        # 구간 개수로 추정한 분위수 (Prometheus histogram_quantile과 같이 구간 안에서 선형 보간)
+        # 주어진 레이블이 일치하는 모든 레이블 조합을 합산 (레이블이 없으면 전체)
+        bucket_counts = [0] * len(self.buckets)
+        count = 0
+        for key, (key_bucket_counts, _, key_count) in self.values.items():
+            key_labels = dict(key)
+            if all(key_labels.get(name) == value for name, value in labels.items()):
+                bucket_counts = [total + bucket_count for total, bucket_count in zip(bucket_counts, key_bucket_counts)]
+                count += key_count
+
+        if count == 0:
+            return None
+
+        rank = q * count
+        cumulative = 0
+        lower_bound = 0.0
+        for upper_bound, bucket_count in zip(self.buckets, bucket_counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                return lower_bound + (upper_bound - lower_bound) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+            lower_bound = upper_bound
+
+        # 가장 큰 구간보다 큰 값 (+Inf 구간)은 가장 큰 구간 상한으로 반환
+        return float(self.buckets[-1])
+
+    def snapshot(self) -> list[dict]:
+        return [
+            {
+                "labels": dict(key),
+                "count": count,
+                "sum": total,
+                "mean": total / count if count else None,
+                "buckets": dict(zip(map(_format_value, self.buckets), bucket_counts)),
+            }
+            for key, (bucket_counts, total, count) in sorted(self.values.items())
+        ]
+
+
+def _format_labels(key: tuple) -> str:
+    if not key:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n") for _, value in key)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(key, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        """프로세스 안에서 카운터와 히스토그램을 이름별로 관리하는 가벼운 레지스트리."""
+        self.metrics = dict() # {이름: Counter | Histogram}
+
+    def counter(self, name: str, help_text: str = "") -> Counter:
+        # 같은 이름이면 기존 카운터 반환
+        if name not in self.metrics:
+            self.metrics[name] = Counter(name=name, help_text=help_text)
+        return self.metrics[name]
+
+    def histogram(self, name: str, help_text: str = "", buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        # 같은 이름이면 기존 히스토그램 반환
+        if name not in self.metrics:
+            self.metrics[name] = Histogram(name=name, help_text=help_text, buckets=buckets)
+        return self.metrics[name]
+
+    @contextmanager
+    def timer(self, name: str, help_text: str = "", **labels):
+        # 블록 실행 시간(초)을 히스토그램에 기록
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.histogram(name=name, help_text=help_text).observe(time.perf_counter() - start_time, **labels)
+
+    def timed(self, name: str, help_text: str = "", **labels):
+        # 함수 실행 시간(초)을 히스토그램에 기록하는 데코레이터
+        def decorator(function):
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.timer(name, help_text, **labels):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def render_prometheus(self) -> str:
+        lines = list()
+        for _, metric in sorted(self.metrics.items()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> dict:
+        return {
+            "created_at": time.time(),
+            "metrics": {
+                name: {"type": type(metric).__name__.lower(), "help": metric.help_text, "values": metric.snapshot()}
+                for name, metric in sorted(self.metrics.items())
+            },
+        }
+
+    def save_snapshot(self, file_path: str) -> None:
+        # 디렉토리가 존재하지 않으면 생성
+        if os.path.dirname(file_path):
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        with open(file_path, 'w', encoding='utf-8') as json_file:
+            json.dump(self.snapshot(), json_file, ensure_ascii=False, indent=4)
+
+    def reset(self) -> None:
+        self.metrics.clear()
+
+
+class MetricsServer:
+    def __init__(self, registry: MetricsRegistry = None, host: str = "127.0.0.1", port: int = 9108):
+        """레지스트리를 Prometheus 텍스트 형식(/metrics)과 JSON(/metrics.json)으로 제공하는 로컬 HTTP 서버."""
+        self.registry = get_global_metrics() if registry is None else registry
+        self.host = host
+        self.port = port
+        self._runner = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(text=self.registry.render_prometheus(), content_type="text/plain", charset="utf-8")
+
+    async def _handle_snapshot(self, request: web.Request) -> web.Response:
+        return web.json_response(self.registry.snapshot())
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        app.router.add_get("/metrics.json", self._handle_snapshot)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+# 프로세스 전역에서 공유되는 지표 레지스트리
+_global_metrics = None
+
+
+def get_global_metrics() -> MetricsRegistry:
+    global _global_metrics
+
+    if _global_metrics is None:
+        _global_metrics = MetricsRegistry()
+
+    return _global_metrics
+
+
+def storage_timer(operation: str, **labels):
+    # 저장 단계(페이지 저장, 병합, 파일 저장 등) 실행 시간 기록 (with 문 또는 데코레이터로 사용)
+    return get_global_metrics().timer("geekbench_storage_seconds", "Time spent in storage operations.", operation=operation, **labels)
+
+
+def timed_storage(operation: str, **labels):
+    return get_global_metrics().timed("geekbench_storage_seconds", "Time spent in storage operations.", operation=operation, **labels)
+
+
+if __name__ == "__main__":
+    # 사용 예시
+    metrics = get_global_metrics()
+    with metrics.timer("geekbench_example_seconds", "Example block duration.", stage="example"):
+        time.sleep(0.01)
+    metrics.counter("geekbench_example_total", "Example counter.").inc(stage="example")
+    print(metrics.render_prometheus())
@@ -0,0 +1,203 @@
+import asyncio
+import random
+import time
+
+from aiohttp import web
+
+try:
+    from http_fixtures import GeekBenchFixtureGenerator
+except ImportError:
+    from .http_fixtures import GeekBenchFixtureGenerator
+
+
+# 검색 키(k)별 검색 유형 (HTTPUrl과 동일)
+SEARCH_KEYS = {
+    "v6_cpu": "cpu",
+    "v6_compute": "gpu",
+    "ai": "ai",
+}
+
+# 결과 상세 페이지 경로별 검색 유형 (http_fixtures.RESULT_PATHS와 동일)
+RESULT_ROUTES = {
+    "/v6/cpu/{result_id}": "cpu",
+    "/v6/compute/{result_id}": "gpu",
+    "/ai/v1/{result_id}": "ai",
+}
+
+
+class MockGeekBenchServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        total_pages: int | dict = 20,
+        generator: GeekBenchFixtureGenerator = None,
+        latency: float | tuple = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: tuple = (500, 502, 503),
+        throttle_rate: float = 0.0,
+        max_requests_per_second: float = None,
+        burst: int = 1,
+        retry_after: float | None = 1,
+        seed: int = 0
+        ):
+        """/search?k=v6_cpu|v6_compute|ai&q=...&page=... 와 결과 상세 페이지를 합성 페이지로 응답하는 로컬 긱벤치 브라우저 모의 서버."""
+        self.host = host
+        self.port = port # 0이면 사용 가능한 포트를 자동으로 선택 (start() 후 실제 포트로 변경)
+
+        # 쿼리별 전체 페이지 수 (dict이면 {쿼리: 페이지 수}, 없는 쿼리는 "did not match any" 페이지만 응답)
+        self.total_pages = total_pages
+        self.generator = GeekBenchFixtureGenerator(seed=seed) if generator is None else generator
+
+        # 응답 지연 시간(초) (tuple이면 (최소, 최대) 범위의 균등 분포)
+        self.latency = latency
+
+        # 오류 응답 비율 및 상태 코드
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+
+        # 429 응답: 무작위 비율(throttle_rate) 및 서버 측 토큰 버킷(max_requests_per_second, burst) 초과 시
+        self.throttle_rate = throttle_rate
+        self.max_requests_per_second = max_requests_per_second
+        self.burst = burst
+        self.retry_after = retry_after # 429 응답의 Retry-After(초) (None이면 헤더 없음)
+
+        self._random = random.Random(seed)
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._runner = None
+
+        # 응답 통계: {상태 코드: 응답 수}
+        self.status_counts = dict()
+        self.request_count = 0
+
+    @property
+    def base_url(self) -> str:
+        # AsyncGeekBenchBrowserAPI(base_url=...)에 전달할 검색 URL
+        return f"http://{self.host}:{self.port}/search?"
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/search", self._handle_search)
+        for route, search_type in RESULT_ROUTES.items():
+            app.router.add_get(route, self._make_result_handler(search_type=search_type))
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+        # 자동 선택된 포트 확인
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def reset_stats(self) -> None:
+        self.status_counts.clear()
+        self.request_count = 0
+
+    def get_total_pages(self, query: str) -> int:
+        if isinstance(self.total_pages, dict):
+            return self.total_pages.get(query, 0)
+        return self.total_pages
+
+    def _is_rate_limited(self) -> bool:
+        # 서버 측 토큰 버킷 (초당 요청 수를 넘으면 429)
+        if self.max_requests_per_second is None:
+            return False
+
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated_at) * self.max_requests_per_second)
+        self._updated_at = now
+
+        if self._tokens < 1:
+            return True
+        self._tokens -= 1
+        return False
+
+    def _response_delay(self) -> float:
+        if isinstance(self.latency, tuple):
+            return self._random.uniform(*self.latency)
+        return self.latency
+
+    def _respond(self, status: int, **kwargs) -> web.Response:
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        return web.Response(status=status, **kwargs)
+
+    async def _check_request(self) -> web.Response | None:
+        # 모든 요청 공통: 응답 지연 후 요청 제한(429) 또는 서버 오류 응답 (정상 요청이면 None)
+        self.request_count += 1
+
+        delay = self._response_delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        # 요청 제한 (429)
+        if self._is_rate_limited() or self._random.random() < self.throttle_rate:
+            headers = dict() if self.retry_after is None else {"Retry-After": str(int(self.retry_after))}
+            return self._respond(status=429, text="Too Many Requests", headers=headers)
+
+        # 서버 오류
+        if self._random.random() < self.error_rate:
+            return self._respond(status=self._random.choice(self.error_statuses), text="Server Error")
+
+        return None
+
+    async def _handle_search(self, request: web.Request) -> web.Response:
+        error_response = await self._check_request()
+        if error_response is not None:
+            return error_response
+
+        search_type = SEARCH_KEYS.get(request.query.get("k", ""))
+        if search_type is None:
+            return self._respond(status=404, text="Not Found")
+
+        query = request.query.get("q", "")
+        try:
+            page = max(1, int(request.query.get("page", "1")))
+        except ValueError:
+            page = 1
+
+        # 마지막 페이지 이후는 "did not match any" 페이지
+        content = self.generator.search_page_html(search_type=search_type, query=query, page=page, total_pages=self.get_total_pages(query=query))
+        return self._respond(status=200, text=content, content_type="text/html", charset="utf-8")
+
+    def _make_result_handler(self, search_type: str):
+        async def handle_result(request: web.Request) -> web.Response:
+            error_response = await self._check_request()
+            if error_response is not None:
+                return error_response
+
+            # 가장 큰 고유 번호보다 큰 결과는 존재하지 않음
+            result_id = request.match_info["result_id"]
+            if not result_id.isdigit() or int(result_id) > self.generator.top_result_id:
+                return self._respond(status=404, text="Not Found")
+
+            content = self.generator.result_page_html(search_type=search_type, result_id=int(result_id))
+            return self._respond(status=200, text=content, content_type="text/html", charset="utf-8")
+
+        return handle_result
+
+
+if __name__ == "__main__":
+    # 사용 예시: 모의 서버를 실행하고 API로 수집 (네트워크 요청 없음)
+    from http_requester import AsyncGeekBenchBrowserAPI
+
+    async def main():
+        async with MockGeekBenchServer(total_pages=5, latency=(0.01, 0.05), throttle_rate=0.1, retry_after=1) as server:
+            async with AsyncGeekBenchBrowserAPI(base_url=server.base_url) as api_requester:
+                async for page, current_page, current_last_page, _ in api_requester.search_client(search_type="cpu", query="samsung", last_page=10, min_delay=0, max_delay=0):
+                    print(current_page, current_last_page, len(page.results))
+            print("응답 상태:", server.status_counts)
+
+    asyncio.run(main())
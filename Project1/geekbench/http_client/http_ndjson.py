@@ -0,0 +1,103 @@
+import json
+import os
+
+try:
+    from http_json_parser import GeekBenchJSONParser
+    from http_metrics import timed_storage
+    from http_records import make_result_record
+except ImportError:
+    from .http_json_parser import GeekBenchJSONParser
+    from .http_metrics import timed_storage
+    from .http_records import make_result_record
+
+
+class NDJSONResultLog:
+    def __init__(self, log_path: str, batch_size: int = 100, fsync: bool = False):
+        """파싱된 결과를 한 줄에 하나씩 추가 기록하는 NDJSON 로그 (추가 전용)."""
+        self.log_path = log_path
+        self.batch_size = batch_size # 버퍼에 모아 한 번에 기록할 줄 수
+        self.fsync = fsync # 기록할 때마다 디스크 동기화 여부
+
+        # 디렉토리가 존재하지 않으면 생성
+        if os.path.dirname(log_path):
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+
+        self._log_file = open(log_path, 'a', encoding='utf-8')
+        self._buffer = list()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def append(self, query: str, page_number: int, result_url: str, details: dict) -> None:
+        self._buffer.append(json.dumps(
+            {"query": query, "page": page_number, "url": result_url, "result": details},
+            ensure_ascii=False
+            ))
+
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+
+        self._log_file.write("\n".join(self._buffer) + "\n")
+        self._log_file.flush()
+        if self.fsync:
+            os.fsync(self._log_file.fileno())
+
+        self._buffer.clear()
+
+    def close(self) -> None:
+        if not self._log_file.closed:
+            self.flush()
+            self._log_file.close()
+
+    @staticmethod
+    def iter_records(log_path: str):
+        # 로그의 각 줄을 순서대로 반환 (비정상 종료로 잘린 줄은 건너뜀)
+        if not os.path.exists(log_path):
+            return
+
+        with open(log_path, 'r', encoding='utf-8') as log_file:
+            for line in log_file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    @staticmethod
+    def compact(log_path: str) -> dict:
+        return NDJSONResultLog.compact_many(log_paths=[log_path])
+
+    @staticmethod
+    @timed_storage(operation="compact")
+    def compact_many(log_paths: list[str]) -> dict:
+        # 여러 로그(예: 작업자별 결과)를 하나로 압축
+        # 고유 번호 기준 중복 제거 (먼저 기록된 결과 유지, store_geekbench_data와 동일)
+        collected_data = dict() # {query: {고유 번호: 결과 레코드}}
+        for log_path in log_paths:
+            for record in NDJSONResultLog.iter_records(log_path=log_path):
+                query_results = collected_data.setdefault(record["query"], dict())
+                result_record = make_result_record(result_url=record["url"], details=record["result"])
+                if result_record.result_id not in query_results:
+                    query_results[result_record.result_id] = result_record
+
+        # 고유 번호 내림차순 정렬 후 기존 JSON 형식(25개 단위 페이지)으로 구성
+        json_parser = GeekBenchJSONParser()
+        return json_parser._paginate_data(data=json_parser._sort_urls_by_unique_id(merge_data=collected_data))
+
+
+if __name__ == "__main__":
+    # 사용 예시: 비정상 종료 후 남은 로그를 기존 JSON 형식으로 압축
+    log_path = r"geekbench_data_log\samsung s5e9945_1.ndjson"
+    GeekBenchJSONParser.save_data_to_json(
+        file_path=r"geekbench_data_json\samsung s5e9945_1.json",
+        data=NDJSONResultLog.compact(log_path=log_path)
+        )
@@ -0,0 +1,153 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from http_parser import GeekBenchSearchPage, get_parser_engine
+    from http_metrics import get_global_metrics, ROW_BUCKETS
+except ImportError:
+    from .http_parser import GeekBenchSearchPage, get_parser_engine
+    from .http_metrics import get_global_metrics, ROW_BUCKETS
+
+
+class ParsedSearchPage:
+    def __init__(self, benchmark_type: str, results: list[dict], is_last_page: bool, max_page_number: int | None):
+        """프로세스 풀에서 파싱된 검색 페이지 (GeekBenchSearchPage와 같은 속성을 제공)"""
+        self.benchmark_type = benchmark_type
+        self.results = results
+        self.is_last_page = is_last_page
+        self.max_page_number = max_page_number
+
+    def fetch_total_pages(self, default_pages: int) -> int:
+        return default_pages if self.max_page_number is None else self.max_page_number
+
+
+def observe_parsed_page(engine_name: str, parse_seconds: float, row_count: int) -> None:
+    # 페이지당 파싱 시간 및 결과 수 기록 (이벤트 루프 프로세스의 레지스트리에 기록)
+    metrics = get_global_metrics()
+    metrics.histogram("geekbench_parse_seconds", "Time spent parsing one search page.").observe(parse_seconds, engine=engine_name)
+    metrics.histogram("geekbench_parse_rows", "Result rows parsed from one search page.", buckets=ROW_BUCKETS).observe(row_count, engine=engine_name)
+
+
+def _parse_search_page(benchmark_type: str, content: str | None, engine_name: str) -> tuple[list[dict], bool, int | None, float]:
+    # 작업 프로세스에서 실행 (반환값은 피클링 가능한 기본 자료형만 사용)
+    # 작업 프로세스의 레지스트리는 합쳐지지 않으므로 파싱 시간을 함께 반환
+    start_time = time.perf_counter()
+    page = GeekBenchSearchPage(benchmark_type=benchmark_type, content=content, engine=engine_name)
+    results, is_last_page, max_page_number = page.results, page.is_last_page, page.max_page_number
+    return results, is_last_page, max_page_number, time.perf_counter() - start_time
+
+
+class GeekBenchParsePool:
+    def __init__(self, max_workers: int = None, queue_size: int = None, engine: str | object = None):
+        """검색 페이지 HTML 파싱을 프로세스 풀로 넘겨 이벤트 루프가 요청을 계속 처리하도록 합니다."""
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        # 요청 단계와 파싱 단계 사이 큐 크기 (가득 차면 요청 단계가 대기)
+        self.queue_size = queue_size or self.max_workers * 2
+
+        # 작업 프로세스에는 엔진 이름만 전달 (컴파일된 선택자는 프로세스마다 생성)
+        self.engine_name = get_parser_engine(engine).name
+
+        self.executor = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self) -> None:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    async def __aenter__(self):
+        self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    async def aclose(self) -> None:
+        # 작업 프로세스 종료를 기본 스레드 풀에서 대기 (이벤트 루프를 막지 않음)
+        if self.executor is not None:
+            executor, self.executor = self.executor, None
+            await asyncio.get_running_loop().run_in_executor(None, lambda: executor.shutdown(wait=True, cancel_futures=True))
+
+    async def parse(self, benchmark_type: str, content: str | None) -> ParsedSearchPage:
+        # 한 페이지를 작업 프로세스에서 파싱
+        self.open()
+        loop = asyncio.get_running_loop()
+        results, is_last_page, max_page_number, parse_seconds = await loop.run_in_executor(
+            self.executor, _parse_search_page, benchmark_type, content, self.engine_name
+            )
+        observe_parsed_page(engine_name=self.engine_name, parse_seconds=parse_seconds, row_count=len(results))
+
+        return ParsedSearchPage(
+            benchmark_type=benchmark_type,
+            results=results,
+            is_last_page=is_last_page,
+            max_page_number=max_page_number
+            )
+
+    async def parse_pages(self, benchmark_type: str, raw_pages, on_parsed=None):
+        # (페이지 번호, HTML)을 받아 파싱 작업을 제출하고, 페이지 순서대로 (파싱된 페이지, 페이지 번호) 반환
+        # on_parsed(페이지 번호, 파싱된 페이지)는 파싱이 끝나는 즉시 호출 (반환 순서와 무관, 예: 마지막 페이지 확인 후 요청 중단)
+        queue = asyncio.Queue(maxsize=self.queue_size)
+
+        async def submit_pages():
+            try:
+                async for current_page, content in raw_pages:
+                    # 큐가 가득 차면 다음 페이지 요청을 멈춤 (백프레셔)
+                    if isinstance(content, ParsedSearchPage):
+                        # 304 응답으로 재사용된 페이지는 다시 파싱하지 않음
+                        parse_task = asyncio.get_running_loop().create_future()
+                        parse_task.set_result(content)
+                    else:
+                        parse_task = asyncio.ensure_future(self.parse(benchmark_type=benchmark_type, content=content))
+                    if on_parsed is not None:
+                        parse_task.add_done_callback(lambda task, current_page=current_page: self._notify_parsed(on_parsed, current_page, task))
+                    await queue.put((current_page, parse_task))
+
+                await queue.put(None) # 종료 표시
+
+            except Exception as error:
+                # 요청 단계에서 발생한 예외는 소비자에게 전달
+                await queue.put(error)
+
+            finally:
+                await raw_pages.aclose()
+
+        producer = asyncio.create_task(submit_pages())
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+
+                current_page, parse_task = item
+                yield await parse_task, current_page
+
+        finally:
+            # 소비가 중단된 경우 남은 요청 및 파싱 작업 정리
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            while not queue.empty():
+                item = queue.get_nowait()
+                if isinstance(item, tuple):
+                    item[1].cancel()
+
+    @staticmethod
+    def _notify_parsed(on_parsed, current_page: int, parse_task: asyncio.Future) -> None:
+        if not parse_task.cancelled() and parse_task.exception() is None:
+            on_parsed(current_page, parse_task.result())
@@ -1,18 +1,25 @@
+import re
 from bs4 import BeautifulSoup
 
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    etree = None
+
 try:
     from utils.date_utils import parse_date_from_text, extract_date_components
-    from utils.http_utils import separate_device_and_cpu
+    from utils.http_utils import separate_device_and_cpu, make_soup, is_last_page, fetch_total_pages_parser
 except ImportError:
     from .utils.date_utils import parse_date_from_text, extract_date_components
-    from .utils.http_utils import separate_device_and_cpu
+    from .utils.http_utils import separate_device_and_cpu, make_soup, is_last_page, fetch_total_pages_parser
 
 
 class GeekBenchSearchParser:
     @staticmethod
-    def parse_search_benchmark(benchmark_type: str, content: str):
-        # BeautifulSoup을 사용하여 HTML 파싱
-        soup = BeautifulSoup(markup=content, features="lxml")
+    def parse_search_benchmark(benchmark_type: str, content: str | BeautifulSoup):
+        # BeautifulSoup을 사용하여 HTML 파싱 (이미 파싱된 경우 재사용)
+        soup = make_soup(content)
 
         # 벤치마크 결과 선택
         benchmark_results = GeekBenchSearchParser._get_benchmark_results(soup, benchmark_type)        
@@ -63,6 +70,40 @@ class GeekBenchSearchParser:
             core_scores["api_name"] = result.select_one(selector="#wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 > div:nth-child(2) > div > div > div > div:nth-child(4) > span.list-col-text").get_text(strip=True)
             core_scores["api_score"] = int(result.select_one(selector="#wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 > div:nth-child(2) > div > div > div > div:nth-child(5) > span.list-col-text-score").get_text(strip=True))
 
+        return GeekBenchSearchParser._build_cpu_gpu_data(
+            device_name=device_name,
+            cpu_model=cpu_model,
+            upload_date=upload_date,
+            platform_name=platform_name,
+            result_url=result_url,
+            core_scores=core_scores
+            )
+
+
+    @staticmethod
+    def _extract_ai_data(result):
+        device_name_and_cpu_model = result.select_one(selector="#wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 > div.banff > div > div > table > tbody > tr > td.device > a").get_text(strip=False)
+        device_name, cpu_model = separate_device_and_cpu(device_name_and_cpu_model)
+        framework_name = result.select_one(selector="#wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 > div.banff > div > div > table > tbody > tr > td.framework").get_text(strip=True)
+        single_precision = result.select_one(selector="#wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 > div.banff > div > div > table > tbody > tr > td:nth-child(3)").get_text(strip=True)
+        half_precision = result.select_one(selector="#wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 > div.banff > div > div > table > tbody > tr > td:nth-child(4)").get_text(strip=True)
+        quantized = result.select_one(selector="#wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 > div.banff > div > div > table > tbody > tr > td:nth-child(5)").get_text(strip=True)
+        result_url = "https://browser.geekbench.com" + result.select_one(selector="#wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 > div.banff > div > div > table > tbody > tr > td.device > a")["href"]
+        
+        return GeekBenchSearchParser._build_ai_data(
+            device_name=device_name,
+            cpu_model=cpu_model,
+            framework_name=framework_name,
+            single_precision=single_precision,
+            half_precision=half_precision,
+            quantized=quantized,
+            result_url=result_url
+            )
+
+
+    @staticmethod
+    def _build_cpu_gpu_data(device_name: str, cpu_model: str, upload_date: str, platform_name: str, result_url: str, core_scores: dict) -> dict:
+        """추출된 CPU 및 GPU 필드로 결과 딕셔너리를 생성하는 헬퍼 함수 (모든 파서 엔진 공용)"""
         # 날짜 정보를 추출
         upload_date_components = extract_date_components(upload_date)
 
@@ -87,15 +128,8 @@ class GeekBenchSearchParser:
 
 
     @staticmethod
-    def _extract_ai_data(result):
-        device_name_and_cpu_model = result.select_one(selector="#wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 > div.banff > div > div > table > tbody > tr > td.device > a").get_text(strip=False)
-        device_name, cpu_model = separate_device_and_cpu(device_name_and_cpu_model)
-        framework_name = result.select_one(selector="#wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 > div.banff > div > div > table > tbody > tr > td.framework").get_text(strip=True)
-        single_precision = result.select_one(selector="#wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 > div.banff > div > div > table > tbody > tr > td:nth-child(3)").get_text(strip=True)
-        half_precision = result.select_one(selector="#wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 > div.banff > div > div > table > tbody > tr > td:nth-child(4)").get_text(strip=True)
-        quantized = result.select_one(selector="#wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 > div.banff > div > div > table > tbody > tr > td:nth-child(5)").get_text(strip=True)
-        result_url = "https://browser.geekbench.com" + result.select_one(selector="#wrap > div > div > div > div:nth-child(3) > div.col-12.col-lg-9 > div.banff > div > div > table > tbody > tr > td.device > a")["href"]
-        
+    def _build_ai_data(device_name: str, cpu_model: str, framework_name: str, single_precision: str, half_precision: str, quantized: str, result_url: str) -> dict:
+        """추출된 AI 필드로 결과 딕셔너리를 생성하는 헬퍼 함수 (모든 파서 엔진 공용)"""
         core_scores = {
             "single_precision": int(single_precision),
             "half_precision": int(half_precision),  
@@ -112,4 +146,289 @@ class GeekBenchSearchParser:
                 "framework_name": framework_name,
                 "core_scores": core_scores
             }
-        }
\ No newline at end of file
+        }
+
+
+class GeekBenchResultParser:
+    @staticmethod
+    def parse_result_detail(content: str | BeautifulSoup) -> dict:
+        """결과 상세 페이지에서 점수, 워크로드별 점수, 시스템 정보를 추출합니다."""
+        soup = make_soup(content)
+
+        return {
+            "scores": GeekBenchResultParser._extract_scores(soup),
+            "workloads": GeekBenchResultParser._extract_workloads(soup),
+            "system_info": GeekBenchResultParser._extract_system_info(soup),
+        }
+
+    @staticmethod
+    def _to_int(text: str) -> int | None:
+        # 점수 문자열을 정수로 변환 (숫자가 아니면 None)
+        text = text.strip().replace(",", "")
+        return int(text) if text.isdigit() else None
+
+    @staticmethod
+    def _extract_scores(soup) -> dict:
+        # 상단 점수 (예: {"Single-Core Score": 2261, "Multi-Core Score": 7012})
+        scores = dict()
+        for container in soup.select("div.score-container"):
+            score = container.select_one("div.score")
+            note = container.select_one("div.note")
+            if score is not None and note is not None:
+                scores[note.get_text(strip=True)] = GeekBenchResultParser._to_int(score.get_text(strip=True))
+
+        return scores
+
+    @staticmethod
+    def _section_name(table) -> str | None:
+        # 표 바로 앞의 제목 (예: "Single-Core Performance")
+        heading = table.find_previous(["h2", "h3"])
+        return heading.get_text(strip=True) if heading is not None else None
+
+    @staticmethod
+    def _extract_workloads(soup) -> dict:
+        # 섹션별 워크로드 점수 (예: {"Single-Core Performance": {"File Compression": {"score": 2016, "description": "289.5 MB/sec"}}})
+        workloads = dict()
+        for table in soup.select("table.benchmark-table"):
+            section = workloads.setdefault(GeekBenchResultParser._section_name(table), dict())
+            for row in table.select("tr"):
+                name = row.select_one("td.name")
+                score = row.select_one("td.score")
+                if name is None or score is None:
+                    continue
+
+                description = score.select_one("span.description")
+                section[name.get_text(strip=True)] = {
+                    "score": GeekBenchResultParser._to_int(next(score.stripped_strings, "")),
+                    "description": description.get_text(strip=True) if description is not None else None,
+                }
+
+        return workloads
+
+    @staticmethod
+    def _extract_system_info(soup) -> dict:
+        # 섹션별 시스템 정보 (예: {"System Information": {"Operating System": "Android 14"}})
+        system_info = dict()
+        for table in soup.select("table.system-table"):
+            header = table.select_one("thead th")
+            section = system_info.setdefault(header.get_text(strip=True) if header is not None else None, dict())
+            for row in table.select("tr"):
+                name = row.select_one("td.system-name")
+                value = row.select_one("td.system-value")
+                if name is not None and value is not None:
+                    section[name.get_text(strip=True)] = value.get_text(" ", strip=True)
+
+        return system_info
+
+
+class BeautifulSoupParserEngine:
+    """BeautifulSoup(soupsieve) 기반 파서 엔진 (기본 폴백)"""
+    name = "bs4"
+
+    def parse(self, content: str):
+        return make_soup(content)
+
+    def is_last_page(self, document) -> bool:
+        return is_last_page(content=document)
+
+    def fetch_max_page_number(self, document) -> int | None:
+        return fetch_total_pages_parser(content=document, default_pages=None)
+
+    def parse_results(self, document, benchmark_type: str):
+        return GeekBenchSearchParser.parse_search_benchmark(benchmark_type=benchmark_type, content=document)
+
+
+class LxmlParserEngine:
+    """lxml XPath 기반 고속 파서 엔진 (행 기준 상대 선택자, 1회 컴파일)"""
+    name = "lxml"
+
+    def __init__(self):
+        # class 토큰 일치 조건 (CSS의 .class 선택자와 동일)
+        def has_class(*class_names: str) -> str:
+            return " and ".join(f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')" for class_name in class_names)
+
+        # 페이지 기준 결과 행 선택자
+        content_column = f"//*[@id='wrap']/div/div/div/*[3][self::div]/div[{has_class('col-12', 'col-lg-9')}]"
+        self._cpu_gpu_rows = etree.XPath(f"{content_column}/*[2][self::div]/div")
+        self._ai_rows = etree.XPath(f"{content_column}/div[{has_class('banff')}]/div/div/table/tbody/tr")
+
+        # CPU 및 GPU 행 기준 상대 선택자
+        self._device_link = etree.XPath(f"div/div/div[{has_class('col-12', 'col-lg-4')}]/a")
+        self._cpu_model = etree.XPath(f"div/div/div[{has_class('col-12', 'col-lg-4')}]/span[{has_class('list-col-model')}]")
+        self._column_text = {index: etree.XPath(f"div/div/*[{index}][self::div]/span[{has_class('list-col-text')}]") for index in (2, 3, 4)}
+        self._column_score = {index: etree.XPath(f"div/div/*[{index}][self::div]/span[{has_class('list-col-text-score')}]") for index in (4, 5)}
+
+        # AI 행 기준 상대 선택자
+        self._ai_device_link = etree.XPath(f"td[{has_class('device')}]/a")
+        self._ai_framework = etree.XPath(f"td[{has_class('framework')}]")
+        self._ai_column = {index: etree.XPath(f"*[{index}][self::td]") for index in (3, 4, 5)}
+
+        # 화면에 표시되는 텍스트 (BeautifulSoup get_text()와 같이 script/style 제외)
+        self._visible_text = etree.XPath("//text()[not(ancestor::script or ancestor::style or ancestor::template)]")
+
+        # 페이지네이션 선택자
+        self._page_links = etree.XPath(f"//li[{has_class('page-item')}]")
+        self._page_link = etree.XPath(f".//a[{has_class('page-link')}]")
+
+    @staticmethod
+    def _get_text(element, strip: bool) -> str:
+        # BeautifulSoup get_text()와 동일한 규칙으로 텍스트 결합
+        if strip:
+            return "".join(text.strip() for text in element.itertext())
+        return "".join(element.itertext())
+
+    @staticmethod
+    def _select_one(selector, element):
+        # select_one과 같이 문서 순서상 첫 번째 요소 반환
+        return selector(element)[0]
+
+    def parse(self, content: str):
+        # 빈 본문은 lxml에서 오류가 발생하므로 빈 문서로 대체
+        if not content.strip():
+            return lxml.html.document_fromstring("<html></html>")
+        return lxml.html.document_fromstring(content)
+
+    def is_last_page(self, document) -> bool:
+        page_text = "".join(text.strip() for text in self._visible_text(document))
+        return re.search(r"Your search did not match any .* results.", page_text) is not None
+
+    def fetch_max_page_number(self, document) -> int | None:
+        page_numbers = []
+        for page in self._page_links(document):
+            links = self._page_link(page)
+            if links:
+                text = self._get_text(links[0], strip=True)
+                if text.isdigit():
+                    page_numbers.append(int(text))
+
+        return max(page_numbers, default=None)
+
+    def parse_results(self, document, benchmark_type: str):
+        if benchmark_type in ["cpu", "gpu"]:
+            for result in self._cpu_gpu_rows(document):
+                yield self._extract_cpu_gpu_data(result, benchmark_type)
+
+        elif benchmark_type == "ai":
+            for result in self._ai_rows(document):
+                yield self._extract_ai_data(result)
+
+        else:
+            raise ValueError(f"Invalid benchmark_type: {benchmark_type}")  # 잘못된 benchmark_type에 대해 ValueError 발생
+
+    def _extract_cpu_gpu_data(self, result, benchmark_type: str):
+        device_link = self._select_one(self._device_link, result)
+        device_name = self._get_text(device_link, strip=True)
+        cpu_model = self._get_text(self._select_one(self._cpu_model, result), strip=False).replace("\n", " ").strip()
+        upload_date = self._get_text(self._select_one(self._column_text[2], result), strip=False)
+        platform_name = self._get_text(self._select_one(self._column_text[3], result), strip=True)
+        result_url = "https://browser.geekbench.com" + device_link.get("href")
+
+        # 벤치마크 유형에 따라 추가 데이터 추출
+        core_scores = {}
+        if benchmark_type == "cpu":
+            core_scores["single"] = int(self._get_text(self._select_one(self._column_score[4], result), strip=True))
+            core_scores["multi"] = int(self._get_text(self._select_one(self._column_score[5], result), strip=True))
+
+        elif benchmark_type == "gpu":
+            core_scores["api_name"] = self._get_text(self._select_one(self._column_text[4], result), strip=True)
+            core_scores["api_score"] = int(self._get_text(self._select_one(self._column_score[5], result), strip=True))
+
+        return GeekBenchSearchParser._build_cpu_gpu_data(
+            device_name=device_name,
+            cpu_model=cpu_model,
+            upload_date=upload_date,
+            platform_name=platform_name,
+            result_url=result_url,
+            core_scores=core_scores
+            )
+
+    def _extract_ai_data(self, result):
+        device_link = self._select_one(self._ai_device_link, result)
+        device_name, cpu_model = separate_device_and_cpu(self._get_text(device_link, strip=False))
+
+        return GeekBenchSearchParser._build_ai_data(
+            device_name=device_name,
+            cpu_model=cpu_model,
+            framework_name=self._get_text(self._select_one(self._ai_framework, result), strip=True),
+            single_precision=self._get_text(self._select_one(self._ai_column[3], result), strip=True),
+            half_precision=self._get_text(self._select_one(self._ai_column[4], result), strip=True),
+            quantized=self._get_text(self._select_one(self._ai_column[5], result), strip=True),
+            result_url="https://browser.geekbench.com" + device_link.get("href")
+            )
+
+
+# 사용 가능한 파서 엔진 목록
+PARSER_ENGINES = {
+    BeautifulSoupParserEngine.name: BeautifulSoupParserEngine,
+    LxmlParserEngine.name: LxmlParserEngine,
+}
+
+# 기본 파서 엔진 (lxml을 사용할 수 없으면 BeautifulSoup으로 폴백)
+DEFAULT_PARSER_ENGINE = LxmlParserEngine.name if etree is not None else BeautifulSoupParserEngine.name
+
+_parser_engine_instances = dict()
+
+
+def get_parser_engine(engine: str | object = None):
+    # 이미 생성된 엔진 객체는 그대로 사용
+    if engine is not None and not isinstance(engine, str):
+        return engine
+
+    engine_name = DEFAULT_PARSER_ENGINE if engine is None else engine
+    if engine_name not in PARSER_ENGINES:
+        raise ValueError(f"Invalid parser engine: {engine_name}. Use one of {list(PARSER_ENGINES)}.")
+
+    if engine_name == LxmlParserEngine.name and etree is None:
+        raise ValueError("lxml is not installed. Use the 'bs4' parser engine instead.")
+
+    # 선택자 컴파일은 엔진별로 한 번만 수행
+    if engine_name not in _parser_engine_instances:
+        _parser_engine_instances[engine_name] = PARSER_ENGINES[engine_name]()
+
+    return _parser_engine_instances[engine_name]
+
+
+class GeekBenchSearchPage:
+    def __init__(self, benchmark_type: str, content: str | None, engine: str | object = None):
+        """응답 본문을 한 번만 파싱하여 결과, 마지막 페이지 여부, 페이지 수를 제공합니다."""
+        self.benchmark_type = benchmark_type
+        self.content = content
+        self.engine = get_parser_engine(engine)
+
+        # 요청 실패(None) 시에는 빈 페이지로 취급
+        self.document = self.engine.parse(content) if content is not None else None
+
+        # 지연 계산 결과 캐시
+        self._results = None
+        self._is_last_page = None
+        self._max_page_number = None
+
+    @property
+    def results(self) -> list[dict]:
+        # 결과 행 파싱 (최초 접근 시 한 번만 수행)
+        if self._results is None:
+            if self.document is None:
+                self._results = []
+            else:
+                self._results = list(self.engine.parse_results(document=self.document, benchmark_type=self.benchmark_type))
+
+        return self._results
+
+    @property
+    def is_last_page(self) -> bool:
+        # "did not match any" 문구 확인
+        if self._is_last_page is None:
+            self._is_last_page = self.document is not None and self.engine.is_last_page(document=self.document)
+
+        return self._is_last_page
+
+    @property
+    def max_page_number(self) -> int | None:
+        # 페이지네이션의 가장 큰 페이지 번호 (없으면 None)
+        if self._max_page_number is None and self.document is not None:
+            self._max_page_number = self.engine.fetch_max_page_number(document=self.document)
+
+        return self._max_page_number
+
+    def fetch_total_pages(self, default_pages: int) -> int:
+        return default_pages if self.max_page_number is None else self.max_page_number
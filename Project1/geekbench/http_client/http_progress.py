@@ -0,0 +1,221 @@
+import json
+import math
+import time
+from datetime import datetime, timedelta
+
+try:
+    from utils.date_utils import format_datetime, convert_timedelta_to_dhms
+except ImportError:
+    from .utils.date_utils import format_datetime, convert_timedelta_to_dhms
+
+
+class RunningStats:
+    def __init__(self, smoothing: float = 0.2):
+        """값을 저장하지 않고 평균, 표준편차(Welford), 지수 이동 평균을 O(1)로 갱신하는 누적 통계."""
+        self.smoothing = smoothing # 지수 이동 평균 가중치 (새 관측값 비중)
+        self.count = 0
+        self.mean = 0.0
+        self.ema = None
+        self._m2 = 0.0 # 편차 제곱합
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.ema = value if self.ema is None else self.smoothing * value + (1 - self.smoothing) * self.ema
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+class QueryProgress:
+    def __init__(self, query: str, request_mode: str, total_pages: int, start_page: int, smoothing: float = 0.2):
+        """쿼리 하나의 수집 진행 상황 (페이지당 실제 소요 시간과 대기 시간의 누적 통계)."""
+        self.query = query
+        self.request_mode = request_mode
+        self.total_pages = total_pages
+        self.start_page = start_page
+        self.current_page = start_page - 1
+        self.current_last_page = None
+        self.results = 0
+
+        self.started_at = datetime.now()
+        self._started_monotonic = time.monotonic()
+        self._updated_monotonic = self._started_monotonic
+
+        self.page_seconds = RunningStats(smoothing=smoothing) # 페이지 사이 실제 경과 시간 (요청 지연 + 대기 + 파싱 + 저장)
+        self.delay_seconds = RunningStats(smoothing=smoothing) # 요청 단계에서 보고한 대기(지연) 시간
+
+    def update(self, current_page: int, current_last_page: int, page_delay: float, results: int = 0) -> None:
+        now = time.monotonic()
+        self.page_seconds.add(now - self._updated_monotonic)
+        self.delay_seconds.add(page_delay)
+        self._updated_monotonic = now
+
+        self.current_page = current_page
+        self.current_last_page = current_last_page
+        self.results += results
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.monotonic() - self._started_monotonic
+
+    @property
+    def completed_pages(self) -> int:
+        return self.page_seconds.count
+
+    @property
+    def remaining_seconds(self) -> float | None:
+        # 남은 페이지 수 × 페이지당 실제 소요 시간(지수 이동 평균)
+        if self.page_seconds.ema is None:
+            return None
+        return max(0, self.total_pages - self.current_page) * self.page_seconds.ema
+
+    def to_dict(self) -> dict:
+        remaining_seconds = self.remaining_seconds
+        elapsed_seconds = self.elapsed_seconds
+        return {
+            "query": self.query,
+            "request_mode": self.request_mode,
+            "current_page": self.current_page,
+            "total_pages": self.total_pages,
+            "current_last_page": self.current_last_page,
+            "progress": self.current_page / self.total_pages * 100 if self.total_pages > 0 else None,
+            "completed_pages": self.completed_pages,
+            "results": self.results,
+            "pages_per_second": self.completed_pages / elapsed_seconds if elapsed_seconds > 0 else None,
+            "page_seconds_ema": self.page_seconds.ema,
+            "page_seconds_mean": self.page_seconds.mean,
+            "page_seconds_std": self.page_seconds.std,
+            "delay_seconds_mean": self.delay_seconds.mean,
+            "started_at": self.started_at.isoformat(),
+            "elapsed_seconds": elapsed_seconds,
+            "remaining_seconds": remaining_seconds,
+            "estimated_completion_at": None if remaining_seconds is None else (datetime.now() + timedelta(seconds=remaining_seconds)).isoformat(),
+        }
+
+
+class GeekBenchProgressReporter:
+    def __init__(self, log_interval: float = 5.0, json_lines: bool = False, smoothing: float = 0.2, output: object = print):
+        """여러 쿼리의 수집 진행 상황을 모아 log_interval초마다 한 번 출력하는 진행 상황 보고기."""
+        self.log_interval = log_interval # 출력 간격(초), 0이면 페이지마다 출력
+        self.json_lines = json_lines # True면 한 줄에 JSON 객체 하나씩 출력
+        self.smoothing = smoothing
+        self.output = output
+
+        self.active = dict() # {query: QueryProgress} 수집 중인 쿼리
+        self.finished = list() # 수집이 끝난 쿼리의 최종 상태
+        self._last_report_at = None
+
+    def start(self, query: str, request_mode: str, total_pages: int, start_page: int = 1) -> QueryProgress:
+        progress = QueryProgress(query=query, request_mode=request_mode, total_pages=total_pages, start_page=start_page, smoothing=self.smoothing)
+        self.active[query] = progress
+        return progress
+
+    def update(self, query: str, current_page: int, current_last_page: int, page_delay: float, results: int = 0) -> None:
+        # 통계만 갱신하고 출력은 log_interval초마다 한 번 (모든 쿼리를 함께 출력)
+        self.active[query].update(current_page=current_page, current_last_page=current_last_page, page_delay=page_delay, results=results)
+
+        now = time.monotonic()
+        if self._last_report_at is None or now - self._last_report_at >= self.log_interval:
+            self._last_report_at = now
+            self.report()
+
+    def finish(self, query: str) -> None:
+        # 수집 완료 시에는 간격과 관계없이 최종 상태 출력
+        progress = self.active.pop(query, None)
+        if progress is None:
+            return
+
+        state = progress.to_dict()
+        self.finished.append(state)
+        self._emit(event="finished", states=[state])
+
+    def report(self) -> None:
+        states = [progress.to_dict() for progress in self.active.values()]
+        if states:
+            self._emit(event="progress", states=states)
+
+    def summary(self) -> dict:
+        # 수집 중 및 완료된 모든 쿼리의 합계
+        states = self.finished + [progress.to_dict() for progress in self.active.values()]
+        elapsed_seconds = max((state["elapsed_seconds"] for state in states), default=0.0)
+        completed_pages = sum(state["completed_pages"] for state in states)
+        return {
+            "queries": len(states),
+            "active_queries": len(self.active),
+            "completed_pages": completed_pages,
+            "results": sum(state["results"] for state in states),
+            "elapsed_seconds": elapsed_seconds,
+            "pages_per_second": completed_pages / elapsed_seconds if elapsed_seconds > 0 else None,
+        }
+
+    def report_summary(self) -> None:
+        self._emit(event="summary", states=[], summary=self.summary())
+
+    def _emit(self, event: str, states: list[dict], summary: dict = None) -> None:
+        if self.json_lines:
+            for state in states:
+                self.output(json.dumps({"event": event, "time": datetime.now().isoformat(), **state}, ensure_ascii=False))
+            if summary is not None:
+                self.output(json.dumps({"event": event, "time": datetime.now().isoformat(), **summary}, ensure_ascii=False))
+            return
+
+        for state in states:
+            self.output(self._format_state(event=event, state=state))
+        if summary is not None:
+            self.output(self._format_summary(summary=summary))
+
+        # 여러 쿼리를 함께 출력한 경우 전체 합계 추가
+        if len(states) > 1:
+            self.output(self._format_summary(summary=self.summary()))
+        self.output("") # 줄바꿈
+
+    @staticmethod
+    def _format_duration(total_seconds: float | None) -> str:
+        if total_seconds is None:
+            return "계산 중"
+        days, hours, minutes, seconds = convert_timedelta_to_dhms(total_seconds=total_seconds)
+        return f"{days:,.0f}일 {hours:,.0f}시간 {minutes:,.0f}분 {seconds:,.0f}초"
+
+    def _format_state(self, event: str, state: dict) -> str:
+        progress = "-" if state["progress"] is None else f"{state['progress']:,.2f}%"
+        page_seconds = "-" if state["page_seconds_ema"] is None else f"{state['page_seconds_ema']:,.2f}초/페이지"
+        line = (
+            f"[{state['request_mode']}] {state['query']}: {state['current_page']:,}/{state['total_pages']:,} 페이지 ({progress}), "
+            f"{page_seconds}, 결과 {state['results']:,}개, 경과 {self._format_duration(state['elapsed_seconds'])}"
+        )
+
+        if event == "finished":
+            return line + ", 완료"
+
+        # 새로운 데이터 모드: 수집 중 페이지 수가 늘어났으면 병합 필요
+        if state["request_mode"] != "merge mode" and state["current_last_page"] not in (None, -99999) and state["current_last_page"] != state["total_pages"]:
+            line += f", 현재 마지막 페이지 {state['current_last_page']:,} (병합 필요)"
+
+        estimated_completion = ""
+        if state["remaining_seconds"] is not None:
+            completion_time = datetime.now() + timedelta(seconds=state["remaining_seconds"])
+            estimated_completion = f" (예상 완료 {format_datetime(original_datetime=completion_time.strftime('%Y-%m-%d %H:%M:%S.%f'))})"
+
+        return line + f", 남은 시간 {self._format_duration(state['remaining_seconds'])}{estimated_completion}"
+
+    def _format_summary(self, summary: dict) -> str:
+        pages_per_second = "-" if summary["pages_per_second"] is None else f"{summary['pages_per_second']:,.2f}"
+        return (
+            f"전체: 쿼리 {summary['queries']}개 (수집 중 {summary['active_queries']}개), "
+            f"{summary['completed_pages']:,} 페이지, 결과 {summary['results']:,}개, 초당 {pages_per_second} 페이지"
+        )
+
+
+if __name__ == "__main__":
+    # 사용 예시
+    reporter = GeekBenchProgressReporter(log_interval=0.5)
+    reporter.start(query="samsung s5e9945", request_mode="new mode", total_pages=10)
+    for current_page in range(1, 11):
+        time.sleep(0.1)
+        reporter.update(query="samsung s5e9945", current_page=current_page, current_last_page=10, page_delay=0.1, results=25)
+    reporter.finish(query="samsung s5e9945")
+    reporter.report_summary()
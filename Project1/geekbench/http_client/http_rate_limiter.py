@@ -0,0 +1,291 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+
+
+class TokenBucketRateLimiter:
+    def __init__(self, requests_per_second: float = 2.0, burst: int = 2):
+        """초당 요청 수와 버스트 크기로 요청 속도를 제한하는 토큰 버킷."""
+        self.requests_per_second = None
+        self.burst = None
+        self._tokens = None
+        self.configure(requests_per_second=requests_per_second, burst=burst)
+
+        # 버킷은 가득 찬 상태로 시작
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+
+    def configure(self, requests_per_second: float = None, burst: int = None) -> None:
+        # 변경 전까지 쌓인 토큰은 기존 속도로 보충
+        if self._tokens is not None:
+            self._refill(time.monotonic())
+
+        # 초당 요청 수 및 버스트 크기 변경 (None이면 기존 값 유지)
+        if requests_per_second is not None:
+            if requests_per_second <= 0:
+                raise ValueError("requests_per_second must be greater than 0.")
+            self.requests_per_second = float(requests_per_second)
+
+        if burst is not None:
+            if burst < 1:
+                raise ValueError("burst must be at least 1.")
+            self.burst = int(burst)
+
+    def _refill(self, now: float) -> None:
+        # 경과 시간만큼 토큰 보충 (버스트 크기까지)
+        elapsed = now - self._updated_at
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.requests_per_second)
+        self._updated_at = now
+
+    def _reserve(self) -> float:
+        # 토큰 하나를 예약하고 대기해야 할 시간 반환
+        # (await 없이 한 번에 처리되므로 이벤트 루프 안에서는 잠금이 필요 없음)
+        self._refill(time.monotonic())
+        self._tokens -= 1
+
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.requests_per_second
+
+    async def acquire(self) -> float:
+        # 요청 전에 호출하여 토큰을 얻을 때까지 대기, 실제 대기 시간 반환
+        wait_time = self._reserve()
+
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+        return wait_time
+
+
+class SharedTokenBucketRateLimiter:
+    def __init__(self, db_path: str, requests_per_second: float = 2.0, burst: int = 2, name: str = "geekbench"):
+        """여러 작업자 프로세스(또는 디렉토리를 공유하는 머신)가 하나의 요청 예산을 나눠 쓰는 SQLite 토큰 버킷."""
+        self.db_path = db_path
+        self.name = name # 같은 파일에서 여러 버킷을 구분하는 이름
+
+        # 디렉토리가 존재하지 않으면 생성
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        # 네트워크 파일 시스템에서 디렉토리를 공유할 수 있도록 WAL 대신 롤백 저널 사용 (SQLiteJobQueue와 동일)
+        # 토큰 예약은 이벤트 루프를 막지 않도록 작업 스레드에서 실행 (연결은 잠금으로 한 번에 하나의 스레드만 사용)
+        self.connection = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.connection.execute("PRAGMA journal_mode=DELETE")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rate_limiters (
+                name TEXT PRIMARY KEY,
+                requests_per_second REAL NOT NULL,
+                burst INTEGER NOT NULL,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+
+        # 처음 만든 프로세스의 설정으로 생성 (버킷은 가득 찬 상태로 시작)
+        self.connection.execute(
+            "INSERT OR IGNORE INTO rate_limiters (name, requests_per_second, burst, tokens, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (name, float(requests_per_second), int(burst), float(burst), time.time())
+        )
+
+        self.requests_per_second, self.burst = self.connection.execute(
+            "SELECT requests_per_second, burst FROM rate_limiters WHERE name = ?", (name,)
+        ).fetchone()
+
+    def configure(self, requests_per_second: float = None, burst: int = None) -> None:
+        # 공유 설정 변경 (변경 전까지 쌓인 토큰은 기존 속도로 보충)
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0.")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1.")
+
+        # 설정이 바뀌지 않으면 공유 파일에 쓰기 잠금을 걸지 않음
+        if (requests_per_second is None or float(requests_per_second) == self.requests_per_second) and (burst is None or int(burst) == self.burst):
+            return
+
+        with self._lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._refill(time.time())
+                self.connection.execute(
+                    "UPDATE rate_limiters SET requests_per_second = COALESCE(?, requests_per_second), burst = COALESCE(?, burst) WHERE name = ?",
+                    (None if requests_per_second is None else float(requests_per_second), None if burst is None else int(burst), self.name)
+                )
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+
+        if requests_per_second is not None:
+            self.requests_per_second = float(requests_per_second)
+        if burst is not None:
+            self.burst = int(burst)
+
+    def _refill(self, now: float) -> float:
+        # 경과 시간만큼 토큰 보충 후 남은 토큰 수 반환 (트랜잭션 안에서 호출)
+        requests_per_second, burst, tokens, updated_at = self.connection.execute(
+            "SELECT requests_per_second, burst, tokens, updated_at FROM rate_limiters WHERE name = ?", (self.name,)
+        ).fetchone()
+        self.requests_per_second, self.burst = requests_per_second, burst
+
+        tokens = min(float(burst), tokens + max(0.0, now - updated_at) * requests_per_second)
+        self.connection.execute("UPDATE rate_limiters SET tokens = ?, updated_at = ? WHERE name = ?", (tokens, now, self.name))
+        return tokens
+
+    def _reserve(self) -> float:
+        # 토큰 하나를 예약하고 대기해야 할 시간 반환 (쓰기 잠금으로 프로세스 간 원자적으로 처리)
+        with self._lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                tokens = self._refill(time.time()) - 1
+                self.connection.execute("UPDATE rate_limiters SET tokens = ? WHERE name = ?", (tokens, self.name))
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+
+        if tokens >= 0:
+            return 0.0
+        return -tokens / self.requests_per_second
+
+    async def acquire(self) -> float:
+        # 요청 전에 호출하여 토큰을 얻을 때까지 대기, 실제 대기 시간 반환
+        # (다른 작업자가 쓰기 잠금을 잡고 있으면 최대 30초 대기하므로 작업 스레드에서 예약)
+        wait_time = await asyncio.to_thread(self._reserve)
+
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+        return wait_time
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
+
+
+class AIMDRateController:
+    def __init__(
+        self,
+        rate_limiter: TokenBucketRateLimiter,
+        min_rate: float = 0.1,
+        max_rate: float = None,
+        additive_increase: float = 0.05,
+        multiplicative_decrease: float = 0.5,
+        decrease_cooldown: float = 2.0
+        ):
+        """429 응답 시 요청 속도를 줄이고(곱셈 감소), 성공 시 천천히 늘리는(덧셈 증가) 속도 조절기."""
+        if not 0 < multiplicative_decrease < 1:
+            raise ValueError("multiplicative_decrease must be between 0 and 1.")
+
+        self.rate_limiter = rate_limiter
+        self.min_rate = min_rate # 최소 초당 요청 수
+        self.max_rate = rate_limiter.requests_per_second if max_rate is None else max_rate # 최대 초당 요청 수 (None이면 생성 시 속도 제한기의 초당 요청 수)
+        self.additive_increase = additive_increase # 초당 요청 수 증가량 (성공 요청 1초 분량마다)
+        self.multiplicative_decrease = multiplicative_decrease # 429 응답 시 곱할 비율
+        self.decrease_cooldown = decrease_cooldown # 연속 감소 방지 시간(초)
+
+        self.success_count = 0
+        self.throttle_count = 0
+        self._last_decrease_at = None
+
+    @property
+    def rate(self) -> float:
+        return self.rate_limiter.requests_per_second
+
+    def _set_rate(self, rate: float) -> None:
+        rate = min(self.max_rate, max(self.min_rate, rate))
+
+        # 속도가 바뀐 경우에만 설정 변경 (공유 속도 제한기는 변경할 때마다 쓰기 잠금)
+        if rate != self.rate:
+            self.rate_limiter.configure(requests_per_second=rate)
+
+    def on_success(self) -> None:
+        # 성공할 때마다 1/rate 만큼 증가시켜 초당 약 additive_increase씩 속도 회복
+        self.success_count += 1
+        self._set_rate(self.rate + self.additive_increase / self.rate)
+
+    def on_throttle(self) -> None:
+        self.throttle_count += 1
+
+        # 동시에 진행 중이던 요청의 429가 한꺼번에 도착해도 한 번만 감소
+        now = time.monotonic()
+        if self._last_decrease_at is not None and now - self._last_decrease_at < self.decrease_cooldown:
+            return
+
+        self._last_decrease_at = now
+        self._set_rate(self.rate * self.multiplicative_decrease)
+
+    def snapshot(self) -> dict:
+        # 체크포인트에 기록할 현재 상태 (재시작 후 같은 속도에서 이어서 요청)
+        return {
+            "rate": self.rate,
+            "burst": self.rate_limiter.burst,
+            "success_count": self.success_count,
+            "throttle_count": self.throttle_count,
+        }
+
+    def restore(self, snapshot: dict) -> None:
+        # 체크포인트의 요청 속도 복원 (최소/최대 속도 범위 안에서)
+        self._set_rate(snapshot["rate"])
+        self.success_count = snapshot.get("success_count", 0)
+        self.throttle_count = snapshot.get("throttle_count", 0)
+
+
+# 프로세스 전역에서 공유되는 요청 속도 제한기 및 속도 조절기
+_global_rate_limiter = None
+_global_rate_controller = None
+_global_rate_configured = False # 호출자가 초당 요청 수를 직접 지정했는지 여부 (기본값 2.0만 사용 중이면 False)
+
+
+def get_global_rate_limiter(requests_per_second: float = None, burst: int = None) -> TokenBucketRateLimiter:
+    global _global_rate_limiter, _global_rate_configured
+
+    if requests_per_second is not None:
+        _global_rate_configured = True
+
+    # 최초 호출 시 생성, 이후에는 값이 주어진 경우에만 설정 변경
+    if _global_rate_limiter is None:
+        _global_rate_limiter = TokenBucketRateLimiter(
+            requests_per_second=2.0 if requests_per_second is None else requests_per_second,
+            burst=2 if burst is None else burst
+            )
+    else:
+        _global_rate_limiter.configure(requests_per_second=requests_per_second, burst=burst)
+
+    # 직접 지정한 초당 요청 수는 속도 조절기의 최대 속도로도 사용 (429 이후 이 속도까지만 회복)
+    if requests_per_second is not None and _global_rate_controller is not None:
+        _global_rate_controller.max_rate = float(requests_per_second)
+
+    return _global_rate_limiter
+
+
+def is_global_rate_configured() -> bool:
+    # 순차 요청(search_client)은 min_delay~max_delay 대기로 속도를 조절하므로 직접 지정된 경우에만 전역 속도 제한 적용
+    return _global_rate_configured
+
+
+def get_global_rate_controller() -> AIMDRateController:
+    global _global_rate_controller
+
+    # 전역 속도 제한기를 조절하는 속도 조절기 (최초 호출 시 생성)
+    if _global_rate_controller is None:
+        _global_rate_controller = AIMDRateController(rate_limiter=get_global_rate_limiter())
+
+    return _global_rate_controller
+
+
+if __name__ == "__main__":
+    # 사용 예시
+    async def main():
+        rate_limiter = TokenBucketRateLimiter(requests_per_second=5, burst=2)
+        start_time = time.monotonic()
+
+        for index in range(10):
+            await rate_limiter.acquire()
+            print(f"{index}: {time.monotonic() - start_time:.2f}초")
+
+    asyncio.run(main())
@@ -0,0 +1,264 @@
+import sys
+from abc import abstractmethod
+from collections.abc import Mapping
+from functools import lru_cache
+
+try:
+    from utils.date_utils import parse_date_from_text, extract_date_components
+except ImportError:
+    from .utils.date_utils import parse_date_from_text, extract_date_components
+
+
+# 결과 딕셔너리의 키 순서 (GeekBenchSearchParser._build_cpu_gpu_data, _build_ai_data와 동일)
+CPU_GPU_KEYS = ("system", "upload_date", "platform", "core_scores")
+AI_KEYS = ("system", "framework_name", "core_scores")
+SYSTEM_KEYS = ("device_name", "cpu_model")
+CPU_SCORE_KEYS = ("single", "multi")
+GPU_SCORE_KEYS = ("api_name", "api_score")
+AI_SCORE_KEYS = ("single_precision", "half_precision", "quantized")
+
+
+def _intern(value):
+    # 반복되는 문자열(기기, CPU, 플랫폼 이름 등)은 하나의 객체를 공유
+    return sys.intern(value) if type(value) is str else value
+
+
+@lru_cache(maxsize=4096)
+def _upload_date_items(default: str) -> tuple:
+    # 원본 날짜 문자열에서 업로드 날짜 필드 생성 (같은 날짜는 한 번만 계산)
+    upload_date_components = extract_date_components(default) or dict()
+    return (
+        ("default", default),
+        ("parsed", parse_date_from_text(default)),
+        ("year", upload_date_components.get("year")),
+        ("month", upload_date_components.get("month")),
+        ("day", upload_date_components.get("day")),
+    )
+
+
+def _split_result_url(result_url: str) -> tuple | None:
+    # 결과 URL을 (공통 접두사, 고유 번호)로 분리 (예: https://browser.geekbench.com/v6/cpu/123 -> ("https://browser.geekbench.com/v6/cpu/", 123))
+    prefix, _, result_id = result_url.rpartition("/")
+    if not result_id.isdigit() or (result_id[0] == "0" and result_id != "0"):
+        return None
+    return _intern(prefix + "/"), int(result_id)
+
+
+def _has_keys(value, keys: tuple) -> bool:
+    return type(value) is dict and tuple(value) == keys
+
+
+class GeekBenchResultRecord(Mapping):
+    """검색 결과 하나를 담는 슬롯 기반 레코드의 기본 클래스.
+
+    고유 번호(정수)와 URL 접두사만 보관하고, 기존 JSON 형식의 딕셔너리는 to_dict()로 필요할 때 생성합니다.
+    Mapping이므로 record["system"]처럼 기존 결과 딕셔너리와 같이 읽을 수 있습니다 (요청한 필드만 생성).
+    """
+    __slots__ = ("result_id", "url_prefix")
+
+    # 결과 딕셔너리의 키 순서 (하위 클래스에서 정의)
+    KEYS = ()
+
+    @property
+    def result_url(self) -> str:
+        return f"{self.url_prefix}{self.result_id}"
+
+    @abstractmethod
+    def to_dict(self) -> dict:
+        ...
+
+    @abstractmethod
+    def __getitem__(self, key):
+        ...
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.result_url!r}, {self.to_dict()!r})"
+
+
+class CPUGPUResultRecord(GeekBenchResultRecord):
+    __slots__ = ("device_name", "cpu_model", "upload_date", "platform")
+
+    # CPU 및 GPU 결과 공통 필드 (점수 필드는 하위 클래스에서 정의)
+    def __init__(self, result_id: int, url_prefix: str, device_name: str, cpu_model: str, upload_date: str, platform: str):
+        self.result_id = result_id
+        self.url_prefix = url_prefix
+        self.device_name = _intern(device_name)
+        self.cpu_model = _intern(cpu_model)
+        self.upload_date = _intern(upload_date) # 원본 날짜 문자열 (parsed, year, month, day는 직렬화할 때 생성)
+        self.platform = _intern(platform)
+
+    KEYS = CPU_GPU_KEYS
+
+    @abstractmethod
+    def _core_scores(self) -> dict:
+        ...
+
+    def to_dict(self) -> dict:
+        return {
+            "system": {
+                "device_name": self.device_name,
+                "cpu_model": self.cpu_model,
+            },
+            "upload_date": dict(_upload_date_items(self.upload_date)),
+            "platform": self.platform,
+            "core_scores": self._core_scores()
+        }
+
+    def __getitem__(self, key):
+        if key == "system":
+            return {"device_name": self.device_name, "cpu_model": self.cpu_model}
+        if key == "upload_date":
+            return dict(_upload_date_items(self.upload_date))
+        if key == "platform":
+            return self.platform
+        if key == "core_scores":
+            return self._core_scores()
+        raise KeyError(key)
+
+
+class CPUResultRecord(CPUGPUResultRecord):
+    __slots__ = ("single", "multi")
+
+    def __init__(self, result_id: int, url_prefix: str, device_name: str, cpu_model: str, upload_date: str, platform: str, single: int, multi: int):
+        super().__init__(result_id, url_prefix, device_name, cpu_model, upload_date, platform)
+        self.single = single
+        self.multi = multi
+
+    def _core_scores(self) -> dict:
+        return {"single": self.single, "multi": self.multi}
+
+
+class GPUResultRecord(CPUGPUResultRecord):
+    __slots__ = ("api_name", "api_score")
+
+    def __init__(self, result_id: int, url_prefix: str, device_name: str, cpu_model: str, upload_date: str, platform: str, api_name: str, api_score: int):
+        super().__init__(result_id, url_prefix, device_name, cpu_model, upload_date, platform)
+        self.api_name = _intern(api_name)
+        self.api_score = api_score
+
+    def _core_scores(self) -> dict:
+        return {"api_name": self.api_name, "api_score": self.api_score}
+
+
+class AIResultRecord(GeekBenchResultRecord):
+    __slots__ = ("device_name", "cpu_model", "framework_name", "single_precision", "half_precision", "quantized")
+
+    KEYS = AI_KEYS
+
+    def __init__(self, result_id: int, url_prefix: str, device_name: str, cpu_model: str, framework_name: str, single_precision: int, half_precision: int, quantized: int):
+        self.result_id = result_id
+        self.url_prefix = url_prefix
+        self.device_name = _intern(device_name)
+        self.cpu_model = _intern(cpu_model)
+        self.framework_name = _intern(framework_name)
+        self.single_precision = single_precision
+        self.half_precision = half_precision
+        self.quantized = quantized
+
+    def to_dict(self) -> dict:
+        return {
+            "system": {
+                "device_name": self.device_name,
+                "cpu_model": self.cpu_model,
+            },
+            "framework_name": self.framework_name,
+            "core_scores": {
+                "single_precision": self.single_precision,
+                "half_precision": self.half_precision,
+                "quantized": self.quantized
+            }
+        }
+
+    def __getitem__(self, key):
+        if key == "system":
+            return {"device_name": self.device_name, "cpu_model": self.cpu_model}
+        if key == "framework_name":
+            return self.framework_name
+        if key == "core_scores":
+            return {"single_precision": self.single_precision, "half_precision": self.half_precision, "quantized": self.quantized}
+        raise KeyError(key)
+
+
+class RawResultRecord(GeekBenchResultRecord):
+    __slots__ = ("_result_url", "details")
+
+    # 알려진 구조가 아닌 결과 (예: 상세 정보가 추가된 결과)는 딕셔너리를 그대로 보관
+    def __init__(self, result_url: str, details: dict):
+        self.result_id = int(result_url.split('/')[-1])
+        self.url_prefix = None
+        self._result_url = result_url
+        self.details = details
+
+    @property
+    def result_url(self) -> str:
+        return self._result_url
+
+    def to_dict(self) -> dict:
+        return self.details
+
+    def __getitem__(self, key):
+        return self.details[key]
+
+    def __iter__(self):
+        return iter(self.details)
+
+    def __len__(self) -> int:
+        return len(self.details)
+
+
+def make_result_record(result_url: str, details: dict) -> GeekBenchResultRecord:
+    """결과 URL과 결과 딕셔너리로 레코드를 생성합니다 (to_dict()는 원래 딕셔너리와 같은 값을 반환)."""
+    if isinstance(details, GeekBenchResultRecord):
+        return details
+
+    url_parts = _split_result_url(result_url)
+    system = details.get("system") if isinstance(details, dict) else None
+    core_scores = details.get("core_scores") if isinstance(details, dict) else None
+
+    if url_parts is not None and _has_keys(system, SYSTEM_KEYS):
+        url_prefix, result_id = url_parts
+
+        if _has_keys(details, CPU_GPU_KEYS):
+            # 업로드 날짜 필드가 원본 날짜 문자열로 다시 만들어지는 경우에만 문자열만 보관
+            upload_date = details["upload_date"]
+            default = upload_date.get("default") if isinstance(upload_date, dict) else None
+            if isinstance(default, str) and list(upload_date.items()) == list(_upload_date_items(default)):
+                if _has_keys(core_scores, CPU_SCORE_KEYS):
+                    return CPUResultRecord(result_id, url_prefix, system["device_name"], system["cpu_model"], default, details["platform"], core_scores["single"], core_scores["multi"])
+                if _has_keys(core_scores, GPU_SCORE_KEYS):
+                    return GPUResultRecord(result_id, url_prefix, system["device_name"], system["cpu_model"], default, details["platform"], core_scores["api_name"], core_scores["api_score"])
+
+        elif _has_keys(details, AI_KEYS) and _has_keys(core_scores, AI_SCORE_KEYS):
+            return AIResultRecord(
+                result_id, url_prefix, system["device_name"], system["cpu_model"], details["framework_name"],
+                core_scores["single_precision"], core_scores["half_precision"], core_scores["quantized"]
+                )
+
+    return RawResultRecord(result_url=result_url, details=details)
+
+
+def encode_result_record(value):
+    # json.dump(default=...)용: 레코드를 기존 JSON 형식의 딕셔너리로 변환
+    if isinstance(value, GeekBenchResultRecord):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if __name__ == "__main__":
+    # 사용 예시
+    record = make_result_record(
+        result_url="https://browser.geekbench.com/v6/cpu/123",
+        details={
+            "system": {"device_name": "samsung SM-S928N", "cpu_model": "ARM ARMv8 2265 MHz (8 cores)"},
+            "upload_date": {"default": "Feb 17, 2025", "parsed": "2025-02-17", "year": 2025, "month": 2, "day": 17},
+            "platform": "Android",
+            "core_scores": {"single": 2100, "multi": 6500}
+        }
+    )
+    print(type(record).__name__, record.result_id, record.to_dict())
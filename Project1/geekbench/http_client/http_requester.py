@@ -5,55 +5,329 @@ import time
 import random
 from urllib.parse import urlencode, urljoin
 from functools import wraps
+from contextlib import asynccontextmanager, aclosing
 
 try:
     from http_url import HTTPUrl
     from http_headers import HTTPHeaders
-    from utils.http_utils import is_last_page, fetch_total_pages_parser
+    from http_parser import GeekBenchSearchPage, get_parser_engine
+    from http_rate_limiter import get_global_rate_limiter, get_global_rate_controller, is_global_rate_configured, AIMDRateController
+    from http_retry import RetryPolicy, GeekBenchFetchError
+    from http_cache import GeekBenchResponseCache
+    from http_parse_pool import ParsedSearchPage, observe_parsed_page
+    from http_validators import GeekBenchValidatorStore
+    from http_metrics import get_global_metrics
     
 except ImportError:
     from .http_url import HTTPUrl
     from .http_headers import HTTPHeaders
-    from .utils.http_utils import is_last_page, fetch_total_pages_parser
+    from .http_parser import GeekBenchSearchPage, get_parser_engine
+    from .http_rate_limiter import get_global_rate_limiter, get_global_rate_controller, is_global_rate_configured, AIMDRateController
+    from .http_retry import RetryPolicy, GeekBenchFetchError
+    from .http_cache import GeekBenchResponseCache
+    from .http_parse_pool import ParsedSearchPage, observe_parsed_page
+    from .http_validators import GeekBenchValidatorStore
+    from .http_metrics import get_global_metrics
 
 
 
 class AsyncGeekBenchBrowserAPI:
-    def __init__(self):
+    def __init__(
+        self,
+        parser_engine: str = None,
+        rate_limiter: object = None,
+        rate_controller: object = None,
+        retry_policy: RetryPolicy = None,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        ttl_dns_cache: int = 300,
+        request_timeout: float = 30,
+        response_cache: GeekBenchResponseCache = None,
+        replay: bool = False,
+        replay_before: float = None,
+        validator_store: GeekBenchValidatorStore = None,
+        base_url: str = None
+        ):
         """긱벤치 브라우저 API 초기화."""
         
-        # 긱벤치 브라우저 URL 관리
-        self.url_manager = HTTPUrl()
+        # 긱벤치 브라우저 URL 관리 (base_url이 주어지면 해당 서버로 요청, 예: 로컬 모의 서버)
+        self.url_manager = HTTPUrl(base_url=base_url)
         
         # 긱벤치 브라우저 요청 headers 관리
         self.headers_manager = HTTPHeaders()
 
-    @staticmethod
+        # 검색 페이지 파서 엔진 ("lxml" 또는 "bs4", None이면 기본 엔진)
+        self.parser_engine = get_parser_engine(parser_engine)
+
+        # 요청 속도 제한기 (None이면 프로세스 전역 토큰 버킷을 공유)
+        self.rate_limiter = get_global_rate_limiter() if rate_limiter is None else rate_limiter
+        self._uses_global_rate_limiter = rate_limiter is None
+
+        # 429/성공 응답에 따라 요청 속도를 조절하는 AIMD 속도 조절기
+        if rate_controller is None:
+            rate_controller = get_global_rate_controller() if rate_limiter is None else AIMDRateController(rate_limiter=self.rate_limiter)
+        self.rate_controller = rate_controller
+
+        # 재시도 정책 (지수 백오프, 최대 시도 횟수, Retry-After)
+        self.retry_policy = RetryPolicy() if retry_policy is None else retry_policy
+
+        # 커넥션 풀 설정 (전체 연결 수, 호스트당 연결 수, DNS 캐시 유지 시간(초))
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.request_timeout = request_timeout # 요청당 전체 제한 시간(초)
+
+        # 원본 HTML 캐시 (replay=True이면 네트워크 대신 캐시에서 페이지를 제공)
+        if replay and response_cache is None:
+            raise ValueError("replay mode requires a response_cache.")
+        self.response_cache = response_cache
+        self.replay = replay
+        self.replay_before = replay_before # 재생할 기준 시각 (None이면 가장 최근 본문)
+
+        # 조건부 요청 검증값 저장소 (304 응답 시 이전 파싱 결과 재사용)
+        self.validator_store = validator_store
+
+        # async with 블록 동안 모든 요청이 공유하는 세션
+        self.session = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _create_session(self) -> ClientSession:
+        # 커넥션 풀 및 DNS 캐시를 사용하는 세션 생성
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=self.ttl_dns_cache
+            )
+        return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.request_timeout))
+
+    async def open(self) -> None:
+        # 공유 세션 생성 (이미 열려 있으면 재사용)
+        if self.session is None or self.session.closed:
+            self.session = self._create_session()
+
+    async def close(self) -> None:
+        # 공유 세션 종료 (keep-alive 연결 정리)
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+        # 기록되지 않은 조건부 요청 검증값 저장 (저장소는 생성한 쪽에서 닫음)
+        if self.validator_store is not None:
+            self.validator_store.flush()
+
+    @asynccontextmanager
+    async def _session_scope(self):
+        # 공유 세션이 열려 있으면 재사용, 아니면 이번 호출 동안만 사용할 세션 생성
+        if self.session is not None and not self.session.closed:
+            yield self.session
+        else:
+            async with self._create_session() as session:
+                yield session
+
     async def _fetch(
+        self,
         session: ClientSession,
         url: str, 
         payload:dict, 
-        headers:dict
+        headers:dict,
+        rate_limited: bool = True
         ) -> str:
-        
-        async with session.get(url, params=payload, headers=headers) as response:
-            # 응답 상태 코드 처리
-            if response.status == 200:
-                return await response.text(encoding="utf-8")  # 성공적으로 응답을 받은 경우
-            
-            # 재시도할 상태 코드 리스트
-            retry_statuses = {429, 500, 503}
-            
-            if response.status in retry_statuses:
-                print(f"Received {response.status} error, waiting for 5 seconds before retrying...")
-                await asyncio.sleep(5)  # 재시도 전에 5초 대기
-                return await AsyncGeekBenchBrowserAPI._fetch(session=session, url=url, payload=payload, headers=headers)  # 재귀적으로 요청 재시도
-            
-            # 기타 오류 상태에 대한 처리
-            print(f"Error: Received status code {response.status} for URL: {url}")
-            print(f"Error: Received status code {response.status} for PAYLOAD: {payload}")
-            return None  # 오류 상태일 경우 None 반환
 
+        _, content, _ = await self._fetch_response(session=session, url=url, payload=payload, headers=headers, rate_limited=rate_limited)
+        return content
+
+
+    async def _fetch_response(
+        self,
+        session: ClientSession,
+        url: str,
+        payload: dict,
+        headers: dict,
+        rate_limited: bool = True
+        ) -> tuple[int, str | None, object]:
+        # (상태 코드, 본문, 응답 헤더) 반환 (304 응답은 본문 없이 성공으로 처리)
+
+        max_attempts = self.retry_policy.max_attempts
+        metrics = get_global_metrics()
+
+        for attempt in range(1, max_attempts + 1):
+            # 전역 요청 속도 제한 (재시도 요청도 포함)
+            if rate_limited:
+                wait_time = await self.rate_limiter.acquire()
+                metrics.histogram("geekbench_rate_limit_wait_seconds", "Time spent waiting for a rate limiter token.").observe(wait_time)
+
+            retry_after = None
+            start_time = time.perf_counter()
+            status = None
+            try:
+                async with session.get(url, params=payload, headers=headers) as response:
+                    status = str(response.status)
+
+                    # 응답 상태 코드 처리
+                    if response.status == 200:
+                        body = await response.read()  # 성공적으로 응답을 받은 경우
+                        content = body.decode("utf-8")
+                        metrics.counter("geekbench_fetch_bytes_total", "Response body bytes received.").inc(len(body))
+                        self._observe_fetch(metrics=metrics, status=status, start_time=start_time)
+                        self.rate_controller.on_success()
+                        return response.status, content, response.headers.copy()
+
+                    # 조건부 요청 결과 변경 없음
+                    if response.status == 304:
+                        self._observe_fetch(metrics=metrics, status=status, start_time=start_time)
+                        self.rate_controller.on_success()
+                        return response.status, None, response.headers.copy()
+
+                    # 429 응답 시 요청 속도 감소
+                    if response.status == 429:
+                        self.rate_controller.on_throttle()
+
+                    # 재시도하지 않는 오류 상태에 대한 처리
+                    if not self.retry_policy.is_retry_status(response.status):
+                        raise GeekBenchFetchError(f"Received status code {response.status} for URL: {url}, PAYLOAD: {payload}", status=response.status)
+
+                    retry_after = self.retry_policy.parse_retry_after(response.headers.get("Retry-After"))
+                    error = GeekBenchFetchError(f"Received status code {response.status} for URL: {url}, PAYLOAD: {payload}", status=response.status)
+
+            # 연결 오류 및 시간 초과도 재시도
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                status = type(e).__name__
+                error = GeekBenchFetchError(f"{type(e).__name__}: {e} for URL: {url}, PAYLOAD: {payload}")
+
+            finally:
+                # 성공 응답은 위에서 기록 (오류 응답 및 연결 오류만 여기서 기록)
+                if status is not None and status not in ("200", "304"):
+                    self._observe_fetch(metrics=metrics, status=status, start_time=start_time)
+
+            # 최대 시도 횟수 초과 시 예외 발생 (None 페이지가 파서로 넘어가지 않도록)
+            if attempt == max_attempts:
+                metrics.counter("geekbench_fetch_failures_total", "Requests that failed after all retry attempts.").inc(status=status)
+                raise error
+
+            metrics.counter("geekbench_fetch_retries_total", "Retried requests by the status that caused the retry.").inc(status=status)
+            delay = self.retry_policy.compute_delay(attempt=attempt, retry_after=retry_after)
+            print(f"{error} ({attempt}/{max_attempts}), waiting for {delay:.2f} seconds before retrying...")
+            await asyncio.sleep(delay)  # 재시도 전 대기
+
+
+    @staticmethod
+    def _observe_fetch(metrics: object, status: str, start_time: float) -> None:
+        # 요청 한 번(시도 단위)의 지연 시간 및 상태 코드 기록
+        metrics.histogram("geekbench_fetch_seconds", "Latency of one request attempt.").observe(time.perf_counter() - start_time, status=status)
+        metrics.counter("geekbench_fetch_responses_total", "Request attempts by response status.").inc(status=status)
+
+
+
+    async def _fetch_search_page(self, session: ClientSession, search_type: str, query: str, current_page: int, rate_limited: bool = True, response_validators: dict = None) -> str | ParsedSearchPage:
+        # 재생 모드에서는 캐시된 본문 반환 (네트워크 요청 없음)
+        if self.replay:
+            content = self.response_cache.load(search_type=search_type, query=query, page=current_page, fetched_before=self.replay_before)
+            if content is None:
+                raise GeekBenchFetchError(f"Page not found in response cache: {search_type}, {query}, page {current_page}")
+            return content
+
+        # 현재 페이지에 대한 payload 및 headers 생성 (Referer는 요청 단위로 지정)
+        url, payload = self._get_search_url_and_payload(search_type=search_type, query=query, start_page=current_page)
+
+        # 조건부 요청 (이전 검증값이 있으면 If-None-Match/If-Modified-Since 전송, 없으면 None으로 생략)
+        etag, last_modified = (None, None)
+        if self.validator_store is not None:
+            etag, last_modified = self.validator_store.get_validators(search_type=search_type, query=query, page=current_page)
+        headers = self._get_search_headers(
+            search_type=search_type,
+            referer=url + "?" + urlencode(payload),
+            if_none_match=etag,
+            if_modified_since=last_modified
+            )
+
+        if self.validator_store is not None:
+            status, content, response_headers = await self._fetch_response(session=session, url=url, payload=payload, headers=headers, rate_limited=rate_limited)
+
+            # 변경 없음: 이전 파싱 결과 재사용 (다운로드 및 파싱 생략)
+            if status == 304:
+                previous_page = self.validator_store.get_page(search_type=search_type, query=query, page=current_page)
+                if previous_page is None:
+                    raise GeekBenchFetchError(f"Received status code 304 without a stored page for URL: {url}, PAYLOAD: {payload}", status=status)
+                return previous_page
+
+            # 파싱이 끝난 뒤 파싱 결과와 함께 기록 (호출 단위 딕셔너리에 보관)
+            if response_validators is not None:
+                response_validators[current_page] = (response_headers.get("ETag"), response_headers.get("Last-Modified"))
+
+        else:
+            # 비동기 요청 결과를 가져오기 (전역 속도 제한은 _fetch에서 적용)
+            content = await self._fetch(
+                session=session,
+                url=url,
+                payload=payload,
+                headers=headers,
+                rate_limited=rate_limited
+            )
+
+        # 파싱 전에 원본 HTML 저장
+        if self.response_cache is not None:
+            self.response_cache.store(search_type=search_type, query=query, page=current_page, content=content)
+
+        return content
+
+
+    async def fetch_result_page(self, search_type: str, result_url: str) -> str:
+        # 결과 상세 페이지 원본 HTML (검색 페이지와 같은 세션, 속도 제한, 재시도 정책 사용)
+        if self.replay:
+            raise GeekBenchFetchError(f"Result pages are not available in replay mode: {result_url}")
+
+        async with self._session_scope() as session:
+            return await self._fetch(
+                session=session,
+                url=self.url_manager.get_result_url(result_url),
+                payload=None,
+                headers=self._get_search_headers(search_type=search_type, referer=self.url_manager.base_url)
+            )
+
+
+    def _get_search_headers(self, search_type: str, **overlay) -> dict[str, str]:
+        headers = self.headers_manager.get_search_headers(search_type=search_type, **overlay)
+
+        # 다른 서버로 요청하는 경우 Host 헤더는 aiohttp가 URL에 맞게 지정
+        if self.url_manager.base_url != HTTPUrl.BASE_URL:
+            headers.pop("Host", None)
+
+        return headers
+
+
+    def _to_search_page(self, search_type: str, content: str | ParsedSearchPage):
+        # 304 응답으로 재사용된 페이지는 다시 파싱하지 않음
+        if isinstance(content, ParsedSearchPage):
+            return content
+
+        # 결과 행까지 파싱하여 페이지당 파싱 시간 및 결과 수 기록
+        start_time = time.perf_counter()
+        page = GeekBenchSearchPage(benchmark_type=search_type, content=content, engine=self.parser_engine)
+        row_count = len(page.results)
+        observe_parsed_page(engine_name=getattr(page.engine, "name", type(page.engine).__name__), parse_seconds=time.perf_counter() - start_time, row_count=row_count)
+        return page
+
+
+    def _remember_validators(self, search_type: str, query: str, current_page: int, page: object, response_validators: dict) -> None:
+        # 응답 검증값과 파싱 결과를 함께 기록 (다음 요청에서 조건부 요청에 사용)
+        validators = response_validators.pop(current_page, None)
+        if validators is not None:
+            etag, last_modified = validators
+            self.validator_store.update(
+                search_type=search_type,
+                query=query,
+                page=current_page,
+                etag=etag,
+                last_modified=last_modified,
+                parsed_page=page
+                )
 
 
     def _get_search_url_and_payload(self, search_type: str, query: str, start_page: int):
@@ -68,26 +342,17 @@ class AsyncGeekBenchBrowserAPI:
 
 
     async def fetch_total_pages(self, search_type: str = None, query: str = None, default_pages: int = 0, merge_mode: bool = False, add_pages: int = 5) -> int:
-        # URL 및 요청 payload 생성
-        url, payload = self._get_search_url_and_payload(search_type=search_type, query=query, start_page=1)
+        # 파싱 완료 전인 페이지의 (ETag, Last-Modified)
+        response_validators = dict()
 
-        # Referer 헤더 업데이트
-        self.headers_manager.update_referer(self.url_manager.BASE_URL)
-
-        async with aiohttp.ClientSession() as session:
-            # 현재 요청의 Referer 헤더 업데이트
-            self.headers_manager.update_referer(url + "?" + urlencode(payload))
-
-            # 비동기 요청 결과를 가져오기
-            result = await AsyncGeekBenchBrowserAPI._fetch(
-                session=session,
-                url=url,
-                payload=payload,
-                headers=self.headers_manager.get_search_headers(search_type=search_type)
-            )
+        async with self._session_scope() as session:
+            # 첫 페이지 요청 (재생 모드에서는 캐시에서 제공)
+            result = await self._fetch_search_page(session=session, search_type=search_type, query=query, current_page=1, response_validators=response_validators)
 
             # 페이지 수를 파싱하고 보정하여 반환
-            total_pages = fetch_total_pages_parser(content=result, default_pages=default_pages)
+            page = self._to_search_page(search_type=search_type, content=result)
+            self._remember_validators(search_type=search_type, query=query, current_page=1, page=page, response_validators=response_validators)
+            total_pages = page.fetch_total_pages(default_pages=default_pages)
             
             # 병합 모드일 때만 보정
             if merge_mode:
@@ -97,33 +362,116 @@ class AsyncGeekBenchBrowserAPI:
 
 
     async def search_client(self, search_type:str, query: str, start_page: int = 1, last_page: int = 1, min_delay: int = 1, max_delay: int = 1):
-        # URL 및 요청 payload 생성
-        url, payload = self._get_search_url_and_payload(search_type=search_type, query=query, start_page=start_page)
+        # 순차 요청은 min_delay~max_delay 대기로 속도를 조절하므로, 전역 토큰 버킷은 초당 요청 수가 직접 지정된 경우에만 적용
+        rate_limited = not self._uses_global_rate_limiter or is_global_rate_configured()
+        response_validators = dict() # 파싱 완료 전인 페이지의 (ETag, Last-Modified)
 
-        # Referer 헤더 업데이트
-        self.headers_manager.update_referer(self.url_manager.BASE_URL)
-
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             for current_page in range(start_page, last_page + 1):
-                # 현재 페이지에 대한 payload 및 headers 업데이트
-                payload["page"] = current_page
-                self.headers_manager.update_referer(url + "?" + urlencode(payload))
-
-                # 비동기 요청 결과를 가져오기
-                result = await AsyncGeekBenchBrowserAPI._fetch(
-                    session=session,
-                    url=url,
-                    payload=payload,
-                    headers=self.headers_manager.get_search_headers(search_type=search_type)
-                )
+                # 현재 페이지 요청 (재생 모드에서는 캐시에서 제공)
+                result = await self._fetch_search_page(session=session, search_type=search_type, query=query, current_page=current_page, rate_limited=rate_limited, response_validators=response_validators)
                 
+                # 응답을 한 번만 파싱하여 이후 단계에서 재사용
+                page = self._to_search_page(search_type=search_type, content=result)
+                self._remember_validators(search_type=search_type, query=query, current_page=current_page, page=page, response_validators=response_validators)
+
                 # 마지막 페이지 확인
-                if is_last_page(content=result):
+                if page.is_last_page:
                     break
                 
-                # 랜덤 대기 시간 계산
-                random_sleep = random.uniform(min_delay, max_delay)
-                current_last_page = fetch_total_pages_parser(content=result, default_pages=-99999)
+                # 랜덤 대기 시간 계산 (재생 모드에서는 대기하지 않음)
+                random_sleep = 0 if self.replay else random.uniform(min_delay, max_delay)
+                current_last_page = page.fetch_total_pages(default_pages=-99999)
+
+                yield page, current_page, current_last_page, random_sleep  # 결과 반환: 파싱된 검색 페이지, 현재 페이지, 현재 마지막 페이지 번호, 랜덤 대기 시간
+                await asyncio.sleep(random_sleep)  # 랜덤 대기
+
+
+    async def _fetch_search_pages(self, session: ClientSession, search_type: str, query: str, start_page: int, last_page: int, concurrency: int, page_limit: dict = None, response_validators: dict = None):
+        # 원본 HTML을 페이지 순서대로 반환 (최대 concurrency개의 페이지를 동시에 요청)
+        # page_limit["last_page"]가 줄어들면 (마지막 페이지 확인) 그 이후 페이지는 요청하지 않음
+        async def fetch_page(current_page: int) -> str:
+            return await self._fetch_search_page(session=session, search_type=search_type, query=query, current_page=current_page, response_validators=response_validators)
+
+        page_limit = {"last_page": last_page} if page_limit is None else page_limit
+        pending_pages = dict() # 페이지 번호: 요청 작업
+        next_page = start_page # 다음에 요청할 페이지
+        current_page = start_page # 다음에 반환할 페이지
+
+        try:
+            while current_page <= page_limit["last_page"]:
+                # 최대 concurrency개의 페이지를 동시에 요청
+                while next_page <= page_limit["last_page"] and len(pending_pages) < concurrency:
+                    pending_pages[next_page] = asyncio.create_task(fetch_page(current_page=next_page))
+                    next_page += 1
+
+                # 페이지 순서대로 결과 대기
+                yield current_page, await pending_pages.pop(current_page)
+                current_page += 1
+
+        finally:
+            # 마지막 페이지 이후의 남은 요청 취소 (이미 완료된 요청의 검증값도 기록하지 않음)
+            for task in pending_pages.values():
+                task.cancel()
+            await asyncio.gather(*pending_pages.values(), return_exceptions=True)
+            if response_validators is not None:
+                for pending_page in pending_pages:
+                    response_validators.pop(pending_page, None)
+
+
+    async def _parse_search_pages(self, search_type: str, raw_pages):
+        # 이벤트 루프 안에서 바로 파싱 (프로세스 풀을 사용하지 않는 경우)
+        try:
+            async for current_page, content in raw_pages:
+                yield self._to_search_page(search_type=search_type, content=content), current_page
+        finally:
+            await raw_pages.aclose()
+
+
+    async def concurrent_search_client(self, search_type: str, query: str, start_page: int = 1, last_page: int = 1, concurrency: int = 4, parse_pool: object = None):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        # 파싱된 페이지가 마지막 페이지이면 이후 페이지 요청 중단 (파싱 큐에 쌓인 만큼 앞서 요청하지 않도록)
+        page_limit = {"last_page": last_page}
+        response_validators = dict() # 파싱 완료 전인 페이지의 (ETag, Last-Modified), 호출이 끝나면 함께 정리
+
+        def limit_pages(current_page: int, page: object) -> None:
+            if page.is_last_page:
+                page_limit["last_page"] = min(page_limit["last_page"], current_page)
+
+        async with self._session_scope() as session:
+            raw_pages = self._fetch_search_pages(
+                session=session,
+                search_type=search_type,
+                query=query,
+                start_page=start_page,
+                last_page=last_page,
+                concurrency=concurrency,
+                page_limit=page_limit,
+                response_validators=response_validators
+                )
+
+            # 파싱 단계 선택 (프로세스 풀이 있으면 요청과 병렬로 파싱)
+            if parse_pool is None:
+                search_pages = self._parse_search_pages(search_type=search_type, raw_pages=raw_pages)
+            else:
+                search_pages = parse_pool.parse_pages(benchmark_type=search_type, raw_pages=raw_pages, on_parsed=limit_pages)
+
+            previous_time = time.monotonic()
+
+            async with aclosing(search_pages):
+                async for page, current_page in search_pages:
+                    self._remember_validators(search_type=search_type, query=query, current_page=current_page, page=page, response_validators=response_validators)
+
+                    # 마지막 페이지 확인 (이후 페이지 요청은 종료 시 취소)
+                    if page.is_last_page:
+                        break
+
+                    # 페이지당 실제 소요 시간 계산 (랜덤 대기 시간 대신 사용)
+                    now = time.monotonic()
+                    page_delay = now - previous_time
+                    previous_time = now
+                    current_last_page = page.fetch_total_pages(default_pages=-99999)
 
-                yield result, current_page, current_last_page, random_sleep  # 결과 반환: 검색 결과, 현재 페이지, 현재 마지막 페이지 번호, 랜덤 대기 시간
-                await asyncio.sleep(random_sleep)  # 랜덤 대기    
\ No newline at end of file
+                    yield page, current_page, current_last_page, page_delay  # 결과 반환: 파싱된 검색 페이지, 현재 페이지, 현재 마지막 페이지 번호, 페이지당 소요 시간
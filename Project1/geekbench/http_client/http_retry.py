@@ -0,0 +1,72 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class GeekBenchFetchError(Exception):
+    def __init__(self, message: str, status: int = None):
+        """재시도 후에도 페이지를 가져오지 못한 경우 발생하는 예외."""
+        super().__init__(message)
+        self.status = status
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 6,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        max_retry_after: float = 300.0,
+        retry_statuses: frozenset = frozenset({429, 500, 502, 503, 504})
+        ):
+        """지수 백오프(지터 포함)와 Retry-After를 따르는 재시도 정책."""
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+
+        self.max_attempts = max_attempts # 최초 요청을 포함한 최대 시도 횟수
+        self.base_delay = base_delay # 첫 재시도 기준 대기 시간(초)
+        self.max_delay = max_delay # 백오프 대기 시간 상한(초)
+        self.max_retry_after = max_retry_after # Retry-After 대기 시간 상한(초)
+        self.retry_statuses = retry_statuses # 재시도할 상태 코드
+
+    def is_retry_status(self, status: int) -> bool:
+        return status in self.retry_statuses
+
+    def compute_delay(self, attempt: int, retry_after: float = None) -> float:
+        # 서버가 Retry-After를 보낸 경우 그 값을 우선 사용
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+
+        # 지수 백오프 + 전체 지터 (동시 요청이 같은 시점에 재시도하지 않도록 분산)
+        backoff = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, backoff)
+
+    @staticmethod
+    def parse_retry_after(value: str | None) -> float | None:
+        if not value:
+            return None
+
+        # 초 단위 숫자 형식
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+
+        # HTTP 날짜 형식
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+if __name__ == "__main__":
+    # 사용 예시
+    retry_policy = RetryPolicy()
+    for attempt in range(1, retry_policy.max_attempts):
+        print(f"{attempt}번째 재시도 대기 시간: {retry_policy.compute_delay(attempt=attempt):.2f}초")
+
+    print("Retry-After: 120 ->", retry_policy.parse_retry_after("120"))
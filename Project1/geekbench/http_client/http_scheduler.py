@@ -0,0 +1,161 @@
+import json
+import math
+import os
+import time
+from datetime import date, timedelta
+
+try:
+    from http_json_parser import GeekBenchJSONParser
+except ImportError:
+    from .http_json_parser import GeekBenchJSONParser
+
+
+class GeekBenchCrawlHistory:
+    def __init__(self, history_path: str, smoothing: float = 0.5):
+        """쿼리별 마지막 수집 시각과 새 결과 도착률(시간당 결과 수)을 기록하는 수집 이력."""
+        self.history_path = history_path
+        self.smoothing = smoothing # 도착률 지수 이동 평균 가중치 (새 관측값 비중)
+
+        # {"search_type|query": {"last_crawled_at": 초, "arrival_rate": 시간당 결과 수, "last_new_results": 결과 수}}
+        self._entries = dict()
+        if os.path.exists(history_path):
+            with open(history_path, 'r', encoding='utf-8') as json_file:
+                self._entries = json.load(json_file)
+
+    @staticmethod
+    def _key(search_type: str, query: str) -> str:
+        return f"{search_type}|{query}"
+
+    def get(self, search_type: str, query: str) -> dict | None:
+        return self._entries.get(self._key(search_type=search_type, query=query))
+
+    def set_arrival_rate(self, search_type: str, query: str, arrival_rate: float, last_crawled_at: float) -> None:
+        # 이력이 없는 쿼리의 초기 도착률 설정 (저장된 결과로 추정한 값)
+        self._entries[self._key(search_type=search_type, query=query)] = {
+            "last_crawled_at": last_crawled_at,
+            "arrival_rate": arrival_rate,
+            "last_new_results": None,
+        }
+
+    def record_crawl(self, search_type: str, query: str, new_results: int, crawled_at: float = None, truncated: bool = False) -> None:
+        # 수집 결과로 도착률 갱신 (이전 수집 이후 경과 시간 동안 새로 올라온 결과 수)
+        # 배분된 페이지를 모두 사용한 수집(truncated)은 새 결과가 잘렸으므로 도착률을 갱신하지 않음
+        crawled_at = time.time() if crawled_at is None else crawled_at
+        entry = self.get(search_type=search_type, query=query)
+
+        arrival_rate = None
+        if entry is not None:
+            arrival_rate = entry["arrival_rate"]
+            elapsed_hours = (crawled_at - entry["last_crawled_at"]) / 3600
+            if elapsed_hours > 0 and not truncated:
+                observed_rate = new_results / elapsed_hours
+                arrival_rate = observed_rate if arrival_rate is None else \
+                    self.smoothing * observed_rate + (1 - self.smoothing) * arrival_rate
+
+        self._entries[self._key(search_type=search_type, query=query)] = {
+            "last_crawled_at": crawled_at,
+            "arrival_rate": arrival_rate,
+            "last_new_results": new_results,
+        }
+
+    def save(self) -> None:
+        # 디렉토리가 존재하지 않으면 생성
+        if os.path.dirname(self.history_path):
+            os.makedirs(os.path.dirname(self.history_path), exist_ok=True)
+
+        # 임시 파일에 쓴 뒤 교체
+        temp_path = f"{self.history_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as json_file:
+            json.dump(self._entries, json_file, ensure_ascii=False, indent=4)
+        os.replace(temp_path, self.history_path)
+
+
+class GeekBenchCrawlScheduler:
+    # 한 페이지에 담긴 결과 수
+    PAGE_SIZE = 25
+
+    def __init__(self, history: GeekBenchCrawlHistory, min_expected_results: float = 1.0, max_pages_per_query: int = 40, window_days: int = 30):
+        """예상 새 결과 수가 많은 쿼리부터 요청 예산을 배분하는 수집 스케줄러."""
+        self.history = history
+        self.min_expected_results = min_expected_results # 이보다 적게 예상되는 쿼리는 이번 실행에서 건너뜀
+        self.max_pages_per_query = max_pages_per_query # 쿼리 하나에 배분할 최대 페이지 수
+        self.window_days = window_days # 저장된 결과로 초기 도착률을 추정할 기간(일)
+
+    def estimate_arrival_rate(self, search_type: str, file_path: str) -> float | None:
+        # 저장된 결과의 업로드 날짜로 도착률 추정 (가장 최근 업로드일 기준 window_days 동안의 시간당 결과 수)
+        # AI 결과에는 업로드 날짜가 없으므로 추정하지 않음 (첫 수집 결과로 도착률 계산)
+        if search_type == "ai":
+            return None
+
+        upload_dates = list()
+        for _, _, _, details in GeekBenchJSONParser.iter_data_from_json(file_path=file_path):
+            upload_date = details.get("upload_date", {}).get("parsed")
+            if upload_date:
+                upload_dates.append(date.fromisoformat(upload_date))
+        if not upload_dates:
+            return None
+
+        window_start = max(upload_dates) - timedelta(days=self.window_days)
+        recent_results = sum(1 for upload_date in upload_dates if upload_date > window_start)
+        return recent_results / (self.window_days * 24)
+
+    def expected_new_results(self, search_type: str, query: str, now: float = None) -> float:
+        # 예상 새 결과 수 = 도착률 × 마지막 수집 이후 경과 시간 (도착률을 모르면 가장 먼저 수집)
+        now = time.time() if now is None else now
+        entry = self.history.get(search_type=search_type, query=query)
+
+        if entry is None:
+            file_path = rf"geekbench_data_json\{query}_1.json"
+            if not os.path.exists(file_path):
+                return math.inf
+
+            # 저장된 결과의 파일 수정 시각을 마지막 수집 시각으로 사용
+            # (추정할 수 없으면 도착률 없이 기록하여 다음 수집에서 경과 시간 대비 새 결과 수로 계산)
+            arrival_rate = self.estimate_arrival_rate(search_type=search_type, file_path=file_path)
+            self.history.set_arrival_rate(search_type=search_type, query=query, arrival_rate=arrival_rate, last_crawled_at=os.path.getmtime(file_path))
+            entry = self.history.get(search_type=search_type, query=query)
+
+        if entry["arrival_rate"] is None:
+            return math.inf
+
+        elapsed_hours = max(0.0, now - entry["last_crawled_at"]) / 3600
+        return entry["arrival_rate"] * elapsed_hours
+
+    def hit_page_cap(self, new_results: int, pages: int) -> bool:
+        # 배분된 페이지가 모두 새 결과로 채워졌으면 워터마크에 도달하기 전에 수집이 끝난 것
+        return new_results >= pages * self.PAGE_SIZE
+
+    def plan(self, search_type: str, query_data: list, max_requests: int, now: float = None) -> list[dict]:
+        # 예상 새 결과 수 내림차순으로 요청 예산(페이지 수)을 배분
+        ranked_queries = sorted(
+            ((self.expected_new_results(search_type=search_type, query=query, now=now), query) for query in query_data),
+            key=lambda item: item[0],
+            reverse=True
+            )
+
+        plan = list()
+        remaining_requests = max_requests
+        for expected_results, query in ranked_queries:
+            # 새 결과가 거의 없을 것으로 예상되는 쿼리는 요청하지 않음
+            if expected_results < self.min_expected_results or remaining_requests <= 0:
+                continue
+
+            # 예상 결과를 담을 페이지 + 워터마크 확인용 1페이지
+            if math.isinf(expected_results):
+                pages = self.max_pages_per_query
+            else:
+                pages = min(self.max_pages_per_query, math.ceil(expected_results / self.PAGE_SIZE) + 1)
+            pages = min(pages, remaining_requests)
+
+            plan.append({"query": query, "pages": pages, "expected_results": expected_results})
+            remaining_requests -= pages
+
+        return plan
+
+
+if __name__ == "__main__":
+    # 사용 예시
+    history = GeekBenchCrawlHistory(history_path=r"geekbench_data_json\crawl_history.json")
+    scheduler = GeekBenchCrawlScheduler(history=history)
+    for item in scheduler.plan(search_type="cpu", query_data=["samsung s5e9945", "samsung kona"], max_requests=200):
+        print(item)
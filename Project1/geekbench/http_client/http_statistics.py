@@ -0,0 +1,156 @@
+import numpy as np
+
+try:
+    from http_columnar import GeekBenchColumnarTable, INT32_MISSING, export_columnar, iter_json_file_results
+except ImportError:
+    from .http_columnar import GeekBenchColumnarTable, INT32_MISSING, export_columnar, iter_json_file_results
+
+
+# 검색 유형별 통계 대상 점수 컬럼
+SCORE_COLUMNS = {
+    "cpu": ("single", "multi"),
+    "gpu": ("api_score",),
+    "ai": ("single_precision", "half_precision", "quantized"),
+}
+
+# 검색 유형별 항상 포함되는 그룹 컬럼 (GPU 점수는 API별로 비교)
+FIXED_GROUP_COLUMNS = {
+    "cpu": (),
+    "gpu": ("api_name",),
+    "ai": ("framework_name",),
+}
+
+# 이상치 판정 기준 (Tukey: 사분위 범위의 1.5배를 벗어난 값)
+OUTLIER_IQR_FACTOR = 1.5
+
+
+def _group_percentiles(sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray, q: float) -> np.ndarray:
+    # 그룹별로 정렬된 값에서 백분위수 계산 (np.percentile의 linear 보간과 동일)
+    position = starts + q * (counts - 1)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, starts + counts - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+def _group_keys(table: GeekBenchColumnarTable, group_by: tuple, by_month: bool) -> tuple[np.ndarray, list, int]:
+    # 그룹 컬럼들의 코드를 하나의 int64 키로 결합 (혼합 기수)
+    keys = np.zeros(len(table), dtype=np.int64)
+    key_columns = list()
+    month_offset = 0 # 가장 이른 업로드 월 (월 코드 복원용)
+
+    for column in group_by:
+        codes = table.columns[column].astype(np.int64) + 1 # 결측값(-1)을 0으로
+        radix = len(table.categories[column]) + 1
+        keys = keys * radix + codes
+        key_columns.append((column, radix))
+
+    if by_month:
+        months = table.columns["upload_date"].astype("datetime64[M]")
+        missing = np.isnat(months)
+        month_numbers = months.astype(np.int64)
+        if not missing.all():
+            month_offset = int(month_numbers[~missing].min())
+
+        # 결측 날짜는 0, 나머지는 기준 월부터 1, 2, ...
+        month_codes = np.where(missing, 0, month_numbers - month_offset + 1)
+        radix = int(month_codes.max(initial=0)) + 1
+        keys = keys * radix + month_codes
+        key_columns.append(("upload_month", radix))
+
+    return keys, key_columns, month_offset
+
+
+def _decode_group_key(table: GeekBenchColumnarTable, key: int, key_columns: list, month_offset: int) -> dict:
+    # 결합된 키를 그룹 컬럼 값으로 복원
+    group = dict()
+    for column, radix in reversed(key_columns):
+        key, code = divmod(key, radix)
+        if code == 0:
+            group[column] = None
+        elif column == "upload_month":
+            group[column] = str(np.datetime64(month_offset + code - 1, "M"))
+        else:
+            group[column] = table.categories[column][code - 1]
+
+    return {column: group[column] for column, _ in key_columns}
+
+
+def score_statistics(table: GeekBenchColumnarTable, group_by: tuple = ("device_name",), by_month: bool = False, query: str = None) -> list[dict]:
+    # 그룹별 점수 통계 (개수, 평균, 중앙값, p5/p95, 표준편차, 이상치 수)
+    for column in group_by:
+        if column not in table.categories:
+            raise ValueError(f"Invalid group column: {column}. Use one of {tuple(table.categories)}.")
+    if by_month and "upload_date" not in table.columns:
+        # AI 결과에는 업로드 날짜가 없음
+        raise ValueError(f"by_month is not supported for search_type '{table.search_type}' (no upload_date column).")
+
+    group_by = tuple(group_by) + tuple(column for column in FIXED_GROUP_COLUMNS[table.search_type] if column not in group_by)
+    keys, key_columns, month_offset = _group_keys(table=table, group_by=group_by, by_month=by_month)
+
+    statistics = list()
+    for score_column in SCORE_COLUMNS[table.search_type]:
+        scores = table.columns[score_column]
+        valid = scores != INT32_MISSING
+        if not valid.any():
+            continue
+
+        # 그룹 번호 부여 후 (그룹, 점수) 순으로 정렬
+        group_values, group_index = np.unique(keys[valid], return_inverse=True)
+        values = scores[valid].astype(np.float64)
+        order = np.lexsort((values, group_index))
+        sorted_values = values[order]
+
+        counts = np.bincount(group_index, minlength=len(group_values))
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        # 평균 및 표준편차 (모표준편차)
+        means = np.bincount(group_index, weights=values) / counts
+        variances = np.bincount(group_index, weights=(values - means[group_index]) ** 2) / counts
+        stds = np.sqrt(variances)
+
+        # 백분위수
+        p5 = _group_percentiles(sorted_values, starts, counts, 0.05)
+        p25 = _group_percentiles(sorted_values, starts, counts, 0.25)
+        medians = _group_percentiles(sorted_values, starts, counts, 0.5)
+        p75 = _group_percentiles(sorted_values, starts, counts, 0.75)
+        p95 = _group_percentiles(sorted_values, starts, counts, 0.95)
+
+        # 이상치 수
+        iqr = p75 - p25
+        lower_bounds = (p25 - OUTLIER_IQR_FACTOR * iqr)[group_index]
+        upper_bounds = (p75 + OUTLIER_IQR_FACTOR * iqr)[group_index]
+        outliers = np.bincount(group_index, weights=(values < lower_bounds) | (values > upper_bounds), minlength=len(group_values))
+
+        for index, key in enumerate(group_values.tolist()):
+            row = {"query": query} if query is not None else dict()
+            row.update(_decode_group_key(table=table, key=key, key_columns=key_columns, month_offset=month_offset))
+            row.update({
+                "score": score_column,
+                "count": int(counts[index]),
+                "mean": float(means[index]),
+                "median": float(medians[index]),
+                "p5": float(p5[index]),
+                "p95": float(p95[index]),
+                "std": float(stds[index]),
+                "outliers": int(outliers[index]),
+            })
+            statistics.append(row)
+
+    return statistics
+
+
+def score_statistics_by_query(tables: dict, group_by: tuple = ("device_name",), by_month: bool = False) -> list[dict]:
+    # {query: 컬럼형 결과}의 쿼리별 통계를 하나의 목록으로 반환
+    statistics = list()
+    for query, table in tables.items():
+        statistics.extend(score_statistics(table=table, group_by=group_by, by_month=by_month, query=query))
+
+    return statistics
+
+
+if __name__ == "__main__":
+    # 사용 예시
+    table = export_columnar(search_type="cpu", results=iter_json_file_results(file_path=r"geekbench_data_json\samsung s5e9945_1.json"))
+    for row in score_statistics(table=table, group_by=("device_name",), by_month=True, query="samsung s5e9945"):
+        print(row)
@@ -0,0 +1,202 @@
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+
+try:
+    from http_json_parser import GeekBenchJSONParser
+    from http_json_stream import iter_json_events, GeekBenchJSONWriter
+    from http_metrics import storage_timer
+except ImportError:
+    from .http_json_parser import GeekBenchJSONParser
+    from .http_json_stream import iter_json_events, GeekBenchJSONWriter
+    from .http_metrics import storage_timer
+
+
+class GeekBenchStorage(ABC):
+    """수집된 결과를 저장하는 저장소 인터페이스."""
+
+    # JSON 내보내기 시 한 페이지에 담을 결과 수 (GeekBenchJSONParser._paginate_data와 동일)
+    PAGE_SIZE = 25
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @abstractmethod
+    def store_page(self, search_type: str, query: str, page_number: int, parsed_results: list[dict]) -> None:
+        ...
+
+    @abstractmethod
+    def flush(self) -> None:
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        ...
+
+    @abstractmethod
+    def fetch_max_result_id(self, query: str) -> int | None:
+        ...
+
+    @abstractmethod
+    def count_results(self, query: str) -> int:
+        ...
+
+    @abstractmethod
+    def iter_results(self, query: str):
+        # (result_url, details)를 고유 번호 내림차순으로 반환
+        ...
+
+    def iter_paginated_data(self, query: str):
+        # 기존 JSON 파일과 같은 페이지 단위로 (page_number, {url: details})를 차례로 반환 (한 페이지만 메모리에 유지)
+        page_number = 1
+        page_data = dict()
+        for result_url, details in self.iter_results(query=query):
+            page_data[result_url] = details
+            if len(page_data) == self.PAGE_SIZE:
+                yield page_number, page_data
+                page_number += 1
+                page_data = dict()
+
+        if page_data:
+            yield page_number, page_data
+
+    def export_to_json(self, query: str, file_path: str) -> None:
+        # {query: {page: {url: details}}} 형식으로 페이지 단위 기록 (전체 결과를 메모리에 올리지 않음)
+        with GeekBenchJSONWriter(file_path=file_path) as writer:
+            writer.write_query(query)
+            for page_number, page_data in self.iter_paginated_data(query=query):
+                writer.write_page(page_number, page_data)
+
+
+class SQLiteGeekBenchStorage(GeekBenchStorage):
+    def __init__(self, db_path: str, batch_size: int = 500):
+        """결과 ID와 쿼리를 키로 하는 SQLite 저장소 (일괄 트랜잭션으로 upsert)."""
+        self.db_path = db_path
+        self.batch_size = batch_size # 한 트랜잭션에 기록할 최대 행 수
+
+        # 디렉토리가 존재하지 않으면 생성
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+        # 아직 기록되지 않은 행
+        self._pending_rows = list()
+
+    def _create_schema(self) -> None:
+        with self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS results (
+                    query TEXT NOT NULL,
+                    result_id INTEGER NOT NULL,
+                    search_type TEXT NOT NULL,
+                    result_url TEXT NOT NULL,
+                    device_name TEXT,
+                    cpu_model TEXT,
+                    platform TEXT,
+                    upload_date TEXT,
+                    details TEXT NOT NULL,
+                    PRIMARY KEY (query, result_id)
+                )
+                """
+            )
+
+            # 조회용 인덱스
+            for column in ("device_name", "cpu_model", "platform", "upload_date"):
+                self.connection.execute(f"CREATE INDEX IF NOT EXISTS idx_results_{column} ON results ({column})")
+
+    @staticmethod
+    def _to_row(search_type: str, query: str, result_url: str, details: dict) -> tuple:
+        system = details.get("system", {})
+        upload_date = details.get("upload_date") or {}
+
+        return (
+            query,
+            GeekBenchJSONParser.extract_result_id(result_url),
+            search_type,
+            result_url,
+            system.get("device_name"),
+            system.get("cpu_model"),
+            details.get("platform"),
+            upload_date.get("parsed"),
+            json.dumps(details, ensure_ascii=False),
+        )
+
+    def store_page(self, search_type: str, query: str, page_number: int, parsed_results: list[dict]) -> None:
+        # 페이지 단위로 버퍼에 추가하고, batch_size에 도달하면 기록
+        for parsed_result in parsed_results:
+            for result_url, details in parsed_result.items():
+                self._pending_rows.append(self._to_row(search_type=search_type, query=query, result_url=result_url, details=details))
+
+        if len(self._pending_rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending_rows:
+            return
+
+        # 하나의 트랜잭션으로 upsert (같은 결과는 최신 값으로 갱신)
+        with storage_timer(operation="flush", backend="sqlite"), self.connection:
+            self.connection.executemany(
+                """
+                INSERT INTO results (query, result_id, search_type, result_url, device_name, cpu_model, platform, upload_date, details)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (query, result_id) DO UPDATE SET
+                    search_type = excluded.search_type,
+                    result_url = excluded.result_url,
+                    device_name = excluded.device_name,
+                    cpu_model = excluded.cpu_model,
+                    platform = excluded.platform,
+                    upload_date = excluded.upload_date,
+                    details = excluded.details
+                """,
+                self._pending_rows
+            )
+
+        self._pending_rows.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self.connection.close()
+
+    def fetch_max_result_id(self, query: str) -> int | None:
+        self.flush()
+        return self.connection.execute("SELECT MAX(result_id) FROM results WHERE query = ?", (query,)).fetchone()[0]
+
+    def count_results(self, query: str) -> int:
+        self.flush()
+        return self.connection.execute("SELECT COUNT(*) FROM results WHERE query = ?", (query,)).fetchone()[0]
+
+    def iter_results(self, query: str):
+        self.flush()
+        cursor = self.connection.execute(
+            "SELECT result_url, details FROM results WHERE query = ? ORDER BY result_id DESC",
+            (query,)
+        )
+        for result_url, details in cursor:
+            yield result_url, json.loads(details)
+
+    def import_from_json(self, search_type: str, file_path: str) -> None:
+        # 기존 페이지 단위 JSON 파일을 저장소로 가져오기 (파일을 차례로 읽으며 batch_size 단위로 기록)
+        for event in iter_json_events(file_path=file_path):
+            if event[0] == "result":
+                _, query, page_number, result_url, details = event
+                self.store_page(search_type=search_type, query=query, page_number=int(page_number), parsed_results=[{result_url: details}])
+
+        self.flush()
+
+
+if __name__ == "__main__":
+    # 사용 예시
+    with SQLiteGeekBenchStorage(db_path=r"geekbench_data_db\geekbench.sqlite3") as storage:
+        storage.import_from_json(search_type="cpu", file_path=r"geekbench_data_json\samsung s5e9945_1.json")
+        print("결과 수:", storage.count_results(query="samsung s5e9945"))
+        print("가장 큰 고유 번호:", storage.fetch_max_result_id(query="samsung s5e9945"))
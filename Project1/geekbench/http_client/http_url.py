@@ -1,11 +1,17 @@
 from typing import Final, Optional
+from urllib.parse import urlsplit
 
 class HTTPUrl:
     # 검색 URL
     BASE_URL:Final[str] = "https://browser.geekbench.com/search?"
+    # 결과 상세 페이지 URL 접두사
+    RESULT_BASE_URL:Final[str] = "https://browser.geekbench.com"
 
-    @staticmethod
-    def _get_search_url(key: str, page: int = 1, query: Optional[str] = None) -> tuple[str, dict[str, str]]:
+    def __init__(self, base_url: Optional[str] = None):
+        # 검색 URL 변경 (예: 로컬 모의 서버), None이면 긱벤치 브라우저
+        self.base_url = HTTPUrl.BASE_URL if base_url is None else base_url
+
+    def _get_search_url(self, key: str, page: int = 1, query: Optional[str] = None) -> tuple[str, dict[str, str]]:
         payload = {
             "k": key,
             "page": str(page),
@@ -13,19 +19,24 @@ class HTTPUrl:
             "utf8": "✓"
         }
         
-        return HTTPUrl.BASE_URL, payload
+        return self.base_url, payload
+
+    def get_cpu_search_url(self, page: int = 1, query: Optional[str] = None) -> tuple[str, dict[str, str]]:
+        return self._get_search_url("v6_cpu", page, query)
+
+    def get_gpu_search_url(self, page: int = 1, query: Optional[str] = None) -> tuple[str, dict[str, str]]:
+        return self._get_search_url("v6_compute", page, query)
 
-    @staticmethod
-    def get_cpu_search_url(page: int = 1, query: Optional[str] = None) -> tuple[str, dict[str, str]]:
-        return HTTPUrl._get_search_url("v6_cpu", page, query)
+    def get_ai_search_url(self, page: int = 1, query: Optional[str] = None) -> tuple[str, dict[str, str]]:
+        return self._get_search_url("ai", page, query)
 
-    @staticmethod
-    def get_gpu_search_url(page: int = 1, query: Optional[str] = None) -> tuple[str, dict[str, str]]:
-        return HTTPUrl._get_search_url("v6_compute", page, query)
+    def get_result_url(self, result_url: str) -> str:
+        # 저장된 결과 URL을 요청할 서버의 URL로 변환 (기본 서버이면 그대로 사용)
+        if self.base_url == HTTPUrl.BASE_URL or not result_url.startswith(HTTPUrl.RESULT_BASE_URL):
+            return result_url
 
-    @staticmethod
-    def get_ai_search_url(page: int = 1, query: Optional[str] = None) -> tuple[str, dict[str, str]]:
-        return HTTPUrl._get_search_url("ai", page, query)
+        base = urlsplit(self.base_url)
+        return f"{base.scheme}://{base.netloc}" + result_url[len(HTTPUrl.RESULT_BASE_URL):]
 
 if __name__ == "__main__":
     # 사용 예시
@@ -0,0 +1,133 @@
+import json
+import os
+import sqlite3
+import time
+
+try:
+    from http_parse_pool import ParsedSearchPage
+    from http_metrics import storage_timer
+except ImportError:
+    from .http_parse_pool import ParsedSearchPage
+    from .http_metrics import storage_timer
+
+
+class GeekBenchValidatorStore:
+    def __init__(self, db_path: str, batch_size: int = 50, flush_interval: float = 30.0):
+        """검색 페이지별 조건부 요청 검증값(ETag, Last-Modified)과 파싱 결과를 페이지 단위 행으로 보관하는 SQLite 저장소.
+
+        변경된 페이지는 batch_size개 또는 flush_interval초마다 기록하므로 비정상 종료 시에도 그 이전까지의 페이지는 남습니다.
+        """
+        self.db_path = db_path
+        self.batch_size = batch_size # 한 트랜잭션에 기록할 최대 페이지 수
+        self.flush_interval = flush_interval # 기록되지 않은 페이지를 보관할 최대 시간 (초)
+
+        # 디렉토리가 존재하지 않으면 생성
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+        # 아직 기록되지 않은 페이지: {(search_type, query, page): 행}
+        self._pending_rows = dict()
+        self._last_flush = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _create_schema(self) -> None:
+        with self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS validators (
+                    search_type TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    results TEXT NOT NULL,
+                    is_last_page INTEGER NOT NULL,
+                    max_page_number INTEGER,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (search_type, query, page)
+                )
+                """
+            )
+
+    def _get_row(self, search_type: str, query: str, page: int) -> tuple | None:
+        # (etag, last_modified, results, is_last_page, max_page_number) 반환 (기록되지 않은 페이지 우선)
+        key = (search_type, query, int(page))
+        pending_row = self._pending_rows.get(key)
+        if pending_row is not None:
+            return pending_row[3:8]
+
+        return self.connection.execute(
+            "SELECT etag, last_modified, results, is_last_page, max_page_number FROM validators WHERE search_type = ? AND query = ? AND page = ?",
+            key
+        ).fetchone()
+
+    def get_validators(self, search_type: str, query: str, page: int) -> tuple[str | None, str | None]:
+        # (ETag, Last-Modified) 반환 (기록이 없으면 (None, None))
+        row = self._get_row(search_type=search_type, query=query, page=page)
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
+    def get_page(self, search_type: str, query: str, page: int) -> ParsedSearchPage | None:
+        # 304 응답 시 재사용할 이전 파싱 결과
+        row = self._get_row(search_type=search_type, query=query, page=page)
+        if row is None:
+            return None
+
+        return ParsedSearchPage(
+            benchmark_type=search_type,
+            results=json.loads(row[2]),
+            is_last_page=bool(row[3]),
+            max_page_number=row[4]
+            )
+
+    def update(self, search_type: str, query: str, page: int, etag: str | None, last_modified: str | None, parsed_page: object) -> None:
+        # 검증값이 하나도 없으면 조건부 요청을 보낼 수 없으므로 기록하지 않음
+        if etag is None and last_modified is None:
+            return
+
+        key = (search_type, query, int(page))
+        self._pending_rows[key] = key + (
+            etag,
+            last_modified,
+            json.dumps(parsed_page.results, ensure_ascii=False),
+            int(bool(parsed_page.is_last_page)),
+            parsed_page.max_page_number,
+            time.time(),
+        )
+
+        if len(self._pending_rows) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._pending_rows:
+            return
+
+        with storage_timer(operation="flush", backend="validators"), self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO validators (search_type, query, page, etag, last_modified, results, is_last_page, max_page_number, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                list(self._pending_rows.values())
+            )
+
+        self._pending_rows.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self.connection.close()
+
+
+if __name__ == "__main__":
+    # 사용 예시
+    with GeekBenchValidatorStore(db_path=r"geekbench_data_db\validators.sqlite3") as validator_store:
+        print(validator_store.get_validators(search_type="cpu", query="samsung s5e9945", page=1))
@@ -1,6 +1,5 @@
 from datetime import datetime, timedelta
 import re
-import numpy as np
 
 def get_current_time() -> datetime:
     return datetime.now()  # 현재 시간을 반환
@@ -23,69 +22,6 @@ def convert_timedelta_to_dhms(total_seconds: int):
     seconds = seconds % 60
     return days, hours, minutes, seconds
 
-def log_progress(
-    request_mode: str,
-    start_time: datetime,
-    query: str, 
-    total_pages: int, 
-    current_page: int,
-    current_last_page: int,
-    random_sleep: float, 
-    min_delay: float, 
-    max_delay: float, 
-    avg_delay: float
-    ) -> None:
-    try:
-        # 리스트 업데이트
-        avg_delay.append(random_sleep)
-
-        # 경과 시간 계산
-        elapsed_time = (datetime.now() - start_time).total_seconds()
-        # 남은 페이지 수
-        remaining_requests = total_pages - current_page
-        # 예상 남은 시간
-        average_delay = np.mean(avg_delay)
-        remaining_time = remaining_requests * average_delay  # 평균 대기 시간
-
-        # 경과 시간 변환
-        elapsed_days, elapsed_hours, elapsed_minutes, elapsed_seconds = convert_timedelta_to_dhms(total_seconds=elapsed_time)
-
-        # 예상 남은 시간 변환
-        remaining_days, remaining_hours, remaining_minutes, remaining_seconds = convert_timedelta_to_dhms(total_seconds=remaining_time)
-
-        # 총 진행률 계산
-        progress_percentage = (current_page / total_pages) * 100
-
-        # 예상 완료 시간 계산
-        estimated_completion_time = format_datetime(original_datetime=datetime.now() + timedelta(seconds=remaining_time))
-
-        # 출력할 메시지를 딕셔너리에 저장
-        messages = {
-            "시작 시간": format_datetime(original_datetime=start_time),
-            "Query": query,
-            "현재 페이지": f"{current_page:,.0f} / 총 페이지: {total_pages:,.0f}, 진행률: {progress_percentage:,.2f}%",
-            "현재 마지막 페이지": f"{current_last_page:,.0f}" if current_last_page != -99999 else "오류 발생",
-            "병합 여부": "필요함 (긱벤치 데이터가 업데이트됨)" if total_pages != current_last_page else "필요 없음",
-            "랜덤 대기(지연) 시간": f"{random_sleep:.2f}초, 평균 대기(지연) 시간: {average_delay:,.2f}초",
-            "대기(지연) 시간 범위": f"{min_delay}초 to {max_delay}초",
-            "경과 시간": f"{elapsed_days:,.0f}일 {elapsed_hours:,.0f}시간 {elapsed_minutes:,.0f}분 {elapsed_seconds:,.0f}초 ({elapsed_time:,.2f}초)",
-            "예상 남은 시간": f"{remaining_days:,.0f}일 {remaining_hours:,.0f}시간 {remaining_minutes:,.0f}분 {remaining_seconds:,.0f}초 ({remaining_time:,.2f}초)",
-            "예상 완료 시간": estimated_completion_time
-        }
-
-        # 병합 모드일때 특정 텍스트 제거
-        if request_mode == "merge mode":
-            messages.pop("병합 여부", None)
-
-        # 메시지 출력
-        for key, value in messages.items():
-            print(f"{key}: {value}")
-        print() # 줄바꿈
-            
-    except Exception as e:
-        error = "Error occurred"
-        print(f"{error}: {e}\n")
-
 def parse_date_from_text(date_text: str) -> str:
     # 날짜 패턴을 사용하여 텍스트에서 날짜 추출
     try:
@@ -2,9 +2,17 @@ import requests
 from bs4 import BeautifulSoup
 import re
 
+
+
+def make_soup(content: str | BeautifulSoup) -> BeautifulSoup:
+    # 이미 파싱된 객체는 그대로 사용하여 중복 파싱 방지
+    if isinstance(content, BeautifulSoup):
+        return content
+    return BeautifulSoup(markup=content, features="lxml")
+
     
-def is_last_page(content: str) -> bool:
-    soup = BeautifulSoup(markup=content, features="lxml")
+def is_last_page(content: str | BeautifulSoup) -> bool:
+    soup = make_soup(content)
     
     # 마지막 페이지를 확인하기 위한 정규 표현식 패턴
     no_results_pattern = r"Your search did not match any .* results."
@@ -26,10 +34,10 @@ def separate_device_and_cpu(text: str):
         raise ValueError("No match found for the given text.")
 
 
-def fetch_total_pages_parser(content: str, default_pages: int) -> int:
+def fetch_total_pages_parser(content: str | BeautifulSoup, default_pages: int) -> int:
     if content is not None:
         # BeautifulSoup 객체 생성
-        soup = BeautifulSoup(markup=content, features="lxml")
+        soup = make_soup(content)
         
         # 모든 페이지 항목에서 페이지 번호 추출
         page_numbers = [
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# gb_main과 같이 http_client 패키지를 가져오도록 geekbench 디렉토리를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
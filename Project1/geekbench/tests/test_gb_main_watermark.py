@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from gb_main import merge_geekbench_data
+from http_client.http_json_parser import GeekBenchJSONParser
+from http_client.http_mock_server import MockGeekBenchServer
+from http_client.http_requester import AsyncGeekBenchBrowserAPI
+from http_client.http_storage import SQLiteGeekBenchStorage
+
+
+QUERY = "samsung"
+TOP_RESULT_ID = 10_000_000
+
+
+def stored_result_ids(storage: SQLiteGeekBenchStorage = None) -> set:
+    if storage is not None:
+        return {GeekBenchJSONParser.extract_result_id(result_url) for result_url, _ in storage.iter_results(query=QUERY)}
+    return {
+        GeekBenchJSONParser.extract_result_id(result_url)
+        for _, _, result_url, _ in GeekBenchJSONParser.iter_data_from_json(file_path=rf"geekbench_data_json\{QUERY}_1.json")
+    }
+
+
+WATERMARK_PATH = r"geekbench_data_json\watermarks.json"
+
+
+async def merge(api_requester: AsyncGeekBenchBrowserAPI, storage: SQLiteGeekBenchStorage, pages: int = 99999) -> None:
+    await merge_geekbench_data(
+        query_data=[QUERY],
+        default_pages=pages,
+        min_delay=0,
+        max_delay=0,
+        api_requester=api_requester,
+        watermark_mode=True,
+        storage=storage
+        )
+
+
+async def crawl_with_truncated_run(storage: SQLiteGeekBenchStorage = None) -> None:
+    # 결과 100개를 저장한 후 새 결과 100개가 올라오면, 2페이지로 잘린 실행 다음 실행이 기존 워터마크까지 이어서 수집
+    async with MockGeekBenchServer(total_pages=4) as server:
+        server.generator.top_result_id = TOP_RESULT_ID
+        async with AsyncGeekBenchBrowserAPI(base_url=server.base_url) as api_requester:
+            await merge(api_requester=api_requester, storage=storage)
+            assert stored_result_ids(storage) == set(range(TOP_RESULT_ID - 99, TOP_RESULT_ID + 1))
+
+            server.total_pages = 8
+            server.generator.top_result_id = TOP_RESULT_ID + 100
+
+            await merge(api_requester=api_requester, storage=storage, pages=2)
+            assert len(stored_result_ids(storage)) == 150
+            assert GeekBenchJSONParser.load_watermark(watermark_path=WATERMARK_PATH, query=QUERY) == TOP_RESULT_ID
+
+            await merge(api_requester=api_requester, storage=storage, pages=40)
+            assert stored_result_ids(storage) == set(range(TOP_RESULT_ID - 99, TOP_RESULT_ID + 101))
+            assert GeekBenchJSONParser.load_watermark(watermark_path=WATERMARK_PATH, query=QUERY) == TOP_RESULT_ID + 100
+
+
+@pytest.mark.parametrize("use_storage", [False, True])
+def test_truncated_crawl_keeps_watermark(tmp_path, monkeypatch, use_storage):
+    monkeypatch.chdir(tmp_path)
+    storage = SQLiteGeekBenchStorage(db_path=str(tmp_path / "results.sqlite3")) if use_storage else None
+
+    try:
+        asyncio.run(crawl_with_truncated_run(storage=storage))
+    finally:
+        if storage is not None:
+            storage.close()
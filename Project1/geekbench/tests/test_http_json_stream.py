@@ -0,0 +1,99 @@
+import io
+import json
+
+import pytest
+
+from http_client.http_json_stream import _JSONStreamScanner, iter_json_events, GeekBenchJSONWriter
+
+
+DATA = {
+    "samsung \"s5e9945\"": {
+        "1": {
+            "https://browser.geekbench.com/v6/cpu/30": {"system": {"device_name": "갤럭시 S24 \\ é", "cpu_model": "{\"nested\": [1, 2]}"}, "scores": [1, -2.5, 3e10, None, True]},
+            "https://browser.geekbench.com/v6/cpu/29": {},
+        },
+        "2": {"https://browser.geekbench.com/v6/cpu/3": {"emoji": "\U0001F600", "empty": [], "text": "line\nbreak\t}"}},
+    },
+    "empty": {},
+    "apple": {"3": {"https://browser.geekbench.com/v6/cpu/1": {"single": 1}}},
+}
+
+
+def rebuild(events) -> dict:
+    # 이벤트를 다시 {query: {page: {url: details}}}로 구성
+    data = dict()
+    for event in events:
+        if event[0] == "query":
+            data[event[1]] = dict()
+        elif event[0] == "page":
+            data[event[1]][event[2]] = dict()
+        else:
+            _, query, page, result_url, details = event
+            data[query][page][result_url] = details
+    return data
+
+
+def dump(tmp_path, data: dict, indent: int = 4) -> str:
+    file_path = str(tmp_path / "data.json")
+    with open(file_path, 'w', encoding='utf-8') as json_file:
+        json.dump(data, json_file, ensure_ascii=False, indent=indent)
+    return file_path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1 << 16])
+@pytest.mark.parametrize("indent", [4, None])
+def test_events_rebuild_the_file(tmp_path, chunk_size, indent):
+    file_path = dump(tmp_path, DATA, indent=indent)
+    events = list(iter_json_events(file_path=file_path, chunk_size=chunk_size))
+
+    assert rebuild(events) == DATA
+    assert [event[1] for event in events if event[0] == "query"] == list(DATA)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3])
+def test_empty_and_missing_files(tmp_path, chunk_size):
+    assert list(iter_json_events(file_path=dump(tmp_path, {}), chunk_size=chunk_size)) == []
+    assert list(iter_json_events(file_path=str(tmp_path / "missing.json"), chunk_size=chunk_size)) == []
+
+
+def test_scanner_reads_values_split_across_chunks():
+    scanner = _JSONStreamScanner(json_file=io.StringIO('{"a": 12345, "b": "x\\"y", "c": [1, {"d": null}]}'), chunk_size=1)
+    values = {key: scanner.decode_value() for key in scanner.iter_keys()}
+    assert values == {"a": 12345, "b": "x\"y", "c": [1, {"d": None}]}
+
+
+@pytest.mark.parametrize("content", ['{"a": {"1": {"u": 1}', '{"a" {}}', '{1: {}}'])
+def test_malformed_files_raise(tmp_path, content):
+    file_path = str(tmp_path / "broken.json")
+    with open(file_path, 'w', encoding='utf-8') as json_file:
+        json_file.write(content)
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_events(file_path=file_path, chunk_size=1))
+
+
+@pytest.mark.parametrize("data", [DATA, {}, {"empty": {}}, {"empty": {}, "last": {}}])
+def test_writer_matches_json_dump(tmp_path, data):
+    expected_path = dump(tmp_path, data)
+    written_path = str(tmp_path / "written.json")
+
+    with GeekBenchJSONWriter(file_path=written_path) as writer:
+        for query, query_data in data.items():
+            writer.write_query(query)
+            for page_number, page_data in query_data.items():
+                writer.write_page(page_number, page_data)
+
+    with open(expected_path, 'rb') as expected_file, open(written_path, 'rb') as written_file:
+        assert written_file.read() == expected_file.read()
+
+
+def test_writer_keeps_existing_file_on_error(tmp_path):
+    file_path = dump(tmp_path, DATA)
+
+    with pytest.raises(RuntimeError):
+        with GeekBenchJSONWriter(file_path=file_path) as writer:
+            writer.write_query("partial")
+            raise RuntimeError("interrupted")
+
+    assert rebuild(iter_json_events(file_path=file_path)) == DATA
+    assert not (tmp_path / "data.json.writing").exists()
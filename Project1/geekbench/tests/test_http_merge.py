@@ -0,0 +1,164 @@
+import json
+import random
+
+import pytest
+
+from http_client.http_json_parser import GeekBenchJSONParser
+from http_client.http_merge import GeekBenchMergeEngine
+from http_client.http_records import _upload_date_items
+
+
+CPU_URL = "https://browser.geekbench.com/v6/cpu/"
+
+
+def cpu_details(result_id: int, single: int = None) -> dict:
+    # 레코드로 변환되는 CPU 결과 (업로드 날짜 필드는 원본 문자열로 다시 만들어지는 값)
+    return {
+        "system": {"device_name": f"device {result_id % 3}", "cpu_model": "ARM ARMv8 2265 MHz (8 cores)"},
+        "upload_date": dict(_upload_date_items("Feb 17, 2025")),
+        "platform": "Android",
+        "core_scores": {"single": result_id if single is None else single, "multi": result_id * 3},
+    }
+
+
+def make_data(queries: dict, shuffle: bool = False, seed: int = 0) -> dict:
+    # {query: [고유 번호]} -> {query: {page: {url: details}}} (25개씩 페이지, 페이지 번호는 쿼리 사이에서 이어짐)
+    rng = random.Random(seed)
+    data = dict()
+    page_number = 0
+    item_count = 0
+    for query, result_ids in queries.items():
+        result_ids = list(result_ids)
+        if shuffle:
+            rng.shuffle(result_ids)
+        data[query] = dict()
+        for result_id in result_ids:
+            if item_count % 25 == 0:
+                page_number += 1
+            item_count += 1
+            data[query].setdefault(page_number, dict())[f"{CPU_URL}{result_id}"] = cpu_details(result_id)
+    return data
+
+
+def legacy_merge(new_data: dict, old_data: dict) -> dict:
+    # 병합 엔진 이전의 딕셔너리 병합 (같은 고유 번호는 기존 데이터 유지)
+    json_parser = GeekBenchJSONParser()
+    merge_data = dict()
+    json_parser._add_source_data_to_merge(merge_data=merge_data, source_data=new_data)
+    json_parser._add_source_data_to_merge(merge_data=merge_data, source_data=old_data)
+    return json_parser._paginate_data(data=json_parser._sort_urls_by_unique_id(merge_data=merge_data))
+
+
+def save(tmp_path, name: str, data: dict) -> str:
+    file_path = str(tmp_path / name)
+    GeekBenchJSONParser.save_data_to_json(file_path=file_path, data=data)
+    return file_path
+
+
+def read_bytes(file_path: str) -> bytes:
+    with open(file_path, 'rb') as file:
+        return file.read()
+
+
+def assert_merge_matches_legacy(tmp_path, new_data: dict, old_data: dict, merge_engine: GeekBenchMergeEngine) -> dict:
+    # 파일 입력 -> 파일 출력, 딕셔너리 입력 -> 딕셔너리 출력 모두 기존 병합 결과와 바이트 단위로 같아야 함
+    expected_path = save(tmp_path, "expected.json", legacy_merge(new_data, old_data))
+    new_path = save(tmp_path, "new.json", new_data)
+    old_path = save(tmp_path, "old.json", old_data)
+
+    json_parser = GeekBenchJSONParser()
+    merged_path = str(tmp_path / "merged.json")
+    summary = json_parser.merge_geekbench_data_to_file(save_file_path=merged_path, new_data_path=new_path, old_data_path=old_path, merge_engine=merge_engine)
+    assert read_bytes(merged_path) == read_bytes(expected_path)
+
+    merged_data = json_parser.merge_geekbench_data(new_data_path=new_data, old_data_path=old_data, merge_engine=merge_engine)
+    assert read_bytes(save(tmp_path, "merged_data.json", merged_data)) == read_bytes(expected_path)
+
+    return summary
+
+
+def count_spills(monkeypatch, merge_engine: GeekBenchMergeEngine) -> list:
+    spills = list()
+    spill = merge_engine._spill
+
+    def counting_spill(**kwargs):
+        spills.append(sum(len(buffer) for buffer in kwargs["buffers"].values()))
+        spill(**kwargs)
+
+    monkeypatch.setattr(merge_engine, "_spill", counting_spill)
+    return spills
+
+
+def test_presorted_merge_matches_legacy_output(tmp_path, monkeypatch):
+    new_data = make_data({"samsung": range(200, 130, -1), "apple": range(90, 60, -2)})
+    old_data = make_data({"samsung": range(150, 100, -1), "google": range(40, 0, -1)})
+
+    merge_engine = GeekBenchMergeEngine()
+    monkeypatch.setattr(merge_engine, "_iter_external", lambda *args, **kwargs: pytest.fail("presorted input must not use the external sort"))
+
+    summary = assert_merge_matches_legacy(tmp_path, new_data, old_data, merge_engine)
+    assert summary == {"queries": 3, "results": 100 + 15 + 40, "pages": 8, "watermark": 200}
+
+
+def test_unsorted_merge_spills_and_matches_legacy_output(tmp_path, monkeypatch):
+    new_data = make_data({"samsung": range(120, 60, -1), "apple": range(30, 0, -1)}, shuffle=True, seed=1)
+    old_data = make_data({"samsung": range(90, 40, -1)}, shuffle=True, seed=2)
+
+    merge_engine = GeekBenchMergeEngine(max_records_in_memory=1, spill_dir=str(tmp_path))
+    spills = count_spills(monkeypatch, merge_engine)
+
+    assert_merge_matches_legacy(tmp_path, new_data, old_data, merge_engine)
+    assert spills and max(spills) == 1
+
+    # 구간 파일은 병합 후 삭제
+    assert not list(tmp_path.glob("geekbench_merge_*"))
+
+
+def test_duplicate_result_ids_keep_old_result(tmp_path):
+    new_data = {"samsung": {1: {f"{CPU_URL}{result_id}": cpu_details(result_id, single=1) for result_id in (30, 20, 10)}}}
+    old_data = {"samsung": {1: {f"{CPU_URL}{result_id}": cpu_details(result_id, single=2) for result_id in (25, 20, 10)}}}
+
+    for merge_engine in (GeekBenchMergeEngine(), GeekBenchMergeEngine(max_records_in_memory=1, spill_dir=str(tmp_path))):
+        merged_data = GeekBenchJSONParser().merge_geekbench_data(new_data_path=new_data, old_data_path=old_data, merge_engine=merge_engine)
+        singles = {result_url: details["core_scores"]["single"] for result_url, details in merged_data["samsung"][1].items()}
+        assert singles == {f"{CPU_URL}30": 1, f"{CPU_URL}25": 2, f"{CPU_URL}20": 2, f"{CPU_URL}10": 2}
+
+    assert_merge_matches_legacy(tmp_path, new_data, old_data, GeekBenchMergeEngine())
+
+
+def test_duplicate_result_ids_within_one_source_keep_last_result(tmp_path):
+    # 정렬되지 않은 입력 안의 중복도 기존 병합과 같이 나중 결과 유지
+    new_data = {"samsung": {1: {f"{CPU_URL}5": cpu_details(5, single=1), f"{CPU_URL}9": cpu_details(9)}, 2: {f"{CPU_URL}5": cpu_details(5, single=2)}}}
+
+    merge_engine = GeekBenchMergeEngine(max_records_in_memory=1, spill_dir=str(tmp_path))
+    merged_data = GeekBenchJSONParser().merge_geekbench_data(new_data_path=new_data, old_data_path={}, merge_engine=merge_engine)
+    assert merged_data["samsung"][1][f"{CPU_URL}5"]["core_scores"]["single"] == 2
+
+
+@pytest.mark.parametrize("new_queries, old_queries", [
+    ({"empty": []}, {"empty": []}),
+    ({"empty": [], "samsung": range(30, 0, -1)}, {"samsung": range(40, 20, -1), "apple": []}),
+    ({"samsung": range(10, 0, -1)}, {"samsung": []}),
+    ({}, {}),
+])
+@pytest.mark.parametrize("max_records_in_memory", [100_000, 1])
+def test_empty_queries_match_legacy_output(tmp_path, new_queries, old_queries, max_records_in_memory):
+    new_data = make_data(new_queries)
+    old_data = make_data(old_queries)
+    merge_engine = GeekBenchMergeEngine(max_records_in_memory=max_records_in_memory, spill_dir=str(tmp_path))
+
+    summary = assert_merge_matches_legacy(tmp_path, new_data, old_data, merge_engine)
+    assert summary["queries"] == len(dict.fromkeys(list(new_queries) + list(old_queries)))
+
+
+def test_merge_to_same_path_as_old_file(tmp_path):
+    # 출력은 임시 파일에 기록한 후 교체하므로 기존 파일에 바로 병합할 수 있음
+    new_data = make_data({"samsung": range(60, 30, -1)})
+    old_data = make_data({"samsung": range(40, 0, -1)})
+    expected_path = save(tmp_path, "expected.json", legacy_merge(new_data, old_data))
+    old_path = save(tmp_path, "old.json", old_data)
+
+    GeekBenchJSONParser().merge_geekbench_data_to_file(save_file_path=old_path, new_data_path=new_data, old_data_path=old_path)
+    assert read_bytes(old_path) == read_bytes(expected_path)
+    with open(old_path, 'r', encoding='utf-8') as json_file:
+        assert len(json.load(json_file)["samsung"]) == 3
@@ -0,0 +1,33 @@
+import pytest
+
+from http_client.http_json_parser import GeekBenchJSONParser
+from http_client.http_storage import SQLiteGeekBenchStorage
+
+
+CPU_URL = "https://browser.geekbench.com/v6/cpu/"
+
+
+def make_data(query: str, result_count: int) -> dict:
+    # 고유 번호 내림차순, 25개씩 페이지
+    data = {query: dict()}
+    for index, result_id in enumerate(range(result_count, 0, -1)):
+        details = {"system": {"device_name": f"갤럭시 {result_id % 3}"}, "core_scores": {"single": result_id}}
+        data[query].setdefault(index // 25 + 1, dict())[f"{CPU_URL}{result_id}"] = details
+    return data
+
+
+@pytest.mark.parametrize("result_count", [0, 25, 60])
+def test_export_matches_saved_json(tmp_path, result_count):
+    # 가져온 파일을 다시 내보내면 기존 파일과 바이트 단위로 같아야 함
+    query = "samsung \"s5e9945\""
+    source_path = str(tmp_path / "source.json")
+    GeekBenchJSONParser.save_data_to_json(file_path=source_path, data=make_data(query, result_count))
+
+    exported_path = str(tmp_path / "exported" / "data.json")
+    with SQLiteGeekBenchStorage(db_path=str(tmp_path / "results.sqlite3"), batch_size=7) as storage:
+        storage.import_from_json(search_type="cpu", file_path=source_path)
+        assert storage.count_results(query=query) == result_count
+        storage.export_to_json(query=query, file_path=exported_path)
+
+    with open(source_path, 'rb') as source_file, open(exported_path, 'rb') as exported_file:
+        assert exported_file.read() == source_file.read()